@@ -0,0 +1,60 @@
+'''Benchmark of report inventory
+
+Times the visuals inventory of synthetic reports through
+``PBIReport(...).resume_report_visuals()`` and through ``PBIInspector``,
+without cache and with a warm inventory cache.
+
+Usage:
+    python benchmarks/bench_inventory.py
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pypbireport import PBIReport, PBIInspector
+from synthetic import build_synthetic_pbix
+
+# (pages, visuals per page)
+SIZES = [(10, 100), (50, 100)]
+REPEAT = 3
+
+
+def best_time(function):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - start)
+
+    return min(timings)
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        for n_pages, n_visuals in SIZES:
+            pbix_path = os.path.join(folder, f'inv_{n_pages}x{n_visuals}.pbix')
+            build_synthetic_pbix(pbix_path, n_pages, n_visuals)
+            cache_dir = os.path.join(folder, 'cache')
+            PBIInspector(pbix_path, cache_dir).resume_report_visuals() # warm
+
+            timings = {
+                'PBIReport': best_time(
+                    lambda: PBIReport(pbix_path).resume_report_visuals()),
+                'PBIInspector': best_time(
+                    lambda: PBIInspector(pbix_path).resume_report_visuals()),
+                'PBIInspector cached': best_time(
+                    lambda: PBIInspector(pbix_path, cache_dir)
+                        .resume_report_visuals()),
+            }
+            reference = timings['PBIReport']
+            for name, timing in timings.items():
+                print(f'{n_pages * n_visuals:>6} visuals {name:>19}: '
+                      f'{timing:.3f}s ({reference / timing:.1f}x)')
+
+
+if __name__ == '__main__':
+    main()
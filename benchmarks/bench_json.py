@@ -0,0 +1,110 @@
+'''Benchmark of JSON backends
+
+Times decode and encode of report layouts with each installed backend of
+``pypbireport.functions.serializer``: the layout itself and the JSON strings
+of every visual, as done by load and save of a report. Encoded layouts are
+checked to decode to the same content with the standard ``json``.
+
+Usage:
+    python benchmarks/bench_json.py                  # synthetic reports
+    python benchmarks/bench_json.py report.pbix ...  # real reports
+'''
+
+import codecs
+import json
+import os
+import sys
+import tempfile
+import time
+import zipfile
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pypbireport.functions import serializer
+from synthetic import build_synthetic_pbix
+
+# (pages, visuals per page), when no report is given
+SIZES = [(10, 100), (50, 100)]
+PARTS = ('config', 'query', 'dataTransforms', 'filters')
+REPEAT = 3
+
+
+def read_layout(pbix_path:str) -> str:
+    with zipfile.ZipFile(pbix_path) as pbix:
+        return codecs.decode(pbix.read('Report/Layout'), 'utf-16-le')
+
+
+def decode(layout_str:str) -> dict:
+    '''Decode a layout and the JSON strings of its visuals'''
+    layout_dict = serializer.loads(layout_str)
+    for page in layout_dict.get('sections', []):
+        for visual_dict in page.get('visualContainers', []):
+            for name in PARTS:
+                if isinstance(visual_dict.get(name), str):
+                    visual_dict[name] = serializer.loads(visual_dict[name])
+
+    return layout_dict
+
+
+def encode(layout_dict:dict) -> str:
+    '''Encode a decoded layout, its visuals first'''
+    sections = []
+    for page in layout_dict.get('sections', []):
+        visuals = []
+        for visual_dict in page.get('visualContainers', []):
+            visual_dict = dict(visual_dict)
+            for name in PARTS:
+                if name in visual_dict:
+                    visual_dict[name] = serializer.dumps(visual_dict[name])
+            visuals.append(visual_dict)
+        sections.append({**page, 'visualContainers': visuals})
+
+    return serializer.dumps({**layout_dict, 'sections': sections})
+
+
+def best_time(function, argument):
+    timings = []
+    for _ in range(REPEAT):
+        start = time.perf_counter()
+        result = function(argument)
+        timings.append(time.perf_counter() - start)
+
+    return min(timings), result
+
+
+def run(label:str, layout_str:str) -> None:
+    reference = None
+    for backend in serializer.available_json_backends():
+        serializer.set_json_backend(backend)
+        decode_time, layout_dict = best_time(decode, layout_str)
+        encode_time, encoded = best_time(encode, layout_dict)
+        encoded.encode('utf-16-le') # as written in the file
+
+        content = json.loads(encoded)
+        if reference is None:
+            reference = content
+        same = 'same content' if content == reference else 'DIFFERENT'
+        print(f'{label}: {backend:>6} decode {decode_time:.3f}s, '
+              f'encode {encode_time:.3f}s, {same}')
+
+
+def main():
+    default_backend = serializer.get_json_backend()
+    try:
+        if len(sys.argv) > 1:
+            for pbix_path in sys.argv[1:]:
+                run(os.path.basename(pbix_path), read_layout(pbix_path))
+            return
+
+        with tempfile.TemporaryDirectory() as folder:
+            for n_pages, n_visuals in SIZES:
+                pbix_path = os.path.join(folder, 'json.pbix')
+                build_synthetic_pbix(pbix_path, n_pages, n_visuals)
+                run(f'{n_pages * n_visuals:>6} visuals',
+                    read_layout(pbix_path))
+    finally:
+        serializer.set_json_backend(default_backend)
+
+
+if __name__ == '__main__':
+    main()
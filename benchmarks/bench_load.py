@@ -0,0 +1,48 @@
+'''Benchmark of report loading
+
+Times ``PBIReport(...)`` for synthetic reports with thousands of visuals,
+without cache and reopening with a warm layout cache (``cache_dir``).
+
+Usage:
+    python benchmarks/bench_load.py
+'''
+
+import os
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pypbireport import PBIReport
+from synthetic import build_synthetic_pbix
+
+# (pages, visuals per page)
+SIZES = [(10, 100), (20, 100), (50, 100)]
+REPEAT = 3
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        for n_pages, n_visuals in SIZES:
+            pbix_path = os.path.join(folder, f'load_{n_pages}x{n_visuals}.pbix')
+            build_synthetic_pbix(pbix_path, n_pages, n_visuals)
+
+            cache_dir = os.path.join(folder, 'cache')
+            PBIReport(pbix_path, cache_dir=cache_dir).pbix.close() # warm
+
+            for mode, kwargs in (('no cache', {}), 
+                ('cached', {'cache_dir': cache_dir})):
+                timings = []
+                for _ in range(REPEAT):
+                    start = time.perf_counter()
+                    report = PBIReport(pbix_path, **kwargs)
+                    timings.append(time.perf_counter() - start)
+                    report.pbix.close()
+
+                print(f'{n_pages * n_visuals:>6} visuals {mode:>8}: '
+                      f'best {min(timings):.3f}s of {REPEAT}')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,60 @@
+'''Benchmark of report memory
+
+Reports the peak and the retained memory of ``PBIReport(...)``, in default 
+and lean mode, for synthetic reports with thousands of visuals. Memory is 
+measured with ``tracemalloc``, so only Python allocations are counted.
+
+Usage:
+    python benchmarks/bench_memory.py
+'''
+
+import gc
+import os
+import sys
+import tempfile
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from pypbireport import PBIReport
+from synthetic import build_synthetic_pbix
+
+# (pages, visuals per page)
+SIZES = [(10, 100), (50, 100)]
+MODES = {'default': False, 'lean': True}
+
+
+def measure(pbix_path, lean):
+    '''Return retained and peak MiB of loading, and peak MiB of saving'''
+    gc.collect()
+    tracemalloc.start()
+    report = PBIReport(pbix_path, lean=lean)
+    retained, load_peak = tracemalloc.get_traced_memory()
+
+    tracemalloc.reset_peak()
+    report.visuals[0].horizontal = 10 # one edit
+    report.save_report(suffix='bench')
+    save_peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    report.pbix.close()
+
+    mib = 1024 * 1024
+    return retained / mib, load_peak / mib, save_peak / mib
+
+
+def main():
+    with tempfile.TemporaryDirectory() as folder:
+        for n_pages, n_visuals in SIZES:
+            pbix_path = os.path.join(folder, f'mem_{n_pages}x{n_visuals}.pbix')
+            build_synthetic_pbix(pbix_path, n_pages, n_visuals)
+
+            for mode, lean in MODES.items():
+                retained, load_peak, save_peak = measure(pbix_path, lean)
+                print(f'{n_pages * n_visuals:>6} visuals {mode:>7}: '
+                      f'retained {retained:7.1f} MiB, '
+                      f'load peak {load_peak:7.1f} MiB, '
+                      f'save peak {save_peak:7.1f} MiB')
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,171 @@
+'''Benchmark suite of report load, edit and save
+
+Times the main operations of ``PBIReport`` on synthetic reports of several
+sizes (pages x visuals x bookmarks) and measures their peak memory with
+``tracemalloc``. Each result is a JSON line, so results of releases can be
+kept in a file and compared.
+
+Usage:
+    python benchmarks/run_benchmarks.py
+    python benchmarks/run_benchmarks.py --output results.jsonl --repeat 5
+'''
+
+import argparse
+import gc
+import json
+import os
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pypbireport
+from pypbireport import PBIReport, Bookmark, create_new_visual
+from synthetic import build_synthetic_pbix
+
+# (pages, visuals per page, bookmarks)
+SIZES = [(5, 20, 10), (20, 100, 50), (50, 100, 200)]
+# Visuals and bookmarks inserted by the insert benchmarks
+N_INSERTS = 20
+
+
+def _insert_visuals(report):
+    page = report.pages_list[0]
+    for _ in range(N_INSERTS):
+        visual = create_new_visual('card', page.get('displayName'),
+            page.get('name'))
+        report.insert_visual_in_page(page.get('displayName'), visual)
+
+
+def _insert_bookmarks(report):
+    visuals = report.visuals.get_by_page(report.pages_list[0].get(
+        'displayName'))
+    for i in range(N_INSERTS):
+        bookmark = Bookmark(f'Bench {i}', show_visuals=visuals[:2],
+            hide_visuals=visuals[2:4])
+        report.insert_bookmark(bookmark)
+
+
+def _insert_toggle_bookmarks(report):
+    visuals = report.visuals.get_by_page(report.pages_list[0].get(
+        'displayName'))
+    report.insert_toggle_bookmarks(visuals, 'Bench toggle')
+
+
+def _duplicate_page(report):
+    report.duplicate_page(report.pages_list[0].get('displayName'),
+        [f'Bench copy {i}' for i in range(N_INSERTS)])
+
+
+def _assign_attributes(report):
+    for i, visual in enumerate(report.visuals):
+        visual.horizontal = float(i % 100)
+        visual.width = 200.0
+
+
+def _save_report(report):
+    report.save_report(file_name=os.path.join(
+        os.path.dirname(report.pbix_path), 'bench_out.pbix'))
+
+
+# name: (operation, needs a loaded report)
+BENCHMARKS = {
+    'init': (PBIReport, False),
+    'resume_report_visuals': (lambda report: report.resume_report_visuals(),
+        True),
+    'field_usage': (lambda report: report.field_usage(), True),
+    'rename_field': (lambda report: report.rename_field(
+        'Métricas.Categorica', 'Métricas.Renamed'), True),
+    'attribute_assignment': (_assign_attributes, True),
+    'insert_visual_in_page': (_insert_visuals, True),
+    'insert_bookmark': (_insert_bookmarks, True),
+    'insert_toggle_bookmarks': (_insert_toggle_bookmarks, True),
+    'duplicate_page': (_duplicate_page, True),
+    'dangling_bookmark_references': (
+        lambda report: report.dangling_bookmark_references(), True),
+    'save_report': (_save_report, True),
+}
+
+
+def measure(operation, pbix_path:str, needs_report:bool, repeat:int) -> dict:
+    '''Return the best wall time and the peak memory of an operation
+
+    The report is loaded before each run, out of measurement, when the
+    operation needs it. Memory is measured in a separate run, since
+    ``tracemalloc`` slows down the code.
+    '''
+    def setup():
+        return PBIReport(pbix_path) if needs_report else pbix_path
+
+    def teardown(argument, result):
+        for obj in (argument, result):
+            if isinstance(obj, PBIReport):
+                obj.pbix.close()
+
+    timings = []
+    for _ in range(repeat):
+        argument = setup()
+        gc.collect()
+        start = time.perf_counter()
+        result = operation(argument)
+        timings.append(time.perf_counter() - start)
+        teardown(argument, result)
+
+    argument = setup()
+    gc.collect()
+    tracemalloc.start()
+    result = operation(argument)
+    peak = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    teardown(argument, result)
+
+    return {
+        'wall_time_s': round(min(timings), 6),
+        'peak_memory_mib': round(peak / (1024 * 1024), 3)
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument('--output', help='JSON lines file to append results')
+    parser.add_argument('--repeat', type=int, default=3,
+        help='runs of each benchmark, the best time is kept')
+    args = parser.parse_args()
+
+    context = {
+        'version': pypbireport.__version__,
+        'python': platform.python_version(),
+        'timestamp': time.strftime('%Y-%m-%dT%H:%M:%S')
+    }
+
+    output = open(args.output, 'a') if args.output else sys.stdout
+    try:
+        with tempfile.TemporaryDirectory() as folder:
+            for n_pages, n_visuals, n_bookmarks in SIZES:
+                pbix_path = os.path.join(folder,
+                    f'bench_{n_pages}x{n_visuals}x{n_bookmarks}.pbix')
+                build_synthetic_pbix(pbix_path, n_pages, n_visuals,
+                    n_bookmarks)
+
+                for name, (operation, needs_report) in BENCHMARKS.items():
+                    result = {
+                        'benchmark': name,
+                        'pages': n_pages,
+                        'visuals': n_pages * n_visuals,
+                        'bookmarks': n_bookmarks,
+                        **measure(operation, pbix_path, needs_report,
+                            args.repeat),
+                        **context
+                    }
+                    output.write(json.dumps(result) + '\n')
+                    output.flush()
+    finally:
+        if output is not sys.stdout:
+            output.close()
+
+
+if __name__ == '__main__':
+    main()
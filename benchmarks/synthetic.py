@@ -0,0 +1,177 @@
+'''Synthetic Power BI files for benchmarks
+
+Build ``.pbix`` files with the visual templates of ``constants/charts.py`` and
+bookmarks from ``BOOKMARK_DICT``, so benchmarks can run on reports of any size
+without real reports.
+'''
+
+import copy
+import json
+import os
+import zipfile
+
+from pypbireport.constants import bookmarks, charts
+from pypbireport.constants.structures import BOOKMARK_DICT, CONTENT_TYPE_XML
+from pypbireport.functions.functions import hex_code
+
+# Order of templates used to fill pages
+TEMPLATES = ['card', 'column', 'slicer_list', 'slicer_drop', 'bookmark_slicer']
+# Number of visuals targeted by each bookmark
+BOOKMARK_TARGETS = 4
+
+
+def synthetic_visual(template:str, index:int) -> dict:
+    '''Return a visual dict from a template with a new id and position
+
+    Args:
+        template (str): Key of ``charts.VISUAL_TEMPLATE_DICT``.
+        index (int): Position of visual in page, used to place it.
+
+    Returns:
+        dict: A visual container as found in report layout JSON.
+    '''
+    visual_dict = copy.deepcopy(charts.VISUAL_TEMPLATE_DICT[template])
+    config = json.loads(visual_dict['config'])
+    config['name'] = hex_code()
+    position = config['layouts'][0]['position']
+    position.update({'x': (index % 10) * 120.0, 'y': (index // 10) * 80.0})
+    visual_dict.update(
+        {
+            'config': json.dumps(config, ensure_ascii=False),
+            'x': position['x'],
+            'y': position['y'],
+            'tabOrder': index
+        }
+    )
+
+    return visual_dict
+
+
+def synthetic_bookmark(section:dict, index:int) -> dict:
+    '''Return a bookmark dict that shows and hides visuals of a page
+
+    The bookmark targets a few visuals of the page, starting at ``index``,
+    alternating show and hide.
+
+    Args:
+        section (dict): The page dict of the layout.
+        index (int): Number of the bookmark, used to name it.
+
+    Returns:
+        dict: A bookmark as found in report config.
+    '''
+    visual_ids = [
+        json.loads(visual_dict['config'])['name']
+        for visual_dict in section['visualContainers']
+    ]
+    targets = [
+        visual_ids[(index + i) % len(visual_ids)]
+        for i in range(min(BOOKMARK_TARGETS, len(visual_ids)))
+    ]
+
+    bookmark_dict = copy.deepcopy(BOOKMARK_DICT)
+    bookmark_dict.update(
+        {
+            'displayName': f'Bookmark {index}',
+            'name': hex_code('Bookmark')
+        }
+    )
+    bookmark_dict['explorationState'].update(
+        {
+            'activeSection': section['name'],
+            'sections': {
+                section['name']: {
+                    'visualContainers': {
+                        visual_id: {
+                            'singleVisual': {
+                                'display': {
+                                    'mode': (bookmarks.SHOW if i % 2 == 0
+                                        else bookmarks.HIDE)
+                                }
+                            }
+                        }
+                        for i, visual_id in enumerate(targets)
+                    }
+                }
+            }
+        }
+    )
+    bookmark_dict['options']['targetVisualNames'] = targets
+
+    return bookmark_dict
+
+
+def synthetic_layout(n_pages:int, n_visuals:int, n_bookmarks:int=0) -> dict:
+    '''Return a report layout dict with ``n_pages`` x ``n_visuals`` visuals
+
+    Args:
+        n_pages (int): Number of pages.
+        n_visuals (int): Number of visuals in each page.
+        n_bookmarks (int, optional): Number of bookmarks, spread over the 
+            pages. Defaults to 0.
+
+    Returns:
+        dict: A report layout dict.
+    '''
+    sections = []
+    for page in range(n_pages):
+        sections.append(
+            {
+                'name': hex_code('ReportSection'),
+                'displayName': f'Page {page}',
+                'ordinal': page,
+                'visualContainers': [
+                    synthetic_visual(TEMPLATES[i % len(TEMPLATES)], i)
+                    for i in range(n_visuals)
+                ],
+                'config': '{}',
+                'filters': '[]',
+                'width': 1280,
+                'height': 720
+            }
+        )
+
+    config = {'version': '5.43'}
+    if n_bookmarks and n_visuals:
+        config['bookmarks'] = [
+            synthetic_bookmark(sections[i % n_pages], i)
+            for i in range(n_bookmarks)
+        ]
+
+    return {
+        'id': 0,
+        'sections': sections,
+        'config': json.dumps(config),
+        'layoutOptimization': 0
+    }
+
+
+def write_pbix(pbix_path:str, layout_dict:dict,
+    data_model_size:int=1024 * 1024) -> str:
+    '''Write a ``.pbix`` file with a layout and a random data model
+
+    Args:
+        pbix_path (str): Path of the new file.
+        layout_dict (dict): Report layout dict.
+        data_model_size (int, optional): Bytes of the fake ``DataModel``.
+
+    Returns:
+        str: The path of the file.
+    '''
+    with zipfile.ZipFile(pbix_path, 'w', zipfile.ZIP_DEFLATED) as pbix:
+        pbix.writestr('Version', '1.28'.encode('utf-16-le'))
+        pbix.writestr('DataModel', os.urandom(data_model_size))
+        pbix.writestr('Report/Layout',
+            json.dumps(layout_dict, ensure_ascii=False).encode('utf-16-le'))
+        pbix.writestr('SecurityBindings', b'')
+        pbix.writestr('[Content_Types].xml', CONTENT_TYPE_XML.encode())
+
+    return pbix_path
+
+
+def build_synthetic_pbix(pbix_path:str, n_pages:int, n_visuals:int,
+    n_bookmarks:int=0) -> str:
+    '''Write a synthetic ``.pbix`` with ``n_pages`` x ``n_visuals`` visuals
+    and ``n_bookmarks`` bookmarks'''
+    return write_pbix(pbix_path,
+        synthetic_layout(n_pages, n_visuals, n_bookmarks))
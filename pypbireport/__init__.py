@@ -25,9 +25,23 @@ from .pbi.pbivisual import (
     copy_visual
 )
 
+from .pbi.pbiinspector import (
+    PBIInspector
+)
+
+from .pbi.pbiindex import (
+    BookmarkIndex,
+    FieldUsageIndex
+)
+
+from .pbi.pbibatch import (
+    run_batch
+)
+
 from .pbi.pbibookmark import (
     Bookmark,
-    BookmarkGroup
+    BookmarkGroup,
+    toggle_bookmarks
 )
 
 from .pbi.pbimodel import (
@@ -45,4 +59,5 @@ from .constants import (
 )
 
 from .functions.functions import export_dict_as_file
+from .functions.serializer import set_json_backend, get_json_backend
 from .functions.pprlist import PPRList
\ No newline at end of file
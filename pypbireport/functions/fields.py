@@ -0,0 +1,288 @@
+'''Module for functions on field references of visuals, pages and reports
+
+A field of the model is referenced in two ways inside the layout JSON:
+
+- By expressions like ``{"Column": {"Expression": {"SourceRef": {"Source":
+  "t"}}, "Property": "Field"}}``, where the source is an alias declared in
+  the `From` list of the query, or an `Entity` (the table) itself.
+- By names like `queryRef` or `Name` of a select, in the form `Table.Field`,
+  or wrapped by an aggregation, as `Sum(Table.Field)`.
+
+The functions here find and rename both of them in decoded JSON.
+'''
+
+from typing import Any, Iterator
+
+# Keys of expressions that reference a field of the model by `Property`
+FIELD_EXPRESSIONS = ('Column', 'Measure', 'PropertyVariationSource')
+
+# Keys of qualified names (`Table.Field`), maybe inside an aggregation
+NAME_KEYS = ('queryRef', 'Name', 'queryName', 'metadata')
+
+# Keys of the bare field name
+FIELD_NAME_KEYS = ('NativeReferenceName', 'Restatement')
+
+# Keys of dicts with lists of qualified names, by role
+NAMES_BY_ROLE_KEYS = ('activeProjections',)
+
+# Keys of dicts keyed by qualified names
+KEYED_BY_NAME_KEYS = ('columnProperties',)
+
+
+def field_name_of(field:Any) -> str:
+    '''Return the qualified name (`Table.Field`) of a field
+
+    Args:
+        field (Any): A `Table.Field` string or a ``PBIModel`` measure or
+            column.
+
+    Returns:
+        str: The qualified name of the field.
+    '''
+    if isinstance(field, str):
+        return field
+
+    return (
+        getattr(field, 'visual_field_name', None)
+        or getattr(field, 'field_name', None)
+        or f'{field.table_name}.{field._name}'
+    )
+
+
+def field_parts(field:Any) -> tuple[str, str]:
+    '''Return the table and the field name of a field
+
+    Args:
+        field (Any): A `Table.Field` string, a (table, field) tuple or a
+            ``PBIModel`` measure or column. Strings are split at the first 
+            dot.
+
+    Raises:
+        ValueError: If a string has no dot.
+
+    Returns:
+        tuple[str, str]: Table name and field name.
+    '''
+    if isinstance(field, tuple):
+        return field
+    if isinstance(field, str):
+        table, _, name = field.partition('.')
+        if not name:
+            raise ValueError(f"'{field}' is not in the form Table.Field")
+        return table, name
+
+    return field.table_name, field._name
+
+
+def source_aliases(sources:Any, aliases:dict | None = None) -> dict:
+    '''Return the tables of a `From` list by alias
+
+    Args:
+        sources (Any): A `From` list of a query.
+        aliases (dict | None, optional): Aliases of outer queries. Defaults
+            to None.
+
+    Returns:
+        dict: Table names by alias, outer ones included.
+    '''
+    aliases = dict(aliases or {})
+    for source in sources if isinstance(sources, list) else []:
+        if isinstance(source, dict) and 'Entity' in source:
+            aliases[source.get('Name')] = source['Entity']
+
+    return aliases
+
+
+def source_table(expression:Any, aliases:dict) -> str | None:
+    '''Return the table of a field expression, None if it is not a table'''
+    if not isinstance(expression, dict):
+        return None
+    source_ref = expression.get('SourceRef')
+    if not isinstance(source_ref, dict):
+        return None
+    if 'Entity' in source_ref:
+        return source_ref['Entity']
+
+    return aliases.get(source_ref.get('Source'))
+
+
+def field_references(node:Any, aliases:dict | None = None
+    ) -> Iterator[tuple[str, dict]]:
+    '''Yield the field references of a decoded visual part
+
+    Args:
+        node (Any): A dict or list of a visual, like its config.
+        aliases (dict | None, optional): Table names by alias of outer
+            queries. Defaults to None.
+
+    Yields:
+        tuple[str, dict]: The qualified name (`Table.Field`) and the dict of
+            the reference, with its `Expression` and `Property`.
+    '''
+    if isinstance(node, list):
+        for item in node:
+            yield from field_references(item, aliases)
+        return
+    if not isinstance(node, dict):
+        return
+
+    if 'From' in node: # a query, its aliases hold for inner keys
+        aliases = source_aliases(node['From'], aliases)
+    for key, value in node.items():
+        if (key in FIELD_EXPRESSIONS and isinstance(value, dict)
+            and 'Property' in value):
+            table = source_table(value.get('Expression'), aliases or {})
+            if table is not None:
+                yield f"{table}.{value['Property']}", value
+        if isinstance(value, (dict, list)):
+            yield from field_references(value, aliases)
+
+
+def rename_qualified_name(name:Any, old_name:str, new_name:str) -> Any:
+    '''Rename a qualified field name, alone or inside an aggregation
+
+    Args:
+        name (Any): A name like `Table.Field` or `Sum(Table.Field)`. Other
+            values are returned as they are.
+        old_name (str): The old `Table.Field`.
+        new_name (str): The new `Table.Field`.
+
+    Returns:
+        Any: The renamed name, or ``name`` itself if it has no reference.
+    '''
+    if name == old_name:
+        return new_name
+    if isinstance(name, str) and f'({old_name})' in name:
+        return name.replace(f'({old_name})', f'({new_name})')
+
+    return name
+
+
+def rename_field_references(node:Any, old:tuple[str, str],
+    new:tuple[str, str]) -> int:
+    '''Rename a field in decoded JSON, in place, in a single traversal
+
+    Field expressions get the new `Property`. If the table changes, a source
+    by `Entity` gets the new table and a source by alias gets the alias of the
+    new table in the `From` list of its query, added if needed. Qualified
+    names (`Table.Field` or `Sum(Table.Field)`) and keys of 
+    `columnProperties` are renamed too. Bare names of `NativeReferenceName`,
+    `Restatement` and labels of selects equal to the old field name are
+    renamed only when the expression or the qualified name next to them is
+    of the old table, since other tables may have a field with that name.
+
+    Args:
+        node (Any): A decoded dict or list, like a visual config, filters or
+            the report config with bookmarks.
+        old (tuple[str, str]): Table and field name to rename.
+        new (tuple[str, str]): New table and field name.
+
+    Returns:
+        int: Number of references renamed.
+    '''
+    if old == new:
+        return 0
+    old_table, old_field = old
+    new_table, new_field = new
+    old_name, new_name = f'{old_table}.{old_field}', f'{new_table}.{new_field}'
+    count = 0
+
+    def rename_name(name:Any) -> Any:
+        return rename_qualified_name(name, old_name, new_name)
+
+    def new_table_alias(query:dict) -> str:
+        '''Return the alias of the new table in a query, adding it'''
+        sources = query['From']
+        for source in sources:
+            if source.get('Entity') == new_table and 'Name' in source:
+                return source['Name']
+        names = {source.get('Name') for source in sources}
+        prefix = (new_table[:1] or 't').lower()
+        alias, i = prefix, 1
+        while alias in names:
+            alias, i = f'{prefix}{i}', i + 1
+        sources.append({'Name': alias, 'Entity': new_table, 'Type': 0})
+        return alias
+
+    def rename_reference(reference:dict, aliases:dict,
+        query:dict | None) -> None:
+        nonlocal count
+        if reference.get('Property') != old_field:
+            return
+        expression = reference.get('Expression')
+        if source_table(expression, aliases) != old_table:
+            return
+        reference['Property'] = new_field
+        if new_table != old_table:
+            source_ref = expression['SourceRef'] # type: ignore
+            if 'Entity' in source_ref:
+                source_ref['Entity'] = new_table
+            elif query is not None:
+                source_ref['Source'] = new_table_alias(query)
+        count += 1
+
+    def is_old_field(node:dict, aliases:dict) -> bool:
+        '''Return if a dict with bare names is about the old field
+
+        Bare names don't have the table, so the field of their dict is read
+        from its expression or its qualified name, before they are renamed.
+        '''
+        for holder in (node, node.get('expr')):
+            if not isinstance(holder, dict):
+                continue
+            for key in FIELD_EXPRESSIONS:
+                reference = holder.get(key)
+                if (isinstance(reference, dict)
+                    and reference.get('Property') == old_field):
+                    return source_table(
+                        reference.get('Expression'), aliases) == old_table
+        for key in NAME_KEYS:
+            if key in node:
+                return rename_name(node[key]) is not node[key]
+
+        return False
+
+    def walk(node:Any, aliases:dict, query:dict | None) -> None:
+        nonlocal count
+        if isinstance(node, list):
+            for item in node:
+                walk(item, aliases, query)
+            return
+        if not isinstance(node, dict):
+            return
+
+        if isinstance(node.get('From'), list):
+            aliases, query = source_aliases(node['From'], aliases), node
+        bare_names = old_field in node.values() and is_old_field(node, aliases)
+        for key, value in list(node.items()):
+            if key in FIELD_EXPRESSIONS and isinstance(value, dict):
+                rename_reference(value, aliases, query)
+            elif key in NAME_KEYS:
+                name = rename_name(value)
+                if name is not value:
+                    node[key] = name
+                    count += 1
+            elif bare_names and value == old_field and (key in FIELD_NAME_KEYS
+                or key == 'displayName' and 'queryName' in node):
+                # default label of a select of data transforms
+                node[key] = new_field
+                count += 1
+            elif key in NAMES_BY_ROLE_KEYS and isinstance(value, dict):
+                for names in value.values():
+                    for i, name in enumerate(names):
+                        if rename_name(name) is not name:
+                            names[i] = rename_name(name)
+                            count += 1
+            elif key in KEYED_BY_NAME_KEYS and isinstance(value, dict):
+                if any(rename_name(name) is not name for name in value):
+                    node[key] = value = {
+                        rename_name(name): item
+                        for name, item in value.items()
+                    }
+                    count += 1
+            if isinstance(value, (dict, list)):
+                walk(value, aliases, query)
+
+    walk(node, {}, None)
+
+    return count
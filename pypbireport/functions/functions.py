@@ -7,8 +7,17 @@ import secrets
 import codecs
 import os
 import re
+import shutil
+import struct
+import zipfile
 from unidecode import unidecode
 
+from . import serializer
+
+# Size of blocks used to move zip members between files. Bounds the memory
+# used by a copy, whatever the size of the member (e.g. the DataModel).
+ZIP_COPY_CHUNK_SIZE = 1024 * 1024
+
 
 def export_dict_as_file(dict, file_name='Sample.json'):
     with open(file_name, 'w', encoding='utf8') as f:
@@ -18,15 +27,96 @@ def export_dict_as_file(dict, file_name='Sample.json'):
 def hex_code(prefix=''):
     return prefix + secrets.token_hex(nbytes=10)
 
+def dump_json(content):
+    '''Serialize as compact JSON, the way Power BI writes its layout'''
+    return serializer.dumps(content)
+
+def load_json(content):
+    '''Decode JSON with the backend of ``serializer``'''
+    return serializer.loads(content)
+
 def get_str_dict(dict={}, field_name=''):
-    return json.loads(dict.get(field_name))
+    return load_json(dict.get(field_name))
 
 def update_str_dict(dict={}, field_name=''):
-    return dict.update({field_name: json.dumps(dict.get(field_name))})
+    return dict.update({field_name: dump_json(dict.get(field_name))})
 
 def encode_content(content, enconding='utf-8'):
     return codecs.encode(content, enconding)
 
+# Private parts of ``zipfile.ZipFile`` used to copy raw bytes
+_ZIP_WRITE_INTERNALS = ('fp', '_lock', '_writecheck', '_didModify', 
+    'start_dir', 'filelist', 'NameToInfo')
+
+def _can_copy_raw(source:zipfile.ZipFile, target:zipfile.ZipFile) -> bool:
+    '''Return if the zip files have what a raw copy of members needs'''
+    return (
+        all(hasattr(target, name) for name in _ZIP_WRITE_INTERNALS)
+        and getattr(target, '_seekable', True) # no data descriptors
+        and hasattr(source, 'fp') and hasattr(source.fp, 'seek')
+    )
+
+def copy_zip_member(source:zipfile.ZipFile, target:zipfile.ZipFile,
+    zinfo:zipfile.ZipInfo, chunk_size:int=ZIP_COPY_CHUNK_SIZE) -> None:
+    '''Copy a member from a zip file to another without re-encoding it.
+
+    The compressed bytes of the member are moved as they are, in blocks of
+    ``chunk_size``, so nothing is decompressed or compressed again. It 
+    writes through private parts of ``zipfile.ZipFile``. If they are missing,
+    like in another Python version, and for encrypted members, the member is
+    streamed through ``open`` instead, decompressed and compressed again.
+
+    Args:
+        source (zipfile.ZipFile): Zip file opened for reading.
+        target (zipfile.ZipFile): Zip file opened for writing.
+        zinfo (zipfile.ZipInfo): The member of ``source`` to copy.
+        chunk_size (int, optional): Size of each block read and written.
+    '''
+    # New header with sizes and CRC known upfront, no data descriptor
+    new_zinfo = zipfile.ZipInfo(zinfo.filename, zinfo.date_time)
+    new_zinfo.compress_type = zinfo.compress_type
+    new_zinfo.comment = zinfo.comment
+    new_zinfo.create_system = zinfo.create_system
+    new_zinfo.external_attr = zinfo.external_attr
+    new_zinfo.flag_bits = zinfo.flag_bits & ~0x08
+    new_zinfo.CRC = zinfo.CRC
+    new_zinfo.compress_size = zinfo.compress_size
+    new_zinfo.file_size = zinfo.file_size
+
+    if zinfo.flag_bits & 0x1 or not _can_copy_raw(source, target):
+        # Encrypted (raw bytes are useless) or no raw copy possible
+        new_zinfo.flag_bits &= ~0x1 # written without encryption
+        with source.open(zinfo) as src, target.open(new_zinfo, 'w') as dst:
+            shutil.copyfileobj(src, dst, chunk_size)
+        return None
+
+    # Skip the local header of the member, its size is variable
+    source.fp.seek(zinfo.header_offset)
+    header = struct.unpack(zipfile.structFileHeader,
+        source.fp.read(zipfile.sizeFileHeader))
+    source.fp.seek(header[10] + header[11], os.SEEK_CUR) # name and extra
+
+    with target._lock:
+        target.fp.seek(target.start_dir)
+        new_zinfo.header_offset = target.fp.tell()
+        target._writecheck(new_zinfo)
+        target._didModify = True
+        target.fp.write(new_zinfo.FileHeader())
+
+        remaining = zinfo.compress_size
+        while remaining > 0:
+            chunk = source.fp.read(min(chunk_size, remaining))
+            if not chunk:
+                raise zipfile.BadZipFile(f'Truncated member {zinfo.filename}')
+            target.fp.write(chunk)
+            remaining -= len(chunk)
+
+        target.filelist.append(new_zinfo)
+        target.NameToInfo[new_zinfo.filename] = new_zinfo
+        target.start_dir = target.fp.tell()
+
+    return None
+
 def get_parent_dir_path(file):
     return os.path.dirname(os.path.dirname(file))
 
@@ -0,0 +1,131 @@
+'''Module for the on-disk cache of parsed report layouts
+
+Decoding ``Report/Layout`` and the JSON strings of every visual is the main
+cost of opening a report. When a report is opened again without changes,
+the parsed layout can be read from a cache file instead, along with the 
+attribute values of every visual.
+
+The JSON strings of visuals are kept as strings in the cache. Loading
+decoded dicts costs about as much as decoding them, while strings are loaded
+at once. With attribute values at hand, the strings are only decoded when a
+visual is edited.
+
+Cache files are keyed by the CRC32 and the size of ``Report/Layout`` entry in
+the ``.pbix`` zip, so a changed layout never hits an old file, and by a
+signature of the package version and of what the cached values depend on, 
+so another release doesn't read values it would compute in another way. The
+signature has the Python version too, since the ``marshal`` format may 
+change between versions.
+
+Files are in ``marshal`` format, which holds plain data only (dicts, lists,
+strings and numbers), so reading a file never runs code, unlike ``pickle``.
+Still, a changed file can give wrong content to a report, so the cache
+folder should only be writable by those you trust. Files that can't be read,
+like truncated ones, are a miss and are written again.
+'''
+
+import hashlib
+import marshal
+import os
+import sys
+import tempfile
+import zipfile
+from typing import Any
+
+from .. import __version__
+
+# Bump it when the content of cache files changes
+LAYOUT_CACHE_VERSION = 3
+
+# Files are read by the interpreter that wrote them, see ``marshal``
+INTERPRETER = (sys.implementation.name, tuple(sys.version_info[:3]), 
+    marshal.version)
+
+
+def cache_signature(signature:Any=()) -> str:
+    '''Return a short hash of the package and Python versions and a signature
+
+    Args:
+        signature (Any, optional): What cached values depend on, like the
+            paths of visual attributes. Its ``repr`` is hashed. Defaults 
+            to ().
+
+    Returns:
+        str: 12 hexadecimal characters.
+    '''
+    content = repr((__version__, LAYOUT_CACHE_VERSION, INTERPRETER, signature))
+
+    return hashlib.sha1(content.encode()).hexdigest()[:12]
+
+
+def layout_cache_path(cache_dir:str, zinfo:zipfile.ZipInfo,
+    kind:str='layout', signature:Any=()) -> str:
+    '''Return the cache file of a layout zip entry
+
+    Args:
+        cache_dir (str): Folder of cache files.
+        zinfo (zipfile.ZipInfo): The ``Report/Layout`` entry.
+        kind (str, optional): What is cached from the layout, like `layout`
+            for ``PBIReport`` or `inventory` for ``PBIInspector``. Defaults 
+            to 'layout'.
+        signature (Any, optional): What cached values depend on, see
+            ``cache_signature``. Defaults to ().
+
+    Returns:
+        str: Path of the cache file.
+    '''
+    return os.path.join(cache_dir,
+        f'{kind}-{zinfo.CRC:08x}-{zinfo.file_size}-'
+        f'{cache_signature(signature)}.cache')
+
+
+def read_layout_cache(cache_file:str) -> tuple | None:
+    '''Read a cache file
+
+    Args:
+        cache_file (str): Path of the cache file.
+
+    Returns:
+        tuple | None: The content given to ``write_layout_cache``. None if the
+            file doesn't exist or can't be used.
+    '''
+    try:
+        with open(cache_file, 'rb') as f:
+            version, *content = marshal.load(f)
+    except OSError: # missing
+        return None
+    except (EOFError, ValueError, TypeError): # broken, written again
+        return None
+    if version != LAYOUT_CACHE_VERSION:
+        return None
+
+    return tuple(content)
+
+
+def write_layout_cache(cache_file:str, *content:Any) -> None:
+    '''Write a cache file
+
+    The file is written under a temporary name and then moved, so readers
+    never see a partial file.
+
+    Args:
+        cache_file (str): Path of the cache file.
+        *content (Any): What is cached, plain data only (dicts, lists, 
+            tuples, strings, numbers, booleans and None). For 
+            ``PBIReport``, the layout dict, with visual JSON strings, and for
+            each page and each of its visuals, the values of attributes by 
+            name (see ``Visual.attr_values``).
+    '''
+    cache_dir = os.path.dirname(cache_file) or '.'
+    os.makedirs(cache_dir, exist_ok=True)
+    t_file, t_name = tempfile.mkstemp(dir=cache_dir, suffix='.tmp')
+    try:
+        with os.fdopen(t_file, 'wb') as f:
+            marshal.dump((LAYOUT_CACHE_VERSION, *content), f)
+        os.replace(t_name, cache_file)
+    except BaseException:
+        if os.path.exists(t_name):
+            os.remove(t_name)
+        raise
+
+    return None
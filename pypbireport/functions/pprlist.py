@@ -5,17 +5,69 @@ slicing and indexing by string.
 '''
 
 class PPRList(list):
-    '''Class to hold visual objects. 
+    '''Class to hold visual objects.
 
-    Simple modification of list class to work with visual id indexing 
+    Simple modification of list class to work with visual id indexing
     by string.
 
+    An index of items by id is kept up to date by the list methods, so
+    indexing by string doesn't scan the list. Items can also be selected by
+    page (``page_name``) and by visual type (``visual_type``), see 
+    ``get_by_page`` and ``get_by_type``.
+
+    Note:
+        Ids are read when items enter the list. If the id of an item changes
+        while it is in the list, the lookup falls back to a scan and the index
+        is rebuilt. Pages and types are read on each selection, they may
+        change while items are in the list.
+
     '''
+    def __init__(self, iterable=()):
+        super().__init__(iterable)
+        self._reindex()
+
+    def __reduce__(self):
+        '''Rebuild through __init__, so the index exists before items'''
+        return (self.__class__, (list(self),))
+
+    def _reindex(self) -> None:
+        '''Rebuild the index by id'''
+        self._index : dict = {}
+        self._id_count : dict = {}
+        self._add_to_index(self)
+
+    def _add_to_index(self, items) -> None:
+        '''Register items appended to the list'''
+        for item in items:
+            item_id = getattr(item, 'id', None)
+            self._index.setdefault(item_id, item) # first one, as in a scan
+            self._id_count[item_id] = self._id_count.get(item_id, 0) + 1
+
+    def _remove_from_index(self, items) -> None:
+        '''Unregister items that left the list'''
+        for item in items:
+            item_id = getattr(item, 'id', None)
+            self._id_count[item_id] = self._id_count.get(item_id, 1) - 1
+            if self._index.get(item_id) is item:
+                del self._index[item_id]
+                if self._id_count[item_id] > 0: # another item has the id
+                    for other in self:
+                        if getattr(other, 'id', None) == item_id:
+                            self._index[item_id] = other
+                            break
+            if self._id_count[item_id] <= 0:
+                del self._id_count[item_id]
+
     def __getitem__(self, index):
         '''Modification of __getitem__ magic method to get item by string'''
         if isinstance(index, str): #string
+            item = self._index.get(index)
+            if item is not None and item.id == index:
+                return item
+            # The id may have changed after the item entered the list
             for i, item in enumerate(self.__iter__()):
-                if item.id == index:                
+                if item.id == index:
+                    self._reindex()
                     return list.__getitem__(self,i)
         elif isinstance(index, list): #list of strings
             list_items = []
@@ -23,4 +75,99 @@ class PPRList(list):
                 list_items.append(self.__getitem__(idx))
             return list_items
         else:
-            return list.__getitem__(self,index)
\ No newline at end of file
+            return list.__getitem__(self,index)
+
+    def __setitem__(self, index, value):
+        '''Modification of __setitem__ to keep the index up to date'''
+        list.__setitem__(self, index, value)
+        self._reindex() # positions matter, rebuild
+
+    def __delitem__(self, index):
+        '''Modification of __delitem__ to keep the index up to date'''
+        old_items = list.__getitem__(self, index)
+        list.__delitem__(self, index)
+        if not isinstance(index, slice):
+            old_items = [old_items]
+        self._remove_from_index(old_items)
+
+    def copy(self):
+        '''Return a shallow copy, copying the index instead of building it'''
+        new = self.__class__.__new__(self.__class__)
+        list.extend(new, self)
+        new._index = dict(self._index)
+        new._id_count = dict(self._id_count)
+        return new
+
+    def __iadd__(self, other):
+        self.extend(other)
+        return self
+
+    def __imul__(self, n):
+        list.__imul__(self, n)
+        self._reindex()
+        return self
+
+    def append(self, item):
+        list.append(self, item)
+        self._add_to_index([item])
+
+    def extend(self, iterable):
+        items = list(iterable)
+        list.extend(self, items)
+        self._add_to_index(items)
+
+    def insert(self, index, item):
+        list.insert(self, index, item)
+        if index >= len(self) - 1: # same as append
+            self._add_to_index([item])
+        else:
+            self._reindex() # positions matter, rebuild
+
+    def remove(self, item):
+        list.remove(self, item)
+        self._remove_from_index([item])
+
+    def pop(self, index=-1):
+        item = list.pop(self, index)
+        self._remove_from_index([item])
+        return item
+
+    def clear(self):
+        list.clear(self)
+        self._reindex()
+
+    def sort(self, *args, **kwargs):
+        list.sort(self, *args, **kwargs)
+        self._reindex()
+
+    def reverse(self):
+        list.reverse(self)
+        self._reindex()
+
+    def get_by_page(self, page_name:str) -> 'PPRList':
+        '''Return the items placed in a page
+
+        Args:
+            page_name (str): The page name of the items.
+
+        Returns:
+            PPRList: Items with ``page_name`` equal to page_name.
+        '''
+        return PPRList(
+            item for item in self
+            if getattr(item, 'page_name', None) == page_name
+        )
+
+    def get_by_type(self, visual_type:str) -> 'PPRList':
+        '''Return the items of a visual type
+
+        Args:
+            visual_type (str): The Power BI type of visual, like `card`.
+
+        Returns:
+            PPRList: Items with ``visual_type`` equal to visual_type.
+        '''
+        return PPRList(
+            item for item in self
+            if getattr(item, 'visual_type', None) == visual_type
+        )
@@ -0,0 +1,138 @@
+'''Module for the JSON backend of layout decode and encode
+
+A report layout holds thousands of JSON strings, one for each part of each
+visual, so JSON work is a great part of load and save. Faster libraries are
+used when installed, in this order: ``orjson``, ``ujson`` and the standard
+``json`` as fallback.
+
+Whatever the backend, output is compact and non ASCII characters are written
+as they are (like ``ensure_ascii=False``), the way Power BI writes its layout.
+Content a backend refuses or would change, like integers bigger than 64 bits,
+falls back to the standard ``json``.
+
+The backend can be chosen with ``set_json_backend`` or with the environment
+variable ``PYPBIREPORT_JSON_BACKEND``.
+
+Note:
+    Power BI layouts don't use them, but ``orjson`` writes ``NaN`` and
+    ``Infinity`` as ``null``. Choose the ``json`` backend if your content
+    has them.
+'''
+
+import json
+import os
+from typing import Any, Callable
+
+try:
+    import orjson
+except ImportError: #optional
+    orjson = None
+
+try:
+    import ujson
+except ImportError: #optional
+    ujson = None
+
+
+# Digits as zeros, to find runs of 19 digits, that may be integers out of
+# the 64 bits range, like -9999999999999999999 below -2**63
+_DIGITS = bytes.maketrans(b'123456789', b'000000000')
+_LONG_NUMBER = b'0' * 19
+
+
+def _json_loads(content:str) -> Any:
+    return json.loads(content)
+
+def _json_dumps(content:Any) -> str:
+    return json.dumps(content, ensure_ascii=False, separators=(',', ':'))
+
+def _orjson_loads(content:str) -> Any:
+    try:
+        data = content.encode()
+        # orjson reads integers bigger than 64 bits as floats, without error
+        if _LONG_NUMBER in data.translate(_DIGITS):
+            return json.loads(content)
+        return orjson.loads(data) # type: ignore
+    except ValueError: # e.g. NaN and lone surrogates
+        return json.loads(content)
+
+def _orjson_dumps(content:Any) -> str:
+    try:
+        return orjson.dumps( # type: ignore
+            content, option=orjson.OPT_NON_STR_KEYS).decode() # type: ignore
+    except TypeError: # e.g. big integers and lone surrogates
+        return _json_dumps(content)
+
+def _ujson_loads(content:str) -> Any:
+    try:
+        return ujson.loads(content) # type: ignore
+    except ValueError:
+        return json.loads(content)
+
+def _ujson_dumps(content:Any) -> str:
+    try:
+        return ujson.dumps(content, ensure_ascii=False, # type: ignore
+            escape_forward_slashes=False, reject_bytes=True)
+    except (TypeError, OverflowError, ValueError):
+        return _json_dumps(content)
+
+
+# name: (module, loads, dumps)
+BACKENDS : dict[str, tuple[Any, Callable, Callable]] = {
+    'orjson': (orjson, _orjson_loads, _orjson_dumps),
+    'ujson': (ujson, _ujson_loads, _ujson_dumps),
+    'json': (json, _json_loads, _json_dumps),
+}
+
+_backend : dict[str, Any] = {}
+
+
+def available_json_backends() -> list[str]:
+    '''Return the names of installed backends, fastest first'''
+    return [name for name, (module, *_) in BACKENDS.items() if module]
+
+
+def set_json_backend(name:str | None = None) -> str:
+    '''Choose the JSON backend
+
+    Args:
+        name (str | None, optional): `orjson`, `ujson` or `json`. Defaults to
+            None, the fastest installed.
+
+    Raises:
+        ValueError: If the backend is unknown or not installed.
+
+    Returns:
+        str: Name of the backend in use.
+    '''
+    if name is None:
+        name = available_json_backends()[0]
+    if name not in BACKENDS:
+        raise ValueError(
+            f"Unknown JSON backend '{name}'. Options: {list(BACKENDS)}")
+    module, loads_function, dumps_function = BACKENDS[name]
+    if module is None:
+        raise ValueError(f"JSON backend '{name}' is not installed")
+
+    _backend.update(
+        {'name': name, 'loads': loads_function, 'dumps': dumps_function})
+
+    return name
+
+
+def get_json_backend() -> str:
+    '''Return the name of the JSON backend in use'''
+    return _backend['name']
+
+
+def loads(content:str) -> Any:
+    '''Decode a JSON string with the backend in use'''
+    return _backend['loads'](content)
+
+
+def dumps(content:Any) -> str:
+    '''Encode as compact JSON, non ASCII as it is, with the backend in use'''
+    return _backend['dumps'](content)
+
+
+set_json_backend(os.environ.get('PYPBIREPORT_JSON_BACKEND') or None)
@@ -0,0 +1,274 @@
+'''Module to apply the same edits to many Power BI reports
+
+Loading and saving a report is CPU bound work (JSON and zip), so reports are
+processed in a pool of processes, one report per task.
+
+The edit is a function that receives a ``PBIReport`` and changes it. It must
+be picklable, so it should be defined at module level (not a lambda).
+
+Example:
+    >>> def retitle_cards(report):
+    ...     for visual in report.visuals.get_by_type('card'):
+    ...         visual.title_text = "'New title'"
+    >>> results = run_batch(['a.pbix', 'b.pbix'], retitle_cards,
+    ...     output_dir='out')
+'''
+
+import os
+import pathlib
+import time
+import traceback
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Callable
+
+import pandas as pd
+
+from .pbifile import report_name_of
+from .pbireport import PBIReport
+
+
+def output_file_name(pbix_path:str, suffix:str='ppr_out',
+    output_dir:str|None=None, base_dir:str|None=None) -> str | None:
+    '''Return the path of the report saved by a batch
+
+    Args:
+        pbix_path (str): Path of the original report.
+        suffix (str, optional): Suffix added to the report name. Defaults to
+            'ppr_out'.
+        output_dir (str | None, optional): Folder of the new report. If None,
+            the naming of ``PBIReport.save_report`` is used and None is
+            returned. Defaults to None.
+        base_dir (str | None, optional): Folder of the original reports. The
+            subfolder of the report in it is kept in `output_dir`, so reports
+            with the same name in different folders don't overwrite each
+            other. Defaults to None, straight in `output_dir`.
+
+    Returns:
+        str | None: Path of the new report.
+    '''
+    if output_dir is None:
+        return None
+    report_name = pathlib.Path(pbix_path).stem
+    if base_dir is not None:
+        output_dir = os.path.join(output_dir, os.path.relpath(
+            os.path.dirname(os.path.abspath(pbix_path)), base_dir))
+
+    return os.path.normpath(
+        os.path.join(output_dir, f'{report_name} {suffix}.pbix'))
+
+
+def common_dir(pbix_paths:list[str]) -> str | None:
+    '''Return the deepest folder of all reports, None if there is none
+
+    Args:
+        pbix_paths (list[str]): Paths of the reports.
+
+    Returns:
+        str | None: The folder, None for no reports or, on Windows, reports
+            in different drives.
+    '''
+    try:
+        return os.path.commonpath(
+            [os.path.dirname(os.path.abspath(path)) for path in pbix_paths])
+    except ValueError: #no paths or different drives
+        return None
+
+
+def check_output_paths(pbix_paths:list[str], suffix:str='ppr_out',
+    output_dir:str|None=None, replace_original:bool=False,
+    base_dir:str|None=None) -> None:
+    '''Check that no two reports of a batch are saved to the same file
+
+    Args:
+        pbix_paths (list[str]): Paths of the reports.
+        suffix (str, optional): See ``run_batch``. Defaults to 'ppr_out'.
+        output_dir (str | None, optional): See ``run_batch``. Defaults to 
+            None.
+        replace_original (bool, optional): See ``run_batch``. Defaults to
+            False.
+        base_dir (str | None, optional): See ``output_file_name``. Defaults 
+            to None.
+
+    Raises:
+        ValueError: If reports would be saved to the same file, like a
+            report given twice.
+    '''
+    output_paths = []
+    for pbix_path in pbix_paths:
+        if replace_original:
+            output_path = pbix_path
+        elif output_dir is not None:
+            output_path = output_file_name(pbix_path, suffix, output_dir, 
+                base_dir)
+        else: #naming of save_report
+            output_path = f'{report_name_of(pbix_path)} {suffix}.pbix'
+        output_paths.append(os.path.abspath(output_path)) # type: ignore
+
+    repeated = [path for path, count in Counter(output_paths).items() 
+        if count > 1]
+    if repeated:
+        raise ValueError(
+            f'Reports would be saved to the same file: {repeated}')
+
+    return None
+
+
+def process_report(pbix_path:str, edit_function:Callable[[PBIReport], Any],
+    suffix:str='ppr_out', output_dir:str|None=None,
+    replace_original:bool=False, lean:bool=False, 
+    base_dir:str|None=None) -> dict:
+    '''Load a report, edit it and save it
+
+    Errors don't raise, they are returned in the result, so one broken
+    report doesn't stop a batch.
+
+    Args:
+        pbix_path (str): Path of the report.
+        edit_function (Callable): Function that receives the ``PBIReport``.
+            Its return is kept in the result, it should be picklable.
+        suffix (str, optional): Suffix of the new report. Defaults to
+            'ppr_out'.
+        output_dir (str | None, optional): Folder of the new report. Defaults
+            to None, the folder of ``save_report``.
+        replace_original (bool, optional): Replace the original report.
+            Defaults to False.
+        lean (bool, optional): Open the report in lean mode. Defaults to
+            False.
+        base_dir (str | None, optional): Folder of the reports of the batch,
+            see ``output_file_name``. Defaults to None.
+
+    Returns:
+        dict: Result of the report, see ``run_batch``.
+    '''
+    result = {
+        'pbix_path': pbix_path,
+        'output_path': None,
+        'status': 'ok',
+        'result': None,
+        'error': None,
+        'traceback': None,
+        'load_time': None,
+        'edit_time': None,
+        'save_time': None,
+    }
+    step = 'load'
+    report = None
+    start = time.perf_counter()
+    try:
+        report = PBIReport(pbix_path, lean=lean)
+        result['load_time'] = time.perf_counter() - start
+
+        step = 'edit'
+        start = time.perf_counter()
+        result['result'] = edit_function(report)
+        result['edit_time'] = time.perf_counter() - start
+
+        step = 'save'
+        start = time.perf_counter()
+        file_name = (None if replace_original 
+            else output_file_name(pbix_path, suffix, output_dir, base_dir))
+        if file_name is not None:
+            os.makedirs(os.path.dirname(file_name) or '.', exist_ok=True)
+        report.save_report(replace_original=replace_original, suffix=suffix,
+            file_name=file_name)
+        result['save_time'] = time.perf_counter() - start
+        # Where save_report wrote it, it may be the working folder
+        result['output_path'] = os.path.abspath(
+            report.save_path(replace_original, suffix, file_name))
+    except Exception as error:
+        result.update(
+            {
+                'status': f'{step} error',
+                'error': repr(error),
+                'traceback': traceback.format_exc()
+            }
+        )
+    finally:
+        if report is not None:
+            report.pbix.close()
+
+    return result
+
+
+def run_batch(pbix_paths:list[str], edit_function:Callable[[PBIReport], Any],
+    max_workers:int|None=None, suffix:str='ppr_out',
+    output_dir:str|None=None, replace_original:bool=False,
+    lean:bool=False) -> pd.DataFrame:
+    '''Apply an edit to many reports in a pool of processes
+
+    Each report is loaded, passed to ``edit_function`` and saved. In
+    `output_dir`, reports keep their subfolder of the deepest folder that
+    has all of them, so reports with the same name in different folders
+    are saved to different files.
+
+    Args:
+        pbix_paths (list[str]): Paths of the reports.
+        edit_function (Callable): Function that receives a ``PBIReport`` and
+            edits it. It must be picklable, like a function defined at module
+            level.
+        max_workers (int | None, optional): Number of processes. With 1, the
+            reports are processed in this process, which helps debugging.
+            Defaults to None, the number of CPUs.
+        suffix (str, optional): Suffix added to the name of new reports.
+            Defaults to 'ppr_out'.
+        output_dir (str | None, optional): Folder of the new reports. Defaults
+            to None, the naming of ``PBIReport.save_report``.
+        replace_original (bool, optional): Replace the original reports.
+            Defaults to False.
+        lean (bool, optional): Open reports in lean mode, see ``PBIReport``.
+            Defaults to False.
+
+    Raises:
+        ValueError: If two reports would be saved to the same file, like a
+            report given twice or, on Windows, reports with the same name
+            saved in the working folder.
+
+    Returns:
+        pd.DataFrame: One row per report, in the order of `pbix_paths`, with
+            the columns `pbix_path`, `output_path`, `status` (`ok` or the
+            step that failed), `result` (return of edit function), `error`,
+            `traceback`, `load_time`, `edit_time`, `save_time` and
+            `total_time` (seconds).
+    '''
+    base_dir = common_dir(pbix_paths) if output_dir is not None else None
+    check_output_paths(pbix_paths, suffix, output_dir, replace_original,
+        base_dir)
+    arguments = (suffix, output_dir, replace_original, lean, base_dir)
+
+    if max_workers == 1:
+        results = [
+            process_report(pbix_path, edit_function, *arguments)
+            for pbix_path in pbix_paths
+        ]
+    else:
+        with ProcessPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(process_report, pbix_path, edit_function,
+                    *arguments)
+                for pbix_path in pbix_paths
+            ]
+            results = []
+            for pbix_path, future in zip(pbix_paths, futures):
+                try:
+                    results.append(future.result())
+                except Exception as error: # like an unpicklable edit
+                    results.append(
+                        {
+                            'pbix_path': pbix_path,
+                            'status': 'pool error',
+                            'error': repr(error),
+                            'traceback': traceback.format_exc()
+                        }
+                    )
+
+    df = pd.DataFrame(results, columns=[
+        'pbix_path', 'output_path', 'status', 'result', 'error', 'traceback',
+        'load_time', 'edit_time', 'save_time'
+    ])
+    df['total_time'] = (
+        df[['load_time', 'edit_time', 'save_time']]
+        .sum(axis=1, min_count=1)
+    )
+
+    return df
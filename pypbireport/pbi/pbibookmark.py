@@ -73,6 +73,46 @@ class Bookmark(object):
             self.id = self.bookmark_dict.get('name')
         
 
+
+    @classmethod
+    def from_dict(cls, bookmark_dict:dict, show_visuals:list[Visual],
+        hide_visuals:list[Visual]) -> 'Bookmark':
+        '''Create a Bookmark that holds a bookmark dict as it is
+
+        The template is not copied and no id is generated, so it is cheap to 
+        create many bookmarks at once, like in ``toggle_bookmarks``.
+
+        Args:
+            bookmark_dict (dict): A complete bookmark dict, as in the report
+                config.
+            show_visuals (list[Visual]): Visuals shown by the bookmark.
+            hide_visuals (list[Visual]): Visuals hidden by the bookmark.
+
+        Returns:
+            Bookmark: A Bookmark object with that dict.
+        '''
+        bookmark = cls.__new__(cls)
+        bookmark.name = bookmark_dict.get('displayName', '')
+        bookmark.show_visuals = show_visuals
+        bookmark.hide_visuals = hide_visuals
+        bookmark.target_visuals = show_visuals + hide_visuals
+
+        exploration_state = bookmark_dict.get('explorationState', {})
+        bookmark.report_section = exploration_state.get('activeSection', '')
+        bookmark.report_section_name = (
+            bookmark.target_visuals[0].page_name 
+            if bookmark.target_visuals else ''
+        )
+        bookmark.bookmark_dict = bookmark_dict
+        bookmark.visual_containers = (
+            exploration_state
+            .get('sections', {})
+            .get(bookmark.report_section, {})
+            .get('visualContainers', {})
+        )
+        bookmark.id = bookmark_dict.get('name')
+
+        return bookmark
             
     def add_target_visual(self, visual:Visual, display_mode=bookmarks.SHOW):
         pass
@@ -169,7 +209,8 @@ class BookmarkGroup():
 
     def __init__(self, bookmark_group_name:str,
         children_list:list[Bookmark],
-        id:str|None = None
+        id:str|None = None,
+        target_visuals:list[Visual]|None = None
         ) -> None:
 
         self.bookmark_group_name = bookmark_group_name        
@@ -179,10 +220,15 @@ class BookmarkGroup():
 
         if id:
             self.id = id
+            self.bookmark_dict.update({'name': id})
         else:
             self.id = self.bookmark_dict.get('name')
 
-        self.target_visuals = self.__get_targets_visuals()
+        # Targets of children, unless they are known
+        if target_visuals is None:
+            self.target_visuals = self.__get_targets_visuals()
+        else:
+            self.target_visuals = target_visuals
         
         report_section_name = []
         for bookmark in self.children_list:
@@ -222,3 +268,81 @@ class BookmarkGroup():
         )
         '''
         return ' '.join(_.split())
+
+
+def toggle_bookmarks(visuals:list[Visual], group_name:str,
+    bookmark_names:list[str] | None = None) -> BookmarkGroup:
+    '''Create a group with a bookmark for each visual, that shows it and
+    hides the others
+
+    It is the pattern of visuals stacked in one spot of a page and a bookmark
+    navigator to switch between them, see ``PBIReport.insert_toggle_bookmarks``.
+    Bookmark dicts are built in one pass from the template, instead of
+    building a Bookmark from it for each visual. Each bookmark has its own
+    dicts of display states, so one can be edited without the others.
+
+    Args:
+        visuals (list[Visual]): The visuals to toggle, of the same page.
+        group_name (str): Display name of the group.
+        bookmark_names (list[str] | None, optional): Display names of the
+            bookmarks, one for each visual. Defaults to None, the group name
+            followed by the position of the visual.
+
+    Raises:
+        ValueError: If there are no visuals, if they are in different pages
+            or if the number of names is not the number of visuals.
+
+    Returns:
+        BookmarkGroup: The group, with a Bookmark for each visual.
+    '''
+    if not visuals:
+        raise ValueError('There should be visuals to toggle')
+    if bookmark_names is None:
+        bookmark_names = [f'{group_name} {i + 1}' for i in range(len(visuals))]
+    if len(bookmark_names) != len(visuals):
+        raise ValueError('There should be a bookmark name for each visual')
+    if len({visual.page_id for visual in visuals}) > 1:
+        raise ValueError('The visuals should be in the same page')
+
+    report_section = visuals[0].page_id
+    target_names = [visual.id for visual in visuals]
+    all_visuals = PPRList(visuals)
+
+    options = BOOKMARK_DICT.get('options', {})
+    version = BOOKMARK_DICT.get('explorationState', {}).get('version')
+
+    children = PPRList()
+    for visual, bookmark_name in zip(visuals, bookmark_names):
+        visual_containers = {
+            target_name: {
+                'singleVisual': {
+                    'display': {
+                        'mode': (bookmarks.SHOW if target_name == visual.id
+                            else bookmarks.HIDE)
+                    }
+                }
+            }
+            for target_name in target_names
+        }
+
+        hide_visuals = all_visuals.copy()
+        hide_visuals.remove(visual)
+
+        bookmark_dict = {
+            'displayName': bookmark_name,
+            'name': hex_code('Bookmark'),
+            'explorationState': {
+                'version': version,
+                'activeSection': report_section,
+                'sections': {
+                    report_section: {'visualContainers': visual_containers}
+                }
+            },
+            'options': {**options, 'targetVisualNames': list(target_names)}
+        }
+        children.append(
+            Bookmark.from_dict(bookmark_dict, PPRList([visual]), hide_visuals)
+        )
+
+    return BookmarkGroup(bookmark_group_name=group_name, 
+        children_list=children, target_visuals=all_visuals)
@@ -9,14 +9,31 @@ class to work with.
 
 import json
 import tempfile
+from typing import Iterable
 import zipfile
 import codecs
 import os
 import pathlib
 
-from ..functions.functions import encode_content
+from ..functions.functions import encode_content, copy_zip_member
 from ..constants.structures import CONTENT_TYPE_XML
 
+def report_name_of(pbix_path:str) -> str:
+    '''Return the report name of a PBIX file, see ``PBIXFile.report_name``
+
+    Args:
+        pbix_path (str): Path of a PBIX file.
+
+    Returns:
+        str: The name, without `.pbix`.
+    '''
+    return (
+        os.path.abspath(pbix_path)
+        .split("\\")
+        [-1]
+        .replace(".pbix", '')
+    )
+
 class PBIXFile():
     '''Class to work with PBIX File
     
@@ -45,12 +62,7 @@ class PBIXFile():
         '''__init__ documentation'''
         self.pbix_path = os.path.abspath(pbix_path)
 
-        self.report_name = (
-            self.pbix_path
-            .split("\\")
-            [-1]
-            .replace(".pbix", '')
-        )
+        self.report_name = report_name_of(self.pbix_path)
 
         # Call open PBIX file to initiate variable pbix
         self.__open_pbix_file()
@@ -124,7 +136,32 @@ class PBIXFile():
 
         return None
 
-    def save_report(self, layout_dict:str, replace_original:bool=False,
+    def save_path(self, replace_original:bool=False, 
+        suffix:str='ppr_out', file_name:str|None=None) -> str:
+        '''Return the path where ``save_report`` writes the report
+
+        Args:
+            replace_original (bool, optional): See ``save_report``. Defaults
+                to False.
+            suffix (str, optional): See ``save_report``. Defaults to 
+                'ppr_out'.
+            file_name (str | None, optional): See ``save_report``. Defaults 
+                to None.
+
+        Returns:
+            str: The file name, relative to the working folder unless it is
+                given as an absolute path. With ``replace_original``, the 
+                path of the original file.
+        '''
+        if file_name:
+            return file_name
+        if replace_original:
+            return self.pbix_path
+
+        return f'{self.report_name} {suffix}.pbix'
+
+    def save_report(self, layout_dict:str | Iterable[str],
+        replace_original:bool=False,
         suffix:str='ppr_out', file_name:str|None=None, open_file:bool=False
         ) -> str:
 
@@ -134,15 +171,20 @@ class PBIXFile():
             1. Create a temp file.
             2. Passes all files inside PBIX zipped file for temp file, expect
                ``Report/Layout``, ``SecurityBindings`` and
-               ``Content_Types.xml``.
+               ``Content_Types.xml``. They are copied as raw compressed
+               bytes, in blocks, so big members like ``DataModel`` are
+               neither loaded in memory nor compressed again.
             3. Inserts ``Report/Layout`` with ``layout_dict`` written in proper
-               encoding, as well as inserts ``Content_Types.xml`` file
+               encoding, as well as inserts ``Content_Types.xml`` file. The
+               layout can be given in pieces, they are encoded and 
+               compressed one by one, straight into the zip entry.
 
         Note:
             SecurityBindings will be created after open PBIX file and save it.
 
         Args:
-            layout_dict (str): Layout dict (json) of a PBI report.
+            layout_dict (str | Iterable[str]): Layout dict (json) of a PBI 
+                report, as a string or as pieces of it.
             replace_original (bool, optional): If is true, the original report
                 will be replaced for a report with modification. Important:
                 the original file should be closed. Defaults to False.
@@ -182,18 +224,21 @@ class PBIXFile():
             temp_zip.comment = pbix_file.comment
             for file in pbix_file.infolist():
                 if not file.filename in no_to_copy:
-                    temp_zip.writestr(file, pbix_file.read(file.filename))
+                    copy_zip_member(pbix_file, temp_zip, file)
 
         # 3. Put the layout dict modified in
         with zipfile.ZipFile(file=t_name,
             mode='a',
             compression=zipfile.ZIP_DEFLATED
             ) as new_report:
-            # Layout dict
-            new_report.writestr(
-                zinfo_or_arcname='Report/Layout',
-                data=encode_content(layout_dict, 'utf-16-le')
-            )
+            # Layout dict, encoded piece by piece
+            if isinstance(layout_dict, str):
+                layout_dict = [layout_dict]
+            encoder = codecs.getincrementalencoder('utf-16-le')()
+            with new_report.open('Report/Layout', 'w') as layout_file:
+                for piece in layout_dict:
+                    layout_file.write(encoder.encode(piece))
+                layout_file.write(encoder.encode('', final=True))
             # Content xml
             new_report.writestr(
                 zinfo_or_arcname='[Content_Types].xml',
@@ -201,19 +246,10 @@ class PBIXFile():
             )
 
         # 4. Rename temporary file
-        if not file_name:
-            if replace_original:
-                if os.path.exists(self.pbix_path):
-                    os.remove(self.pbix_path)
-                file_name = self.report_name + '.pbix'
-            else:
-                file_name = f'{self.report_name} {suffix}.pbix'
-                if os.path.exists(file_name): # if exists, delete
-                    os.remove(file_name)
-        elif file_name:
-            if os.path.exists(file_name): # if exists, delete
-                os.remove(file_name)
-            os.rename(t_name, file_name)
+        file_name = self.save_path(replace_original, suffix, file_name)
+        if os.path.exists(file_name): # if exists, delete
+            os.remove(file_name)
+        os.rename(t_name, file_name)
 
         # if open_file:
         #     os.system(file_name)
@@ -0,0 +1,580 @@
+'''Module for indexes of report objects
+
+Before changing the model, it is common to ask which visuals use a field or a
+measure. A visual references fields in its `projections`, `prototypeQuery`,
+`query.Commands`, `dataTransforms` and `filters`, so an answer means walking
+all of them for all visuals. ``FieldUsageIndex`` walks them once and keeps an
+inverted index from qualified field name (`Table.Field`) to visuals.
+
+Field references are found by ``functions.fields.field_references``.
+
+Bookmarks reference visuals by id, in `options.targetVisualNames` and in the
+`visualContainers` of their `explorationState` sections. ``BookmarkIndex``
+keeps these references both ways, so a removed or renamed visual updates
+only the bookmarks that point to it.
+'''
+
+from typing import Any, Iterator
+
+from ..functions.fields import (field_name_of, source_aliases,
+    field_references)
+from ..functions.pprlist import PPRList
+
+# Pseudo role of fields used by the filters of a visual
+FILTERS_ROLE = 'filters'
+
+
+def visual_field_usages(visual:Any) -> dict[str, set[str]]:
+    '''Return the fields used by a visual with their roles
+
+    Roles are the keys of `projections` (like `Values` or `Category`) where
+    the field is projected, plus `filters` when it filters the visual. Fields
+    only used elsewhere, like in sorting or conditional formatting, have no
+    role. JSON strings not decoded yet are decoded without keeping them.
+
+    Args:
+        visual (Visual): A visual of the report.
+
+    Returns:
+        dict[str, set[str]]: Roles by qualified field name.
+    '''
+    usages : dict[str, set[str]] = {}
+    config = visual._peek_dict('config')
+
+    # Roles of selected fields, by the name of the select
+    single_visual = config.get('singleVisual', {})
+    roles_by_ref : dict[str, set[str]] = {}
+    for role, projections in single_visual.get('projections', {}).items():
+        for projection in projections:
+            roles_by_ref.setdefault(projection.get('queryRef'), set()).add(
+                role)
+    prototype_query = single_visual.get('prototypeQuery') or {}
+    aliases = source_aliases(prototype_query.get('From'))
+    for select in prototype_query.get('Select', []):
+        roles = roles_by_ref.get(select.get('Name'), set())
+        for name, _ in field_references(select, aliases):
+            usages.setdefault(name, set()).update(roles)
+
+    for part in (config, visual._peek_dict('query'),
+        visual._peek_dict('dataTransforms')):
+        for name, _ in field_references(part):
+            usages.setdefault(name, set())
+    for name, _ in field_references(visual._peek_dict('filters')):
+        usages.setdefault(name, set()).add(FILTERS_ROLE)
+
+    return usages
+
+
+class FieldUsageIndex():
+    '''Inverted index of fields and measures used by visuals
+
+    Each qualified field name (`Table.Field`) points to the visuals that
+    reference it, with their roles. Lookups are dict lookups, they don't walk
+    visuals.
+
+    Visuals added to the index are updated when their field attributes are
+    set, as ``card.field = 'Table.Measure'``. After other changes of visual
+    dicts, like ``update_values`` or a new `config`, call ``update_visual``.
+
+    Args:
+        visuals (Iterable | None, optional): Visuals to index. Defaults to
+            None.
+
+    Attributes:
+        field_visuals (dict): Roles by visual, by qualified field name.
+        visual_fields (dict): Qualified field names by visual.
+    '''
+
+    def __init__(self, visuals=None) -> None:
+        self.field_visuals : dict[str, dict[Any, set[str]]] = {}
+        self.visual_fields : dict[Any, set[str]] = {}
+
+        for visual in visuals or []:
+            self.add_visual(visual)
+
+    def __repr__(self) -> str:
+        return (f'FieldUsageIndex({len(self.field_visuals)} fields, '
+            f'{len(self.visual_fields)} visuals)')
+
+    def __len__(self) -> int:
+        return len(self.field_visuals)
+
+    def __contains__(self, field:Any) -> bool:
+        return field_name_of(field) in self.field_visuals
+
+    def add_visual(self, visual:Any) -> None:
+        '''Index the fields of a visual
+
+        The visual tells the index when its field attributes are set.
+
+        Args:
+            visual (Visual): A visual of the report.
+        '''
+        if visual in self.visual_fields:
+            self.remove_visual(visual)
+
+        usages = visual_field_usages(visual)
+        for name, roles in usages.items():
+            self.field_visuals.setdefault(name, {})[visual] = roles
+        self.visual_fields[visual] = set(usages)
+        visual._field_listener = self.update_visual
+
+        return None
+
+    def remove_visual(self, visual:Any) -> None:
+        '''Take a visual out of the index
+
+        Args:
+            visual (Visual): A visual of the report.
+        '''
+        for name in self.visual_fields.pop(visual, set()):
+            visuals = self.field_visuals.get(name, {})
+            visuals.pop(visual, None)
+            if not visuals:
+                self.field_visuals.pop(name, None)
+        if getattr(visual, '_field_listener', None) == self.update_visual:
+            visual._field_listener = None
+
+        return None
+
+    def update_visual(self, visual:Any) -> None:
+        '''Index again the fields of a visual, after it was changed
+
+        Args:
+            visual (Visual): A visual of the report.
+        '''
+        self.add_visual(visual)
+
+        return None
+
+    def fields(self) -> list[str]:
+        '''Return the qualified names of all fields used by visuals'''
+        return list(self.field_visuals)
+
+    def visuals(self, field:Any) -> PPRList:
+        '''Return the visuals that use a field
+
+        Args:
+            field (Any): A `Table.Field` string or a ``PBIModel`` measure or
+                column.
+
+        Returns:
+            PPRList: The visuals, empty if the field isn't used.
+        '''
+        return PPRList(self.field_visuals.get(field_name_of(field), {}))
+
+    def pages(self, field:Any) -> list[str]:
+        '''Return the names of pages where a field is used
+
+        Args:
+            field (Any): A `Table.Field` string or a ``PBIModel`` measure or
+                column.
+
+        Returns:
+            list[str]: Page names, without repetition.
+        '''
+        return list(dict.fromkeys(
+            visual.page_name
+            for visual in self.field_visuals.get(field_name_of(field), {})
+        ))
+
+    def usages(self, field:Any) -> list[tuple[Any, str, set[str]]]:
+        '''Return where and how a field is used
+
+        Args:
+            field (Any): A `Table.Field` string or a ``PBIModel`` measure or
+                column.
+
+        Returns:
+            list[tuple[Visual, str, set[str]]]: The visual, its page name and
+                the roles of the field in the visual.
+        '''
+        return [
+            (visual, visual.page_name, set(roles))
+            for visual, roles
+            in self.field_visuals.get(field_name_of(field), {}).items()
+        ]
+
+
+class PageIndex():
+    '''Index of report pages by section name and by display name
+
+    Pages are the dicts of `sections` in the report layout. Lookups are dict
+    lookups instead of scans of the list. Display names may repeat, so they
+    point to lists of pages.
+
+    The index is updated by ``add_page`` and ``remove_page``. A page dict
+    changed or added to the list in another way is still found. A lookup
+    that misses or finds a page with another name rebuilds the index only if
+    pages were added, removed or renamed since it was built, otherwise it is
+    a plain miss.
+
+    Args:
+        pages_list (list[dict]): The `sections` list of the report layout.
+
+    Attributes:
+        pages_list (list[dict]): The indexed list.
+        by_section (dict): Page by section name (`name` key).
+        by_display_name (dict): Pages by display name (`displayName` key).
+    '''
+
+    def __init__(self, pages_list:list[dict]) -> None:
+        self.pages_list = pages_list
+        self.reindex()
+
+    def __repr__(self) -> str:
+        return f'PageIndex({len(self.by_section)} pages)'
+
+    def __len__(self) -> int:
+        return len(self.pages_list)
+
+    def __contains__(self, page:str) -> bool:
+        return self.get(page) is not None
+
+    def reindex(self) -> None:
+        '''Build the index again from the list of pages'''
+        self.by_section : dict[str, dict] = {}
+        self.by_display_name : dict[str, list[dict]] = {}
+        # Names of the indexed pages, by id of page dict
+        self._names : dict[int, tuple] = {}
+        for page_dict in self.pages_list:
+            self.add_page(page_dict)
+
+        return None
+
+    def _refresh(self) -> bool:
+        '''Rebuild the index if pages changed without it
+
+        Returns:
+            bool: If the index was rebuilt.
+        '''
+        if len(self._names) == len(self.pages_list) and all(
+            self._names.get(id(page_dict)) == (
+                page_dict.get('name'), page_dict.get('displayName'))
+            for page_dict in self.pages_list):
+            return False
+        self.reindex()
+
+        return True
+
+    def add_page(self, page_dict:dict) -> None:
+        '''Index a page added to the list of pages'''
+        self.by_section.setdefault(page_dict.get('name'), page_dict)
+        self.by_display_name.setdefault(
+            page_dict.get('displayName'), []).append(page_dict)
+        self._names[id(page_dict)] = (
+            page_dict.get('name'), page_dict.get('displayName'))
+
+        return None
+
+    def remove_page(self, page_dict:dict) -> None:
+        '''Take out of the index a page removed from the list of pages'''
+        if self.by_section.get(page_dict.get('name')) is page_dict:
+            del self.by_section[page_dict.get('name')]
+        bucket = self.by_display_name.get(page_dict.get('displayName'), [])
+        for i, other in enumerate(bucket):
+            if other is page_dict:
+                del bucket[i]
+                break
+        if not bucket:
+            self.by_display_name.pop(page_dict.get('displayName'), None)
+        self._names.pop(id(page_dict), None)
+
+        return None
+
+    def section(self, section_name:str) -> dict | None:
+        '''Return the page of a section name, None if there is none'''
+        page_dict = self.by_section.get(section_name)
+        if page_dict is not None and page_dict.get('name') == section_name:
+            return page_dict
+        if not self._refresh():
+            return None
+
+        return self.by_section.get(section_name)
+
+    def pages(self, display_name:str) -> list[dict]:
+        '''Return the pages of a display name, in the order of the list'''
+        bucket = self.by_display_name.get(display_name)
+        if bucket and all(
+            page_dict.get('displayName') == display_name
+            for page_dict in bucket):
+            return list(bucket)
+        if not self._refresh():
+            return []
+
+        return list(self.by_display_name.get(display_name, []))
+
+    def get(self, page:str) -> dict | None:
+        '''Return a page by display name or section name
+
+        The display name is looked up first. With repeated display names,
+        the first page of the list is returned.
+
+        Args:
+            page (str): Display name or section name.
+
+        Returns:
+            dict | None: The page dict, None if there is none.
+        '''
+        bucket = self.by_display_name.get(page)
+        if bucket and bucket[0].get('displayName') == page:
+            return bucket[0]
+        page_dict = self.by_section.get(page)
+        if page_dict is not None and page_dict.get('name') == page:
+            return page_dict
+
+        # Found with another name, or pages changed without the index
+        if not self._refresh():
+            return None
+        bucket = self.by_display_name.get(page)
+
+        return bucket[0] if bucket else self.by_section.get(page)
+
+
+def bookmark_dicts(bookmarks_list:list[dict]) -> Iterator[dict]:
+    '''Yield the single bookmark dicts of a `bookmarks` list
+
+    Groups are not yielded, their children are.
+
+    Args:
+        bookmarks_list (list[dict]): The `bookmarks` key of the report 
+            config, or some of its items.
+    '''
+    for bookmark_dict in bookmarks_list:
+        if 'children' in bookmark_dict:
+            yield from bookmark_dict.get('children') or []
+        else:
+            yield bookmark_dict
+
+
+def bookmark_visual_ids(bookmark_dict:dict) -> set[str]:
+    '''Return the ids of visuals referenced by a bookmark dict
+
+    Args:
+        bookmark_dict (dict): A single bookmark dict.
+
+    Returns:
+        set[str]: Ids in `targetVisualNames` and in `visualContainers` of
+            all sections.
+    '''
+    visual_ids = set(
+        bookmark_dict
+        .get('options', {})
+        .get('targetVisualNames', [])
+    )
+    sections = bookmark_dict.get('explorationState', {}).get('sections', {})
+    for section in sections.values():
+        visual_ids.update(section.get('visualContainers', {}))
+
+    return visual_ids
+
+
+def remap_bookmark_dict(bookmark_dict:dict, id_mapping:dict[str, str],
+    section_mapping:dict[str, str] | None = None) -> None:
+    '''Change the ids of visuals and pages referenced by a bookmark dict
+
+    The dict is changed in place, keeping the order of targets and 
+    containers, since ``Bookmark`` objects may hold its inner dicts.
+
+    Args:
+        bookmark_dict (dict): A single bookmark dict.
+        id_mapping (dict[str, str]): New visual id by old id.
+        section_mapping (dict[str, str] | None, optional): New section name
+            by old one, for `activeSection` and the keys of `sections`. 
+            Defaults to None, sections are kept.
+    '''
+    options = bookmark_dict.get('options', {})
+    targets = options.get('targetVisualNames', [])
+    targets[:] = [id_mapping.get(target, target) for target in targets]
+
+    exploration_state = bookmark_dict.get('explorationState', {})
+    sections = exploration_state.get('sections', {})
+    for section in sections.values():
+        containers = section.get('visualContainers', {})
+        remapped = {
+            id_mapping.get(visual_id, visual_id): state
+            for visual_id, state in containers.items()
+        }
+        containers.clear()
+        containers.update(remapped)
+
+    if section_mapping:
+        active_section = exploration_state.get('activeSection')
+        if active_section in section_mapping:
+            exploration_state['activeSection'] = section_mapping[active_section]
+        remapped = {
+            section_mapping.get(name, name): section
+            for name, section in sections.items()
+        }
+        sections.clear()
+        sections.update(remapped)
+
+    return None
+
+
+class BookmarkIndex():
+    '''Index of references between bookmarks and visuals
+
+    Each bookmark (by its `name` key) points to the ids of visuals it 
+    references and each visual id points to the bookmarks that reference it.
+    Bookmark dicts are the ones of the report config, so changes made 
+    through the index, like ``remove_visual`` or ``remap_visuals``, are 
+    changes of the report.
+
+    Bookmark dicts changed in another way should be indexed again by
+    ``update_bookmark``.
+
+    Args:
+        bookmarks_list (list[dict] | None, optional): The `bookmarks` key of
+            the report config. Defaults to None.
+
+    Attributes:
+        bookmarks (dict): Single bookmark dicts by their name.
+        bookmark_visuals (dict): Ids of visuals by bookmark name.
+        visual_bookmarks (dict): Bookmark names by visual id.
+    '''
+
+    def __init__(self, bookmarks_list:list[dict] | None = None) -> None:
+        self.bookmarks : dict[str, dict] = {}
+        self.bookmark_visuals : dict[str, set[str]] = {}
+        self.visual_bookmarks : dict[str, set[str]] = {}
+
+        for bookmark_dict in bookmarks_list or []:
+            self.add_bookmark(bookmark_dict)
+
+    def __repr__(self) -> str:
+        return (f'BookmarkIndex({len(self.bookmarks)} bookmarks, '
+            f'{len(self.visual_bookmarks)} visuals)')
+
+    def __len__(self) -> int:
+        return len(self.bookmarks)
+
+    def __contains__(self, visual_id:str) -> bool:
+        return visual_id in self.visual_bookmarks
+
+    def add_bookmark(self, bookmark_dict:dict) -> None:
+        '''Index a bookmark dict, or the children of a group dict'''
+        for single_dict in bookmark_dicts([bookmark_dict]):
+            name = single_dict.get('name')
+            if name in self.bookmarks:
+                self.remove_bookmark(name)
+
+            visual_ids = bookmark_visual_ids(single_dict)
+            self.bookmarks[name] = single_dict
+            self.bookmark_visuals[name] = visual_ids
+            for visual_id in visual_ids:
+                self.visual_bookmarks.setdefault(visual_id, set()).add(name)
+
+        return None
+
+    def remove_bookmark(self, name:str) -> None:
+        '''Take a bookmark out of the index, by its name'''
+        self.bookmarks.pop(name, None)
+        for visual_id in self.bookmark_visuals.pop(name, set()):
+            names = self.visual_bookmarks.get(visual_id, set())
+            names.discard(name)
+            if not names:
+                self.visual_bookmarks.pop(visual_id, None)
+
+        return None
+
+    def update_bookmark(self, name:str) -> None:
+        '''Index again a bookmark, after its dict was changed'''
+        bookmark_dict = self.bookmarks.get(name)
+        if bookmark_dict is not None:
+            self.add_bookmark(bookmark_dict)
+
+        return None
+
+    def bookmarks_of(self, visual_id:str) -> list[dict]:
+        '''Return the bookmark dicts that reference a visual
+
+        Args:
+            visual_id (str): Id of the visual.
+
+        Returns:
+            list[dict]: Single bookmark dicts, empty if there are none.
+        '''
+        return [
+            self.bookmarks[name]
+            for name in self.visual_bookmarks.get(visual_id, set())
+        ]
+
+    def visuals_of(self, name:str) -> set[str]:
+        '''Return the ids of visuals referenced by a bookmark, by its name'''
+        return set(self.bookmark_visuals.get(name, set()))
+
+    def dangling(self, visual_ids:set[str]) -> dict[str, set[str]]:
+        '''Return references to visuals that are not in the report
+
+        Only the referenced ids are checked, not each bookmark.
+
+        Args:
+            visual_ids (set[str]): Ids of all visuals of the report.
+
+        Returns:
+            dict[str, set[str]]: Ids of missing visuals by bookmark name.
+        '''
+        dangling : dict[str, set[str]] = {}
+        for visual_id, names in self.visual_bookmarks.items():
+            if visual_id not in visual_ids:
+                for name in names:
+                    dangling.setdefault(name, set()).add(visual_id)
+
+        return dangling
+
+    def remove_visual(self, visual_id:str) -> list[str]:
+        '''Remove the references to a visual from bookmarks
+
+        The id is taken out of `targetVisualNames` and of `visualContainers`
+        of all sections of the bookmarks that reference it.
+
+        Args:
+            visual_id (str): Id of the removed visual.
+
+        Returns:
+            list[str]: Names of the bookmarks changed.
+        '''
+        names = list(self.visual_bookmarks.pop(visual_id, set()))
+        for name in names:
+            bookmark_dict = self.bookmarks[name]
+            options = bookmark_dict.get('options', {})
+            targets = options.get('targetVisualNames', [])
+            if visual_id in targets:
+                targets[:] = [
+                    target for target in targets if target != visual_id]
+            sections = (
+                bookmark_dict.get('explorationState', {}).get('sections', {}))
+            for section in sections.values():
+                section.get('visualContainers', {}).pop(visual_id, None)
+            self.bookmark_visuals[name].discard(visual_id)
+
+        return names
+
+    def remap_visuals(self, id_mapping:dict[str, str],
+        names:list[str] | None = None) -> list[str]:
+        '''Change the ids of visuals referenced by bookmarks
+
+        Use it when visuals get new ids, or on copies of bookmark dicts for
+        copies of visuals. The order of targets and containers is kept.
+
+        Args:
+            id_mapping (dict[str, str]): New id by old id.
+            names (list[str] | None, optional): Only remap these bookmarks.
+                Defaults to None, all bookmarks that reference an old id.
+
+        Returns:
+            list[str]: Names of the bookmarks changed.
+        '''
+        changed = set()
+        for old_id in id_mapping:
+            changed.update(self.visual_bookmarks.get(old_id, set()))
+        if names is not None:
+            changed.intersection_update(names)
+
+        for name in changed:
+            bookmark_dict = self.bookmarks[name]
+            remap_bookmark_dict(bookmark_dict, id_mapping)
+            self.add_bookmark(bookmark_dict)
+
+        return list(changed)
@@ -0,0 +1,294 @@
+'''Module for a read-only view of a Power BI report
+
+``PBIReport`` builds an object for each visual and bookmark to edit them.
+When only the inventory of a report is needed (pages, visuals, types,
+positions, titles and fields), ``PBIInspector`` walks the layout once and
+gathers these fields straight into columns, without the object model.
+
+The functions of this module summarize visual configs and are shared with
+``PBIReport.resume_report_visuals``.
+'''
+
+import importlib.util
+
+import pandas as pd
+
+from ..functions.functions import load_json
+from ..functions.layoutcache import (layout_cache_path, read_layout_cache,
+    write_layout_cache)
+from .pbifile import PBIXFile
+
+# Columns of visuals inventory, in order
+VISUAL_COLUMNS = ('visualid', 'type', 'displaymode', 'position_x',
+    'position_y', 'width', 'height', 'title', 'subtitle', 'fields', 'groupname',
+    'groupid', 'pagename', 'pageid')
+
+
+def literal_text(single_visual:dict, object_name:str) -> str:
+    '''Return the text of a visual object, like `title`, without quotes
+
+    Args:
+        single_visual (dict): The `singleVisual` key of a visual config.
+        object_name (str): Key of `vcObjects`, like `title` or `subTitle`.
+
+    Returns:
+        str: The text, empty if there is none.
+    '''
+    objects = single_visual.get('vcObjects', {}).get(object_name) or [{}]
+
+    return (
+        objects[0]
+        .get('properties', {})
+        .get('text', {})
+        .get('expr', {})
+        .get('Literal', {})
+        .get('Value', '')
+        [1:-1]
+    )
+
+
+def group_names(configs:list[dict]) -> dict:
+    '''Return names of visual groups of a page, by group id
+
+    Args:
+        configs (list[dict]): Decoded configs of the visuals of a page.
+
+    Returns:
+        dict: Display names of groups by their id.
+    '''
+    return {
+        config.get('name'): config['singleVisualGroup'].get('displayName')
+        for config in configs
+        if config.get('singleVisualGroup')
+    }
+
+
+def append_visuals_summary(columns:dict[str, list], configs:list[dict],
+    page_name:str, page_id:str) -> None:
+    '''Append a row for each visual of a page to the inventory columns
+
+    Args:
+        columns (dict[str, list]): Lists by name of ``VISUAL_COLUMNS``.
+        configs (list[dict]): Decoded configs of the visuals of a page.
+        page_name (str): Display name of the page.
+        page_id (str): Section name of the page.
+    '''
+    groups = group_names(configs)
+    for config in configs:
+        single_visual = config.get('singleVisual', {})
+        layout = (config.get('layouts') or [{}])[0]
+        position = layout.get('position') or {}
+        projections = single_visual.get('projections', {})
+        group_id = config.get('parentGroupName', '')
+
+        columns['visualid'].append(str(config.get('name')))
+        columns['type'].append(single_visual.get('visualType', None))
+        columns['displaymode'].append(
+            single_visual.get('display', {}).get('mode', 'show'))
+        columns['position_x'].append(position.get('x'))
+        columns['position_y'].append(position.get('y'))
+        columns['width'].append(position.get('width'))
+        columns['height'].append(position.get('height'))
+        columns['title'].append(literal_text(single_visual, 'title'))
+        columns['subtitle'].append(literal_text(single_visual, 'subTitle'))
+        columns['fields'].append(
+            {
+                k: [cat.get('queryRef', '') for cat in projections.get(k, [{}])]
+                for k in projections
+            }
+        )
+        columns['groupname'].append(groups.get(group_id, ''))
+        columns['groupid'].append(group_id)
+        columns['pagename'].append(page_name)
+        columns['pageid'].append(page_id)
+
+    return None
+
+
+def visuals_dataframe(columns:dict[str, list],
+    dtype_backend:str|None=None) -> pd.DataFrame:
+    '''Return the inventory columns as a dataframe indexed by page name
+
+    Args:
+        columns (dict[str, list]): Lists by name of ``VISUAL_COLUMNS``.
+        dtype_backend (str | None, optional): `numpy_nullable` or `pyarrow`
+            to convert dtypes with ``pd.DataFrame.convert_dtypes``. Defaults
+            to None, numpy dtypes.
+
+    Raises:
+        ValueError: If `pyarrow` is asked and it is not installed.
+
+    Returns:
+        pd.DataFrame: One row for each visual.
+    '''
+    if dtype_backend == 'pyarrow' and importlib.util.find_spec(
+        'pyarrow') is None:
+        raise ValueError("dtype_backend 'pyarrow' needs pyarrow installed")
+
+    _df = pd.DataFrame(columns, columns=list(VISUAL_COLUMNS))
+    if dtype_backend is not None:
+        _df = _df.convert_dtypes(dtype_backend=dtype_backend) # type: ignore
+
+    return _df.set_index('pagename')
+
+
+class PBIInspector(PBIXFile):
+    '''Class for a read-only and fast view of a Power BI report
+
+    The layout is read once and only visual configs are decoded. Nothing can
+    be changed or saved, for that use ``PBIReport``.
+
+    Args:
+        pbix_path (str): Path of the Power BI report file.
+        cache_dir (str | None, optional): Folder to cache the inventory. Cache
+            files are keyed by the CRC32 and size of `Report/Layout`, so an
+            unchanged report is inspected again without reading its layout.
+            Defaults to None, no cache.
+
+    Attributes:
+        pbix_path (str): Path of the Power BI report file.
+        cache_dir (str | None): Folder of the inventory cache.
+        layout_pbi_dict (dict): A python dict from report layout JSON. It is
+            read on first access.
+        pages_list (list): List of dicts representing report pages
+    '''
+
+    def __init__(self, pbix_path:str, cache_dir:str|None=None) -> None:
+        super().__init__(pbix_path=pbix_path)
+
+        self.cache_dir = cache_dir
+        self.__layout_pbi_dict : dict | None = None
+        # Pages as (ordinal, display name, section name) and visuals columns
+        self.__pages : list[tuple] | None = None
+        self.__columns : dict[str, list] | None = None
+
+        self.__cache_file = None
+        if cache_dir:
+            self.__cache_file = layout_cache_path(cache_dir,
+                self.pbix.getinfo('Report/Layout'), kind='inventory',
+                signature=VISUAL_COLUMNS)
+            cached = read_layout_cache(self.__cache_file)
+            if cached is not None:
+                self.__pages, self.__columns = cached
+
+    def __repr__(self) -> str:
+        return f'PBIInspector({self.report_name})'
+
+    @property
+    def layout_pbi_dict(self) -> dict:
+        if self.__layout_pbi_dict is None:
+            self.__layout_pbi_dict = load_json(
+                self.extract_layout_and_encoding())
+
+        return self.__layout_pbi_dict # type: ignore
+
+    @property
+    def pages_list(self) -> list[dict]:
+        return self.layout_pbi_dict.get('sections', [])
+
+    def __list_pages(self) -> list[tuple]:
+        if self.__pages is None:
+            self.__pages = [
+                (page.get('ordinal'), page.get('displayName'), page.get('name'))
+                for page in self.pages_list
+            ]
+
+        return self.__pages
+
+    def __all_columns(self) -> dict[str, list]:
+        '''Return the inventory of all pages, writing the cache if needed'''
+        if self.__columns is None:
+            columns = {name: [] for name in VISUAL_COLUMNS}
+            for page in self.pages_list:
+                append_visuals_summary(columns, self.__page_configs(page),
+                    page.get('displayName'), page.get('name'))
+            self.__columns = columns
+
+            if self.__cache_file:
+                try:
+                    write_layout_cache(self.__cache_file, self.__list_pages(),
+                        columns)
+                except OSError: # the cache is optional
+                    pass
+
+        return self.__columns
+
+    @staticmethod
+    def __page_configs(page:dict) -> list[dict]:
+        configs = []
+        for visual_dict in page.get('visualContainers', []):
+            config = visual_dict.get('config', '{}')
+            configs.append(load_json(config) if isinstance(config, str)
+                else config)
+
+        return configs
+
+    def resume_report_pages(self) -> dict:
+        '''This method return a dict with page information
+
+        Returns:
+            info_dict (dict): A dict with page position, display name and id.
+        '''
+        return {
+            position: [display_name, name]
+            for position, display_name, name in self.__list_pages()
+        }
+
+    def visuals_columns(self, page_name:str='') -> dict[str, list]:
+        '''Return the inventory of visuals as columns
+
+        Args:
+            page_name (str, optional): The page to inventory. Defaults to '',
+                all pages.
+
+        Raises:
+            ValueError: If the page is not found in report.
+
+        Returns:
+            dict[str, list]: Lists by name of ``VISUAL_COLUMNS``. Each visual
+                has a position in all lists.
+        '''
+        if not page_name:
+            return {
+                name: list(values)
+                for name, values in self.__all_columns().items()
+            }
+
+        if page_name not in [page[1] for page in self.__list_pages()]:
+            raise ValueError(f'{page_name} was not found in report')
+
+        if self.__columns is not None:
+            rows = [
+                i for i, name in enumerate(self.__columns['pagename'])
+                if name == page_name
+            ]
+            return {
+                name: [values[i] for i in rows]
+                for name, values in self.__columns.items()
+            }
+
+        columns = {name: [] for name in VISUAL_COLUMNS}
+        for page in self.pages_list:
+            if page.get('displayName') == page_name:
+                append_visuals_summary(columns, self.__page_configs(page),
+                    page_name, page.get('name'))
+
+        return columns
+
+    def resume_report_visuals(self, page_name:str='',
+        dtype_backend:str|None=None) -> pd.DataFrame:
+        '''Method to return a dataframe of information of visuals in report
+
+        Same result of ``PBIReport.resume_report_visuals``, without building
+        the report objects.
+
+        Args:
+            page_name (str): The page name that desire retrieve visuals of.
+            dtype_backend (str | None, optional): `numpy_nullable` or
+                `pyarrow` backed dtypes. Defaults to None, numpy dtypes.
+
+        Returns:
+            pd.DataFrame: A dataframe with all report visuals
+        '''
+        return visuals_dataframe(self.visuals_columns(page_name),
+            dtype_backend)
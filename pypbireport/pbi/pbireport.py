@@ -2,18 +2,28 @@
 
 '''
 
-import json
 import pandas as pd
 import copy
+from typing import Any, Iterator
 
-from ..functions.functions import hex_code
+from ..functions.functions import hex_code, dump_json, load_json
 from ..functions.pprlist import PPRList
+from ..functions.fields import field_parts, rename_field_references
+from ..functions.layoutcache import (layout_cache_path, read_layout_cache,
+    write_layout_cache)
 from ..constants.structures import *
 from ..constants import bookmarks
 
 from .pbifile import PBIXFile
+from .pbiinspector import (VISUAL_COLUMNS, append_visuals_summary,
+    visuals_dataframe)
+from .pbiindex import (BookmarkIndex, FieldUsageIndex, PageIndex,
+    remap_bookmark_dict)
 from .pbivisual import *
-from .pbibookmark import Bookmark, BookmarkGroup
+from .pbibookmark import Bookmark, BookmarkGroup, toggle_bookmarks
+
+# Cached attribute values depend on them, see ``layout_cache_path``
+CACHE_SIGNATURE = (DICT_ATTRS, pre_set, pre_set_fields, attributes_visual_dict)
 
 
 class PBIReport(PBIXFile):    
@@ -21,40 +31,100 @@ class PBIReport(PBIXFile):
 
     Args:
         pbix_path (str): Path of the Power BI report file.
+        lean (bool, optional): Memory lean mode. The layout string is only
+            built by ``save_changes``, visuals don't keep their original 
+            snapshot (``original_visual`` is None) and their dicts are kept
+            as JSON strings until accessed. Useful when many reports are 
+            open at once. Defaults to False.
+        cache_dir (str | None, optional): Folder to cache the parsed layout
+            and the attributes of visuals. Cache files are keyed by the CRC32
+            and size of `Report/Layout`, so an unchanged report is reopened 
+            without decoding any JSON. Defaults to None, no cache.
+        pages (list[str] | None, optional): Pages to load, by display name or
+            by section name. Visual objects are built only for them, the 
+            other pages stay as dicts with JSON strings and are written back 
+            as they are. More pages can be loaded by ``load_pages``. Defaults
+            to None, all pages.
     
     Attributes:
         pbix_path (str): Path of the Power BI report file.
+        lean (bool): If the report is in memory lean mode.
+        cache_dir (str | None): Folder of the parsed layout cache.
         layout_pbi_dict (dict): A python dict from report layout JSON
-        layout_pbi_str (str): A string from report layout JSON
+        layout_pbi_str (str): A string from report layout JSON. In lean mode,
+            it is empty until ``save_changes`` is called.
+        report_config (dict): The report config, with bookmarks. It is kept
+            decoded and written in `config` of ``layout_pbi_dict`` on save.
         pages_list (list): List of dicts representing report pages
+        page_index (PageIndex): Pages by display name and by section name,
+            see ``get_page``
         visuals (list): List of Visual objects of report
         pages_visuals (dict): A dict with the key as page name and the value as
-            list of Visual objects of each page
+            list of Visual objects of each page loaded
+        loaded_pages (set): Section names of pages with Visual objects
         bookmark (list): List of Bookmark objects of the report
-        bookmark_groups (list): List of BookmarkGroup objects of the report
+        bookmark_groups (list): List of BookmarkGroup objects of the report.
+            Their children are the same objects as in ``bookmarks``.
 
     '''
 
-    def __init__(self, pbix_path:str) -> None: 
+    def __init__(self, pbix_path:str, lean:bool=False,
+        cache_dir:str|None=None, pages:list[str]|None=None) -> None: 
         super().__init__(pbix_path=pbix_path)
 
-        self.layout_pbi_dict : dict = (
-            json.loads
-                (
-                    self.extract_layout_and_encoding()
-                )
-        )
-        self.layout_pbi_str = json.dumps(self.layout_pbi_dict)
+        self.lean = lean
+        self.cache_dir = cache_dir
+
+        # Attribute values of visuals by page and visual, from cache
+        cached_attrs : list | None = None
+        cached = None
+        if cache_dir:
+            cache_file = layout_cache_path(cache_dir, 
+                self.pbix.getinfo('Report/Layout'), 
+                signature=CACHE_SIGNATURE)
+            cached = read_layout_cache(cache_file)
+
+        if cached is not None:
+            self.layout_pbi_dict, cached_attrs = cached
+        else:
+            self.layout_pbi_dict : dict = (
+                load_json
+                    (
+                        self.extract_layout_and_encoding()
+                    )
+            )
+        # In lean mode, the string is built only when needed
+        self.layout_pbi_str = (
+            '' if lean else dump_json(self.layout_pbi_dict))
+
+        # Report config, decoded on first access and encoded again on save
+        self.__report_config : dict | None = None
+        self.__report_config_modified = False
 
         # Get pages
         self.pages_list : list[dict] = self.__list_pages()
 
-        # Get visuals
+        # Attribute values from cache, by id of visual dict, with the dict
+        self.__cached_attrs : dict[int, tuple[dict, dict]] = {}
+        for page, page_attrs in zip(self.pages_list, cached_attrs or []):
+            containers = page.get('visualContainers', [])
+            if len(containers) != len(page_attrs): #may not match the page
+                continue
+            for visual_dict, attr_values in zip(containers, page_attrs):
+                self.__cached_attrs[id(visual_dict)] = (visual_dict, attr_values)
+
+        # Get visuals, only of selected pages
+        self.__field_usage : FieldUsageIndex | None = None
         self.visuals : PPRList = PPRList()
         self.pages_visuals : dict = {}
-        self.__list_visuals()
+        self.loaded_pages : set[str] = set()
+        self.__list_visuals(
+            None if pages is None else self.__select_pages(pages))
+        if cache_dir and cached is None and pages is None:
+            self.__write_layout_cache(cache_file)
 
         # Get bookmarks
+        self.__bookmark_index : BookmarkIndex | None = None
         self.bookmarks : PPRList = PPRList()
         self.bookmark_groups : PPRList = PPRList()
         self.__list_bookmarks()
@@ -67,108 +137,393 @@ class PBIReport(PBIXFile):
         """
         return ' '.join(_.split())
 
+    def __write_layout_cache(self, cache_file:str) -> None:
+        '''Write the layout and the attributes of visuals in cache
+
+        Args:
+            cache_file (str): Path of the cache file.
+        '''
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+        attr_values = [
+            [
+                visuals_by_dict[id(visual_dict)].attr_values()
+                for visual_dict in page.get('visualContainers', [])
+            ]
+            for page in self.pages_list
+        ]
+        try:
+            write_layout_cache(cache_file, self.__serialized_layout(), 
+                attr_values)
+        except OSError: # the cache is optional, the report isn't
+            pass
+
+        return None
+
     def __list_pages(self) -> list[dict]:
-        ''''''
+        '''Return the pages of the layout, indexing them when they change'''
         self.pages_list = self.layout_pbi_dict.get('sections', [{}])
+        page_index = getattr(self, 'page_index', None)
+        if page_index is None or page_index.pages_list is not self.pages_list:
+            self.page_index = PageIndex(self.pages_list)
 
         return self.pages_list
 
-    def __list_visuals(self)-> None:
-        ''''''
+    def __select_pages(self, pages:list[str]) -> set[str]:
+        '''Return section names of pages, given by display or section name
 
-        info_dict : dict = {}
-        
-        self.visuals : PPRList = PPRList()
+        Raises:
+            ValueError: If a page is not found in report.
+        '''
+        page_ids = set()
+        for page_name in pages:
+            found = [
+                page.get('name') 
+                for page in self.page_index.pages(page_name)
+            ]
+            section = self.page_index.section(page_name)
+            if section is not None:
+                found.append(page_name)
+            if not found:
+                raise ValueError(f'{page_name} was not found in report')
+            page_ids.update(found)
+
+        return page_ids
+
+    def __list_visuals(self, page_ids:set[str] | None = None)-> None:
+        '''Method to initiate visuals list in class
+
+        Visual objects are added to ``visuals`` and ``pages_visuals``, for 
+        pages not loaded yet. Visual dicts that already have an object, like
+        those inserted in a page not loaded, are skipped. Attribute values 
+        read from cache are used for the visual dicts they were read from.
+
+        Args:
+            page_ids (set[str] | None, optional): Section names of pages to 
+                load. Defaults to None, all pages.
+        '''
+
+        info_dict : dict = self.pages_visuals
+        # Visual dicts with objects, only needed once some page is loaded
+        loaded_dicts = (
+            {id(visual._visual) for visual in self.visuals} 
+            if self.loaded_pages else set()
+        )
         
         for page in self.pages_list:
             page_name = page.get('displayName')
             page_id = page.get('name')
+            if page_id in self.loaded_pages: 
+                continue
+            if page_ids is not None and page_id not in page_ids: 
+                continue
+            self.loaded_pages.add(page_id)
             info_dict.setdefault(page_name, PPRList())
         
             visuals_list = PPRList()
             
             for visual_dict in page.get('visualContainers', {}):
-                visual = VisualInitializer(
-                    Visual(visual_dict, page_name, page_id)
-                )
+                if id(visual_dict) in loaded_dicts:
+                    continue
+                attr_values = self.__pop_cached_attrs(visual_dict)
+                visual = VisualInitializer(visual_dict, page_name, page_id,
+                    keep_original=not self.lean, attr_values=attr_values)
+                if self.lean:
+                    visual.release_dicts()
                 self.visuals.append(visual)
                 visuals_list.append(visual)
+            self.__index_visuals(visuals_list)
             
             info_dict.get(page_name).extend(visuals_list) # type: ignore
-        
-        self.pages_visuals = info_dict
 
         return None
 
-    def __list_bookmarks(self):
-        '''Method to initiate bookamrks list in class
+    def __pop_cached_attrs(self, visual_dict:dict) -> dict | None:
+        '''Return and forget the cached attribute values of a visual dict
 
-        Bookmarks are placed in the `config` field of the layout dict. The key 
-        `bookmarks` contains both single bookmaks and bookmark groups.
+        Call it for visual dicts changed before they have an object, so the
+        cached values are not used.
+        '''
+        visual_dict_cached, attr_values = self.__cached_attrs.pop(
+            id(visual_dict), (None, None))
+
+        return attr_values if visual_dict_cached is visual_dict else None
+
+    def __page_visuals_of(self, visual:Visual, page_name:str | None
+        ) -> PPRList | None:
+        '''Return the list of ``pages_visuals`` that holds a visual
+
+        The list of the page name is tried first. Names may be changed after
+        the visual was listed, so the other lists are searched too.
+        '''
+        page_visuals = self.pages_visuals.get(page_name)
+        for page_visuals in [page_visuals, *self.pages_visuals.values()]:
+            if page_visuals is not None and any(
+                item is visual for item in page_visuals):
+                return page_visuals
+
+        return None
+
+    def __index_visuals(self, visuals:list) -> None:
+        '''Add visuals to the field usage index, if it was built'''
+        if self.__field_usage is not None:
+            for visual in visuals:
+                self.__field_usage.add_visual(visual)
+
+        return None
+
+    def field_usage(self, rebuild:bool=False) -> FieldUsageIndex:
+        '''Return the index of fields and measures used by visuals
+
+        The index is built on first call, from the loaded visuals, and then
+        kept up to date when visuals are inserted, removed or have their 
+        field attributes set. 
+
+        Args:
+            rebuild (bool, optional): Build the index again, like after 
+                changing visual dicts by other ways. Defaults to False.
 
         Returns:
-            None. Assign Bookmakrs object to bookmarks_list variable.
+            FieldUsageIndex: Visuals, pages and roles by `Table.Field`, like
+                ``report.field_usage().visuals('Sales.Amount')``.
         '''
+        if self.__field_usage is None or rebuild:
+            if self.__field_usage is not None:
+                for visual in list(self.__field_usage.visual_fields):
+                    self.__field_usage.remove_visual(visual)
+            self.__field_usage = FieldUsageIndex(self.visuals)
 
-        def _create_bookmark_obj(bookmark_dict:dict) -> Bookmark:           
-            '''Method to create a Bookmark object from report layout JSON
+        return self.__field_usage
 
-            Starting from config.bookmarks path that came from report layout 
-            dict, this function extract main informations from bookmarks in 
-            oder to generate a Bookmark object. 
+    def bookmark_references(self, rebuild:bool=False) -> BookmarkIndex:
+        '''Return the index of references between bookmarks and visuals
 
-            Args:
-                bookmark_dict (dict): Bookmark key from report layout dict
+        The index is built on first call, from the bookmark dicts of the 
+        report config, and then kept up to date when bookmarks are inserted,
+        visuals or pages are removed and visual ids are remapped.
 
-            Returns:
-                Bookmark: A Bookmark object
-            '''            
-            active_section = (
-                bookmark_dict
-                .get('explorationState', {})
-                .get('activeSection')
-            )
-            visual_containers_dict = (
-                bookmark_dict
-                .get('explorationState', {})
-                .get('sections', {})
-                .get(active_section, {})
-                .get('visualContainers')
+        Args:
+            rebuild (bool, optional): Build the index again, like after 
+                changing bookmark dicts by other ways. Defaults to False.
+
+        Returns:
+            BookmarkIndex: Bookmarks by visual id and visual ids by bookmark,
+                like ``report.bookmark_references().bookmarks_of(visual.id)``.
+        '''
+        if self.__bookmark_index is None or rebuild:
+            self.__bookmark_index = BookmarkIndex(
+                self.__get_report_config().get('bookmarks', []))
+
+        return self.__bookmark_index
+
+    def __visual_ids(self, pages_list:list[dict], visuals:list) -> set[str]:
+        '''Return the ids of visuals of pages, loaded or not
+
+        Args:
+            pages_list (list[dict]): Page dicts.
+            visuals (list): Visual objects of these pages.
+        '''
+        visuals_by_dict = {id(visual._visual): visual for visual in visuals}
+        visual_ids = set()
+        for page_dict in pages_list:
+            for visual_dict in page_dict.get('visualContainers', []):
+                visual = visuals_by_dict.get(id(visual_dict))
+                if visual is not None:
+                    visual_ids.add(visual.id)
+                    continue
+                config = visual_dict.get('config', '{}') #page not loaded
+                config = load_json(config) if isinstance(config, str) else config
+                visual_ids.add(config.get('name'))
+
+        return visual_ids
+
+    def dangling_bookmark_references(self, 
+        remove:bool=False) -> dict[str, list[str]]:
+        '''Return the references of bookmarks to visuals not in the report
+
+        They are left by visuals removed or given new ids without going 
+        through this class. Pages not loaded are checked too.
+
+        Args:
+            remove (bool, optional): Also take these references out of the 
+                bookmarks. Defaults to False.
+
+        Returns:
+            dict[str, list[str]]: Ids of missing visuals by bookmark name.
+        '''
+        bookmark_index = self.bookmark_references()
+        dangling = bookmark_index.dangling(
+            self.__visual_ids(self.pages_list, self.visuals))
+
+        if remove and dangling:
+            for visual_id in set().union(*dangling.values()):
+                bookmark_index.remove_visual(visual_id)
+            self.__report_config_modified = True
+
+        return {name: sorted(ids) for name, ids in dangling.items()}
+
+    def __remove_bookmark_references(self, visuals:list) -> None:
+        '''Take removed visuals out of bookmark dicts and objects'''
+        bookmark_index = self.bookmark_references()
+        changed = set()
+        for visual in visuals:
+            changed.update(bookmark_index.remove_visual(visual.id))
+        if not changed:
+            return None
+        self.__report_config_modified = True
+
+        # Objects of the changed bookmarks and their groups
+        for bookmark in self.bookmarks:
+            if bookmark.id in changed:
+                for visual in visuals:
+                    for bookmark_visuals in (bookmark.show_visuals, 
+                        bookmark.hide_visuals, bookmark.target_visuals):
+                        while visual in bookmark_visuals:
+                            bookmark_visuals.remove(visual)
+        for bookmark_group in self.bookmark_groups:
+            for visual in visuals:
+                while visual in bookmark_group.target_visuals:
+                    bookmark_group.target_visuals.remove(visual)
+
+        return None
+
+    def load_pages(self, pages:list[str] | None = None) -> None:
+        '''Build Visual objects of pages not loaded yet
+
+        Bookmarks are listed again, to target the new visuals.
+
+        Args:
+            pages (list[str] | None, optional): Pages to load, by display name
+                or by section name. Defaults to None, all pages.
+        '''
+        self.__list_visuals(
+            None if pages is None else self.__select_pages(pages))
+        self.__list_bookmarks()
+
+        return None
+
+    @property
+    def report_config(self) -> dict:
+        '''The report config, decoded once and marked as modified'''
+        self.__report_config_modified = True
+
+        return self.__get_report_config()
+
+    def __get_report_config(self) -> dict:
+        '''Return the decoded report config, without marking it modified'''
+        if self.__report_config is None:
+            config = self.layout_pbi_dict.get('config', '{}') #clean reports
+            self.__report_config = (
+                load_json(config) if isinstance(config, str) else config)
+
+        return self.__report_config # type: ignore
+
+    def __sync_report_config(self) -> None:
+        '''Write the report config in the layout dict, if it was modified'''
+        if self.__report_config_modified:
+            self.layout_pbi_dict['config'] = dump_json(self.__report_config)
+            self.__report_config_modified = False
+
+        return None
+
+    def __bookmark_object(self, bookmark_dict:dict, 
+        loaded_ids:set[str]) -> Bookmark:
+        '''Method to create a Bookmark object from report layout JSON
+
+        Starting from config.bookmarks path that came from report layout 
+        dict, this function extract main informations from bookmarks in 
+        oder to generate a Bookmark object. 
+
+        Args:
+            bookmark_dict (dict): Bookmark key from report layout dict
+            loaded_ids (set[str]): Ids of visuals with objects, see `pages`
+                of the class.
+
+        Returns:
+            Bookmark: A Bookmark object
+        '''
+        active_section = (
+            bookmark_dict
+            .get('explorationState', {})
+            .get('activeSection')
+        )
+        visual_containers_dict = (
+            bookmark_dict
+            .get('explorationState', {})
+            .get('sections', {})
+            .get(active_section, {})
+            .get('visualContainers', {})
+        )
+        targets = set(
+            bookmark_dict
+            .get("options", {})
+            .get("targetVisualNames", [])
+        )
+        
+        show_visuals = PPRList()
+        hide_visuals = PPRList()
+        for visual_id, visual_dict in visual_containers_dict.items():
+            # Visuals of pages not loaded are left out
+            if visual_id in targets and visual_id in loaded_ids:
+                mode = ( 
+                    visual_dict
+                    .get('singleVisual', {})
+                    .get('display', {'mode': bookmarks.SHOW}) #if none,show
+                    .get('mode')
+                )
+                if mode == bookmarks.SHOW:
+                    show_visuals.append(self.visuals[visual_id])
+                elif mode == bookmarks.HIDE:
+                    hide_visuals.append(self.visuals[visual_id])
+        
+        return Bookmark(
+                bookmark_name=bookmark_dict.get('displayName', ''),
+                id=bookmark_dict.get('name', ''),
+                show_visuals=show_visuals,
+                hide_visuals=hide_visuals
             )
-            targets = (
-                bookmark_dict
-                .get("options", {})
-                .get("targetVisualNames", [])
+
+    def __add_bookmark_objects(self, bookmark_dict:dict, 
+        loaded_ids:set[str]) -> None:
+        '''Add the objects of a bookmark or group dict to the lists'''
+        # If there is a children key, then it is a group of bookmarks
+        if bookmark_dict.get('children'):
+            # Run over the inner bookmarks, each object is built once and 
+            # shared by the flat list and the group
+            group_children = PPRList(
+                self.__bookmark_object(book_dict_inner, loaded_ids)
+                for book_dict_inner in bookmark_dict.get('children')
             )
-            
-            show_visuals = PPRList()
-            hide_visuals = PPRList()
-            for visual_id, visual_dict in visual_containers_dict.items():
-                if visual_id in targets:
-                    mode = ( 
-                        visual_dict
-                        .get('singleVisual', {})
-                        .get('display', {'mode': bookmarks.SHOW}) #if none,show
-                        .get('mode')
-                    )
-                    if mode == bookmarks.SHOW:
-                        show_visuals.append(self.visuals[visual_id])
-                    elif mode == bookmarks.HIDE:
-                        hide_visuals.append(self.visuals[visual_id])
-            
-            return Bookmark(
-                    bookmark_name=bookmark_dict.get('displayName', ''),
-                    id=bookmark_dict.get('name', ''),
-                    show_visuals=show_visuals,
-                    hide_visuals=hide_visuals
+            self.bookmarks.extend(group_children)
+            self.bookmark_groups.append(
+                BookmarkGroup(
+                bookmark_group_name=bookmark_dict.get('displayName')
+                ,id=bookmark_dict.get('name'),
+                children_list=group_children
                 )
-        
+            )
+        else:    
+            # If it`s not a group, just append it to list
+            self.bookmarks.append(
+                self.__bookmark_object(bookmark_dict, loaded_ids)
+            )
+
+        return None
+
+    def __list_bookmarks(self):
+        '''Method to initiate bookamrks list in class
+
+        Bookmarks are placed in the `config` field of the layout dict. The key 
+        `bookmarks` contains both single bookmaks and bookmark groups.
+
+        Returns:
+            None. Assign Bookmakrs object to bookmarks_list variable.
+        '''
+        # Ids of visuals with objects, see `pages` of the class
+        loaded_ids = {visual.id for visual in self.visuals}
+
         # Both single bookmarks and group are present in the bookmarks key
         report_bookmarks_list = (
-            json.loads( #config is a string as came from JSON
-                self.layout_pbi_dict
-                .get("config", "{}") #avoid errors for clean reports
-            )
+            self.__get_report_config()
             .get('bookmarks', []) #get bookmarks key from there
         )
 
@@ -178,29 +533,7 @@ class PBIReport(PBIXFile):
 
         # Run over the dicts of bookmarks in bookmark list
         for report_bookmark_dict in report_bookmarks_list:
-            # If there is a children key, then it is a group of bookmarks
-            if report_bookmark_dict.get('children'):
-                # Run over the inner bookmarks and get their dicts
-                group_children = PPRList()
-                for book_dict_inner in report_bookmark_dict.get('children'):
-                    self.bookmarks.append(
-                        _create_bookmark_obj(book_dict_inner)
-                    )
-                    group_children.append(
-                        _create_bookmark_obj(book_dict_inner)
-                    )
-                self.bookmark_groups.append(
-                    BookmarkGroup(
-                    bookmark_group_name=report_bookmark_dict.get('displayName')
-                    ,id=report_bookmark_dict.get('name'),
-                    children_list=group_children
-                    )
-                )
-            else:    
-                # If it`s not a group, just append it to list
-                self.bookmarks.append(
-                    _create_bookmark_obj(report_bookmark_dict)
-                )
+            self.__add_bookmark_objects(report_bookmark_dict, loaded_ids)
         
         return None
 
@@ -214,24 +547,36 @@ class PBIReport(PBIXFile):
             page_filter_list (list): List of page filtered
             
         '''
-        # List of pages with page_name filtered
-        page_filter_list = [
-            page 
-            for page in self.pages_list 
-            if page.get('displayName', '')==page_name 
-        ]
+        # List of pages with page_name, from the index
+        page_filter_list = self.page_index.pages(page_name)
 
         if len(page_filter_list) == 0:
             raise ValueError(f'{page_name} was not found in report')
         else:
             return page_filter_list
 
-    '''
-    Resume methods.
+    def get_page(self, page:str) -> dict:
+        '''Return a page dict by display name or by section name
+
+        Pages are looked up in ``page_index``, without scanning the list of
+        pages. With repeated display names, the first page is returned.
+
+        Args:
+            page (str): Display name or section name (like `ReportSection`
+                followed by an hexadecimal code) of the page.
+
+        Raises:
+            ValueError: If the page is not found in report.
+
+        Returns:
+            dict: The page dict of the layout.
+        '''
+        page_dict = self.page_index.get(page)
+        if page_dict is None:
+            raise ValueError(f'{page} was not found in report')
+
+        return page_dict
 
-    These methods don't modify report content, just give information on report
-    pages, visuals and bookmarks.
-    '''
     def resume_report_pages(self):
         '''This method return a dict with page information
         
@@ -251,183 +596,52 @@ class PBIReport(PBIXFile):
         
         return info_dict
 
-    def resume_report_visuals(self, page_name : str ='') -> pd.DataFrame:        
+    def resume_report_visuals(self, page_name : str ='',
+        dtype_backend : str | None = None) -> pd.DataFrame:
         '''Method to return a dataframe of information of visuals in report
-        
+
+        Columns are filled straight from the configs of loaded visuals, so
+        nothing is decoded again. Position and size are numeric columns
+        (`position_x`, `position_y`, `width` and `height`) to filter them
+        with vectorized operations.
+
         Args:
-            page_name (str): The page name that desire retrieve visuals of. 
-            
+            page_name (str): The page name that desire retrieve visuals of.
+            dtype_backend (str | None, optional): Backend of column dtypes,
+                `numpy_nullable` or `pyarrow` (it needs ``pyarrow``). See
+                ``pd.DataFrame.convert_dtypes``. Defaults to None, numpy
+                dtypes.
+
         Returns:
             pd.DataFrame: A dataframe with all report visuals
-            
+
         '''
         self.__list_pages()
 
-        info_dict = {} # page is the key, list of visuals are the values
-
         if page_name:
             page_list = self.__filter_page(page_name)
         else:
             page_list = self.pages_list
 
-        for page in page_list:
-            pagename_ = page.get('displayName')
-            pageid_ = page.get('name')
-            
-            visual_info_list = [] #list of visual info dicts
-            visual_group_dict = {} #group id is the key,group name is the value
-            visual_list = page.get('visualContainers', [])
-
-            # 1. Get groups in page
-            for visual_dict in visual_list:
-                # visual_config_dict = get_str_dict(visual_dict, 'config')
-                visual_config_dict = visual_dict['config']
-                is_a_group = visual_config_dict.get('singleVisualGroup', False)
-                if is_a_group:
-                    group_id_ = (
-                        visual_config_dict
-                        .get('name')
-                    )
-                    group_name_ = (
-                        visual_config_dict
-                        .get('singleVisualGroup')
-                        .get('displayName')
-                    )
-                    visual_group_dict.update({group_id_:group_name_})
-
-            # 2. Run over all visual
-            for visual_dict in visual_list:
-                                 
-                # visual_config_dict = json.loads(visual_dict.get('config'))
-                visual_config_dict = visual_dict.get('config')
-                visual_id_ = visual_config_dict.get('name')
-                type_ = (
-                    visual_config_dict
-                    .get('singleVisual', {})
-                    .get('visualType', None) 
-                )
-                position_ = {
-                    k:int(val) 
-                    for k,val in 
-                        (
-                            visual_config_dict
-                            .get('layouts', [{}])
-                            [0]
-                            .get('position', None) 
-                        ).items() 
-                    if k in ('x','y')
-                }
-                size_ = {
-                    k:int(val) 
-                    for k,val in 
-                        (
-                            visual_config_dict
-                            .get('layouts', [{}])
-                            [0]
-                            .get('position', None) 
-                        ).items() 
-                    if k in ('width','height')
-                }
-                title_ = (
-                    visual_config_dict
-                    .get('singleVisual', {})
-                    .get('vcObjects', {}) 
-                    .get('title', [{}])
-                    [0]
-                    .get('properties', {})
-                    .get('text', {})
-                    .get('expr', {})
-                    .get('Literal', {})
-                    .get('Value', '')
-                    [1:-1]
-                )
-                subtitle_ = (
-                    visual_config_dict
-                    .get('singleVisual', {})
-                    .get('vcObjects', {}) 
-                    .get('subTitle', [{}])
-                    [0]
-                    .get('properties', {})
-                    .get('text', {})
-                    .get('expr', {})
-                    .get('Literal', {})
-                    .get('Value', '')
-                    [1:-1]
-                )             
-                
-
-                group_id_ = (
-                    visual_config_dict
-                    .get('parentGroupName', '')
-                )
-
-                group_name_ = visual_group_dict.get(group_id_, '')
-                
-                projections_dict = (
-                    visual_config_dict
-                    .get('singleVisual', {})
-                    .get('projections', {})
-                )
-
-                fields_ = {
-                    k: 
-                        [
-                            cat.get('queryRef', '')
-                            for cat in projections_dict.get(k, [{}])
-                        ]
-                    
-                    for k in projections_dict
-                }
-
-                displaymode_ = (
-                    visual_config_dict
-                    .get('singleVisual', {})
-                    .get('display', {})
-                    .get('mode', 'show')
-                )
-
-                visual_info_dict = {
-                        # 'py_tag':''
-                        'visualid':str(visual_id_)
-                        ,'type':type_
-                        ,'displaymode':displaymode_
-                        ,'position':position_
-                        ,'size':size_
-                        ,'title':title_
-                        ,'subtitle':subtitle_
-                        ,'fields':fields_
-                        ,'groupname':group_name_
-                        ,'groupid':group_id_
-                        ,'pagename':pagename_
-                        ,'pageid':pageid_
-                    } 
-            
-                visual_info_list.extend([visual_info_dict])
-
-                          
-
-            info_dict.update(
-                {
-                    pagename_:visual_info_list
-                }
-            )
-
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+        columns = {name: [] for name in VISUAL_COLUMNS}
 
-        _df = (
-            (
-                pd.json_normalize(
-                    pd.DataFrame([info_dict]) # type: ignore
-                    .T
-                    .rename(columns={0:'data'})
-                    .explode('data').data
-                    , 
-                    max_level = 0 
-                )
-            )
-            .set_index('pagename')
-        )
-
-        return _df
+        for page in page_list:
+            configs = []
+            for visual_dict in page.get('visualContainers', []):
+                visual = visuals_by_dict.get(id(visual_dict))
+                if visual is not None:
+                    configs.append(visual._peek_dict('config'))
+                    continue
+                #page not loaded
+                config = visual_dict.get('config', '{}')
+                configs.append(load_json(config) if isinstance(config, str)
+                    else config)
+
+            append_visuals_summary(columns, configs, page.get('displayName'),
+                page.get('name'))
+
+        return visuals_dataframe(columns, dtype_backend)
 
     
     '''
@@ -442,43 +656,210 @@ class PBIReport(PBIXFile):
         page_name:str = 'ppr copy') -> None:
         '''This method duplicates a page in report
 
+        The copy is placed right after the page. See ``duplicate_page`` to 
+        create many copies at once.
+
         Args:
-            page_name (str): The page to duplicate.
+            page_to_duplicate (str): The page to duplicate.
+            page_name (str): The display name of the copy.
 
         '''
-                
-        page_to_duplicate_dict = self.__filter_page(page_to_duplicate)[0]
-        
-        copy_of_page_dict = copy.deepcopy(page_to_duplicate_dict)
+        self.duplicate_page(page_to_duplicate, [page_name], 
+            copy_bookmarks=False)
 
-        # Update values in copy
-        copy_of_page_dict.update(
-            {
-             'name':hex_code('ReportSection'), 
-             'displayName':page_name,
-             'ordinal': copy_of_page_dict.get('ordinal', None) + 1
-             }
-        )
+        return None
+
+    def duplicate_page(self, page:str, page_names:list[str],
+        copy_bookmarks:bool=True) -> list[dict]:
+        '''Create many copies of a page in one pass
 
-        # Update visuals ids
-        for visual in copy_of_page_dict.get('visualContainers', {}):
-            Visual(visual).id = hex_code()
+        Like a page for each region or customer. Each visual of the page is 
+        read once: its JSON strings are shared by the copies and only its 
+        `config` is written again, with a new id and the new id of its 
+        group (`parentGroupName`). Visuals of the page already loaded hand 
+        their attribute values to the new visuals, so they are not read 
+        again. Copies are placed right after the page, in the order of 
+        `page_names`, and ordinals are updated once at the end.
 
-        # Update ordinal of pages after page_to_duplicate
-        for page_dict in self.pages_list :
-            ordinal_to_copy = page_to_duplicate_dict.get('ordinal')
-            if page_dict.get('ordinal', None) > ordinal_to_copy:
-                page_dict.update(
+        Args:
+            page (str): Display name or section name of the page.
+            page_names (list[str]): Display names of the copies.
+            copy_bookmarks (bool, optional): Copy the bookmarks of the page
+                (with it as `activeSection`) for each copy, targeting its 
+                visuals. Copies of bookmarks in a group go to a copy of the 
+                group. Defaults to True.
+
+        Raises:
+            ValueError: If the page is not found in report.
+
+        Returns:
+            list[dict]: The page dicts of the copies.
+        '''
+        page_dict = self.get_page(page)
+        section_name = page_dict.get('name')
+        visuals_by_dict = {
+            id(visual._visual): visual 
+            for visual in self.pages_visuals.get(
+                page_dict.get('displayName'), [])
+        }
+
+        # Visuals as written in the layout, with decoded config and the
+        # attribute values, if known
+        sources = []
+        for visual_dict in page_dict.get('visualContainers', []):
+            visual = visuals_by_dict.get(id(visual_dict))
+            if visual is not None:
+                sources.append((visual.serialized_visual(), 
+                    visual._peek_dict('config'), visual.attr_values()))
+                continue
+            config = visual_dict.get('config', '{}') #page not loaded
+            sources.append((visual_dict, 
+                load_json(config) if isinstance(config, str) else config, 
+                None))
+        page_items = {
+            key: value for key, value in page_dict.items()
+            if key != 'visualContainers'
+        }
+        page_bookmarks = (
+            self.__page_bookmarks(section_name) if copy_bookmarks else [])
+
+        new_pages = []
+        new_visuals = PPRList()
+        new_bookmarks = []
+        for page_name in page_names:
+            new_page = copy.deepcopy(page_items)
+            new_page.update(
+                {
+                    'name': hex_code('ReportSection'),
+                    'displayName': page_name,
+                }
+            )
+            id_mapping = {
+                config.get('name'): hex_code() for _, config, _ in sources}
+
+            containers = []
+            page_visuals = PPRList()
+            for visual_dict, config, attr_values in sources:
+                new_config = {**config, 'name': id_mapping[config.get('name')]}
+                if config.get('parentGroupName') in id_mapping:
+                    new_config['parentGroupName'] = (
+                        id_mapping[config['parentGroupName']])
+                new_dict = {
+                    key: value if isinstance(value, (str, int, float)) 
+                    else copy.deepcopy(value)
+                    for key, value in visual_dict.items()
+                }
+                new_dict['config'] = dump_json(new_config)
+                containers.append(new_dict)
+
+                if attr_values is not None:
+                    attr_values = {**attr_values, 'id': new_config['name']}
+                visual = VisualInitializer(new_dict, page_name, 
+                    new_page.get('name'), keep_original=not self.lean, 
+                    attr_values=attr_values)
+                if self.lean:
+                    visual.release_dicts()
+                page_visuals.append(visual)
+            new_page['visualContainers'] = containers
+
+            # Register the page and its visuals
+            self.pages_list.append(new_page)
+            self.page_index.add_page(new_page)
+            self.loaded_pages.add(new_page.get('name'))
+            self.pages_visuals.setdefault(page_name, PPRList()).extend(
+                page_visuals)
+            new_visuals.extend(page_visuals)
+            new_pages.append(new_page)
+
+            new_bookmarks.extend(
+                self.__copy_bookmarks(page_bookmarks, id_mapping, 
+                    {section_name: new_page.get('name')}, page_name)
+            )
+
+        self.visuals.extend(new_visuals)
+        self.__index_visuals(new_visuals)
+
+        # Copies right after the page, the pages after it move forward
+        ordinal = page_dict.get('ordinal', 0)
+        for other in self.pages_list:
+            if other.get('ordinal', 0) > ordinal:
+                other['ordinal'] = other.get('ordinal', 0) + len(new_pages)
+        for position, new_page in enumerate(new_pages, start=ordinal + 1):
+            new_page['ordinal'] = position
+
+        if new_bookmarks:
+            self.insert_bookmarks(new_bookmarks)
+
+        return new_pages
+
+    def __page_bookmarks(self, section_name:str) -> list[tuple]:
+        '''Return the bookmarks of a page, as (group dict, bookmark dicts)
+
+        Bookmarks not in a group have None as group.
+        '''
+        def of_page(bookmark_dict:dict) -> bool:
+            return (
+                bookmark_dict
+                .get('explorationState', {})
+                .get('activeSection')
+            ) == section_name
+
+        page_bookmarks = []
+        for bookmark_dict in self.__get_report_config().get('bookmarks', []):
+            if 'children' in bookmark_dict:
+                children = [
+                    child for child in bookmark_dict.get('children') or []
+                    if of_page(child)
+                ]
+                if children:
+                    page_bookmarks.append((bookmark_dict, children))
+            elif of_page(bookmark_dict):
+                page_bookmarks.append((None, [bookmark_dict]))
+
+        return page_bookmarks
+
+    @staticmethod
+    def __copy_bookmarks(page_bookmarks:list[tuple], id_mapping:dict, 
+        section_mapping:dict, page_name:str) -> list[tuple]:
+        '''Return copies of bookmarks of a page for a copy of the page
+
+        Args:
+            page_bookmarks (list[tuple]): See ``__page_bookmarks``.
+            id_mapping (dict): New visual id by old id.
+            section_mapping (dict): New section name by old one.
+            page_name (str): Display name of the copy, added to the names.
+
+        Returns:
+            list[tuple]: (id, dict) of bookmarks and groups, to insert.
+        '''
+        copies = []
+        for group_dict, bookmark_dicts in page_bookmarks:
+            children = []
+            for bookmark_dict in bookmark_dicts:
+                new_dict = copy.deepcopy(bookmark_dict)
+                new_dict.update(
                     {
-                        'ordinal': page_dict.get('ordinal', None) + 1
+                        'name': hex_code('Bookmark'),
+                        'displayName': 
+                            f"{bookmark_dict.get('displayName')} ({page_name})"
                     }
                 )
+                remap_bookmark_dict(new_dict, id_mapping, section_mapping)
+                children.append(new_dict)
+
+            if group_dict is None:
+                copies.append((children[0].get('name'), children[0]))
+                continue
+            new_group = {
+                **group_dict,
+                'name': hex_code('Bookmark'),
+                'displayName': f"{group_dict.get('displayName')} ({page_name})",
+                'children': children
+            }
+            copies.append((new_group.get('name'), new_group))
+
+        return copies
 
-        # Append new page in page list
-        self.pages_list.append(copy_of_page_dict)
-        
-        return None   
-    
     '''
     Insertion methods.
 
@@ -489,29 +870,42 @@ class PBIReport(PBIXFile):
     def insert_visual_in_page(self, page_name:str, visual: tuple | Visual):
         '''Insert a visual in a page.
 
+        The visual is registered in ``visuals`` and ``pages_visuals`` without
+        rebuilding the visuals already in the report. A Visual object is kept 
+        as it is, only its page is updated. A page not loaded is loaded 
+        first, see ``load_pages``.
+
         Args:
             page_name (str): The page name where the visual will be.
             visual (tuple | Visual): A tuple of __id__ and __dict__ from a 
                 visual created with this class.
         '''
 
+        page_dict = self.__filter_page(page_name=page_name)[0]
+        page_id = page_dict.get('name')
+        # Visuals of the page are built first, to keep the order of the page
+        if page_id not in self.loaded_pages:
+            self.load_pages([page_id])
+
         if isinstance(visual, tuple):
-            _ppr_visual = visual[1] 
-        elif isinstance(visual, Visual.__bases__):
-            _ppr_visual = visual.visual
+            _ppr_visual = VisualInitializer(visual[1], page_name, page_id,
+                keep_original=not self.lean)
+        elif isinstance(visual, Visual):
+            _ppr_visual = visual
+            _ppr_visual.page_name = page_name
+            _ppr_visual.page_id = page_id
         else:
-            _ppr_visual = None
-
-
-        page_dict = self.__filter_page(page_name=page_name)[0]
+            raise ValueError("The visual should be a tuple or a Visual")
 
         (
             page_dict
-            .get('visualContainers', {})
-            .append(_ppr_visual)
+            .setdefault('visualContainers', [])
+            .append(_ppr_visual._visual)
         )  
 
-        self.__list_visuals()
+        self.visuals.append(_ppr_visual)
+        self.pages_visuals.setdefault(page_name, PPRList()).append(_ppr_visual)
+        self.__index_visuals([_ppr_visual])
 
         return None
     
@@ -523,7 +917,8 @@ class PBIReport(PBIXFile):
         Insert a created bookmark.
         Different from others parameters in layout JSON of PBI, the bookmarks 
         are placed at 'config' key at the end of JSON. It is a kind of
-        overall configuration of report.
+        overall configuration of report. See ``insert_bookmarks`` to insert
+        many of them.
 
         Args:
             bookmark (tuple): a tuple with (id, dict) of a bookmark create 
@@ -532,32 +927,388 @@ class PBIReport(PBIXFile):
         Returns:
             None
         '''
-        if isinstance(ppr_bookmark, tuple):
-            _ppr_bookmark = ppr_bookmark[1] 
-        elif ( 
-            isinstance(ppr_bookmark, Bookmark.__bases__) 
-            or isinstance(ppr_bookmark, BookmarkGroup.__bases__) 
-            ):
-            _ppr_bookmark = ppr_bookmark.bookmark_dict
-        else:
-            _ppr_bookmark = None
+        self.insert_bookmarks([ppr_bookmark])
+
+        return None
+
+    def insert_bookmarks(self, 
+        ppr_bookmarks: list[tuple | Bookmark | BookmarkGroup]
+        ) -> None:
+        '''Insert many bookmarks into report at once.
+
+        The report config stays decoded until save, so each bookmark is only
+        appended to it. Bookmark and BookmarkGroup objects are added as they 
+        are to ``bookmarks`` and ``bookmark_groups``, the other bookmarks are
+        built from their dicts. Bookmarks already in the report are kept.
+
+        Args:
+            ppr_bookmarks (list[tuple | Bookmark | BookmarkGroup]): Bookmarks
+                or groups, as objects or as tuples of (id, dict).
+
+        Raises:
+            ValueError: If an item is not a bookmark.
+        '''
+        loaded_ids : set[str] | None = None
+        report_books_list = (
+            self.report_config.setdefault('bookmarks', []))
+
+        for ppr_bookmark in ppr_bookmarks:
+            if isinstance(ppr_bookmark, tuple):
+                bookmark_dict = ppr_bookmark[1]
+                if loaded_ids is None:
+                    loaded_ids = {visual.id for visual in self.visuals}
+                self.__add_bookmark_objects(bookmark_dict, loaded_ids)
+            elif isinstance(ppr_bookmark, BookmarkGroup):
+                bookmark_dict = ppr_bookmark.bookmark_dict
+                self.bookmarks.extend(ppr_bookmark.children_list)
+                self.bookmark_groups.append(ppr_bookmark)
+            elif isinstance(ppr_bookmark, Bookmark):
+                bookmark_dict = ppr_bookmark.bookmark_dict
+                self.bookmarks.append(ppr_bookmark)
+            else:
+                raise ValueError(
+                    "The bookmark should be a tuple, a Bookmark or a "
+                    "BookmarkGroup")
+
+            report_books_list.append(bookmark_dict)
+            if self.__bookmark_index is not None:
+                self.__bookmark_index.add_bookmark(bookmark_dict)
+
+        return None
 
-        config_str = self.layout_pbi_dict.get('config', {}) 
-        config_dict = json.loads(config_str)
+    def insert_toggle_bookmarks(self, 
+        visuals: list[str | Visual],
+        group_name: str,
+        bookmark_names: list[str] | None = None,
+        navigator: bool = True
+        ) -> tuple[BookmarkGroup, Visual | None]:
+        '''Insert a bookmark for each visual, that shows it and hides the 
+        others, and a bookmark navigator to switch between them.
+
+        It is the pattern of visuals stacked in one spot of a page. The 
+        group and its bookmarks are built in one pass by ``toggle_bookmarks``
+        and inserted at once by ``insert_bookmarks``. The navigator is placed
+        below the stack, with the width of the first visual, and starts with
+        the first bookmark selected.
 
-        report_books_list = config_dict.setdefault('bookmarks',[])
-        report_books_list.append(_ppr_bookmark)
+        Args:
+            visuals (list[str | Visual]): The visuals or their ids, of the 
+                same page.
+            group_name (str): Display name of the bookmark group.
+            bookmark_names (list[str] | None, optional): Display names of the
+                bookmarks, one for each visual. Defaults to None, the group
+                name followed by the position of the visual.
+            navigator (bool, optional): Insert a bookmark navigator for the
+                group. Defaults to True.
+
+        Raises:
+            ValueError: If a visual is not found in report.
 
-        self.layout_pbi_dict.update(
+        Returns:
+            tuple[BookmarkGroup, Visual | None]: The group inserted and the
+                navigator, None if it was not inserted.
+        '''
+        toggle_visuals = []
+        for visual in visuals:
+            if isinstance(visual, str):
+                visual_id, visual = visual, self.visuals[visual]
+                if visual is None:
+                    raise ValueError(f'{visual_id} was not found in report')
+            toggle_visuals.append(visual)
+
+        bookmark_group = toggle_bookmarks(toggle_visuals, group_name, 
+            bookmark_names)
+        self.insert_bookmarks([bookmark_group])
+
+        if not navigator:
+            return bookmark_group, None
+
+        first_visual = toggle_visuals[0]
+        bookmark_nav = create_new_visual(visual='bookmark_slicer', 
+            page_name=first_visual.page_name, page_id=first_visual.page_id)
+        bookmark_nav.bookmark_group = f"'{bookmark_group.id}'"
+        bookmark_nav.update_values(
             {
-                'config':json.dumps(config_dict)
+                'config.singleVisual.objects.bookmarks.[0].properties'
+                '.selectedBookmark.expr.Literal.Value': 
+                    f"'{bookmark_group.children_list[0].id}'"
             }
         )
+        bookmark_nav.horizontal = first_visual.horizontal
+        bookmark_nav.vertical = max(
+            visual.vertical + visual.height for visual in toggle_visuals)
+        bookmark_nav.width = first_visual.width
+
+        page_dict = (
+            self.page_index.section(first_visual.page_id) # type: ignore
+            or self.get_page(first_visual.page_name) # type: ignore
+        )
+        self.insert_visual_in_page(page_dict.get('displayName'), bookmark_nav)
+
+        return bookmark_group, bookmark_nav
+
+    '''
+    Removal methods.
+
+    These methods take objects out of the layout dict and of the lists of the
+    class.
+    '''
+    def remove_visual(self, visual: str | Visual, cascade:bool=True) -> None:
+        '''Remove a visual from its page.
+
+        Args:
+            visual (str | Visual): The visual or its id.
+            cascade (bool, optional): Also remove the visual from bookmarks
+                that reference it, see ``bookmark_references``. Defaults to
+                True.
+        '''
+        if isinstance(visual, str):
+            visual_id = visual
+            visual = self.visuals[visual_id]
+            if visual is None:
+                raise ValueError(f'{visual_id} was not found in report')
+
+        page_dict = (
+            self.page_index.section(visual.page_id) # type: ignore
+            or self.get_page(visual.page_name) # type: ignore
+        )
+        containers = page_dict.get('visualContainers', [])
+        # Everything is found before the report is changed
+        container_index = next(
+            (
+                i for i, visual_dict in enumerate(containers)
+                if visual_dict is visual._visual
+            ),
+            None
+        )
+        if container_index is None or visual not in self.visuals:
+            raise ValueError(f'{visual.id} was not found in report')
+        page_visuals = self.__page_visuals_of(visual, 
+            page_dict.get('displayName'))
+
+        del containers[container_index]
+        self.visuals.remove(visual)
+        if page_visuals is not None:
+            page_visuals.remove(visual)
+        if self.__field_usage is not None:
+            self.__field_usage.remove_visual(visual)
+        if cascade:
+            self.__remove_bookmark_references([visual])
+
+        return None
+
+    def remove_page(self, page:str, cascade:bool=True) -> None:
+        '''Remove a page and its visuals from the report.
+
+        Pages after it have their ordinal decreased. Bookmarks are listed 
+        again, without the visuals of the page.
+
+        Args:
+            page (str): Display name or section name of the page.
+            cascade (bool, optional): Also remove the visuals of the page, 
+                loaded or not, from bookmarks that reference them. Defaults 
+                to True.
+        '''
+        page_dict = self.get_page(page)
+
+        # Visuals of the page, found before the report is changed
+        containers = {
+            id(visual_dict) 
+            for visual_dict in page_dict.get('visualContainers', [])
+        }
+        page_visuals = [
+            visual for visual in self.visuals if id(visual._visual) in containers
+        ]
+        page_name = page_dict.get('displayName')
+        visuals_lists = [
+            self.__page_visuals_of(visual, page_name) for visual in page_visuals
+        ]
+
+        for i, other in enumerate(self.pages_list):
+            if other is page_dict:
+                del self.pages_list[i]
+                break
+        self.page_index.remove_page(page_dict)
+        self.loaded_pages.discard(page_dict.get('name'))
+        for visual, visuals_list in zip(page_visuals, visuals_lists):
+            self.visuals.remove(visual)
+            if visuals_list is not None:
+                visuals_list.remove(visual)
+            if self.__field_usage is not None:
+                self.__field_usage.remove_visual(visual)
+        for key, visuals_list in list(self.pages_visuals.items()):
+            if not visuals_list and (key == page_name or any(
+                visuals_list is other for other in visuals_lists)):
+                del self.pages_visuals[key]
+
+        if cascade:
+            bookmark_index = self.bookmark_references()
+            page_ids = self.__visual_ids([page_dict], page_visuals)
+            for visual_id in page_ids & set(bookmark_index.visual_bookmarks):
+                bookmark_index.remove_visual(visual_id)
+                self.__report_config_modified = True
+
+        # Update ordinal of pages after the removed one
+        ordinal = page_dict.get('ordinal', 0)
+        for other in self.pages_list:
+            if other.get('ordinal', 0) > ordinal:
+                other['ordinal'] = other.get('ordinal', 0) - 1
 
         self.__list_bookmarks()
 
         return None
 
+    '''
+    Ordering methods.
+    '''
+    def move_page(self, page:str, ordinal:int) -> None:
+        '''Move a page to another position in the report.
+
+        Ordinals of all pages are set again from 0, in the new order.
+
+        Args:
+            page (str): Display name or section name of the page.
+            ordinal (int): New position of the page, from 0.
+        '''
+        page_dict = self.get_page(page)
+        ordered = sorted(self.pages_list, key=lambda p: p.get('ordinal', 0))
+        ordered = [other for other in ordered if other is not page_dict]
+        ordered.insert(max(0, min(ordinal, len(ordered))), page_dict)
+        for position, other in enumerate(ordered):
+            other['ordinal'] = position
+
+        return None
+
+    '''
+    Refactoring methods.
+
+    These methods change references to the model across the whole report.
+    '''
+    def rename_field(self, old_field:Any, new_field:Any) -> int:
+        '''Rename a field or a measure in all references of the report.
+
+        Use it after renaming a column or a measure in the model, or moving 
+        a measure to another table. Visual parts (`projections`, 
+        `prototypeQuery`, `query.Commands`, `dataTransforms` and `filters`),
+        page and report filters and the states stored in bookmarks are 
+        renamed in a single traversal of each JSON, including visuals of 
+        pages not loaded. Only the JSON strings that have the field are
+        encoded again.
+
+        Args:
+            old_field (Any): The field as `Table.Field`, a (table, field) 
+                tuple or a ``PBIModel`` measure or column.
+            new_field (Any): The new name, in the same forms. The table may
+                be another one.
+
+        Returns:
+            int: Number of references renamed.
+        '''
+        old, new = field_parts(old_field), field_parts(new_field)
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+        changed_visuals = []
+        count = 0
+
+        def rename_json(holder:dict, key:str) -> int:
+            '''Rename in a JSON string or a decoded value of a dict'''
+            value = holder.get(key)
+            if value is None:
+                return 0
+            decoded = load_json(value) if isinstance(value, str) else value
+            renamed = rename_field_references(decoded, old, new)
+            if renamed and isinstance(value, str):
+                holder[key] = dump_json(decoded)
+            return renamed
+
+        for page_dict in self.pages_list:
+            for key in ('config', 'filters'):
+                count += rename_json(page_dict, key)
+
+            for visual_dict in page_dict.get('visualContainers', []):
+                visual = visuals_by_dict.get(id(visual_dict))
+                if visual is None: #page not loaded
+                    visual_count = sum(
+                        rename_json(visual_dict, name) for name in DICT_ATTRS)
+                    if visual_count:
+                        self.__pop_cached_attrs(visual_dict)
+                        count += visual_count
+                    continue
+
+                visual_count = 0
+                for name in DICT_ATTRS:
+                    if name not in visual_dict:
+                        continue
+                    dict_value = visual._peek_dict(name)
+                    renamed = rename_field_references(dict_value, old, new)
+                    if renamed:
+                        setattr(visual, name, dict_value)
+                        visual_count += renamed
+                if visual_count:
+                    # Field attributes are read again from the renamed dicts
+                    visual._read_attrs()
+                    changed_visuals.append(visual)
+                    count += visual_count
+
+        # Report filters and bookmarks, in the report config
+        count += rename_json(self.layout_pbi_dict, 'filters')
+        config_count = rename_field_references(
+            self.__get_report_config(), old, new)
+        if config_count:
+            self.__report_config_modified = True
+            count += config_count
+
+        self.__index_visuals(changed_visuals)
+
+        return count
+
+    def remap_visual_ids(self, id_mapping:dict[str, str]) -> int:
+        '''Give new ids to visuals, keeping the references to them.
+
+        Visuals of pages not loaded are changed in their JSON strings. 
+        Children of a group follow the new id of the group 
+        (`parentGroupName`) and bookmarks follow the new ids of their 
+        visuals, see ``bookmark_references``.
+
+        Args:
+            id_mapping (dict[str, str]): New id by old id.
+
+        Returns:
+            int: Number of visuals with a new id.
+        '''
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+        count = 0
+
+        for page_dict in self.pages_list:
+            for visual_dict in page_dict.get('visualContainers', []):
+                visual = visuals_by_dict.get(id(visual_dict))
+                if visual is None: #page not loaded
+                    value = visual_dict.get('config', '{}')
+                    config = load_json(value) if isinstance(value, str) else value
+                    changed = False
+                    for key in ('name', 'parentGroupName'):
+                        if config.get(key) in id_mapping:
+                            config[key] = id_mapping[config[key]]
+                            changed = True
+                            count += key == 'name'
+                    if changed:
+                        self.__pop_cached_attrs(visual_dict)
+                        if isinstance(value, str):
+                            visual_dict['config'] = dump_json(config)
+                    continue
+
+                if visual.id in id_mapping:
+                    visual.id = id_mapping[visual.id]
+                    count += 1
+                group_id = visual._peek_dict('config').get('parentGroupName')
+                if group_id in id_mapping:
+                    visual.update_values(
+                        {'config.parentGroupName': id_mapping[group_id]})
+
+        if self.bookmark_references().remap_visuals(id_mapping):
+            self.__report_config_modified = True
+
+        return count
+
     '''
     Consolidation methods.
 
@@ -568,28 +1319,122 @@ class PBIReport(PBIXFile):
         '''Consolidate all changes made through classes methods in layout dict.
             
         This should run before save_report() to report reflect changes.
+
+        Only the visuals modified are serialized again, the others keep their
+        original JSON strings. Visual objects and the layout dict are not 
+        changed, the result is in ``layout_pbi_str``.
                     
         '''
 
-        # Refresh the visual list
-        self.__list_visuals()
-        # Dump all dicts
-        for visual in self.visuals:
-            visual.dump_dicts()
-        
-        # Dump layout dict
-        self.layout_pbi_str = json.dumps(self.layout_pbi_dict, 
-                                         ensure_ascii=False)
-        
-        # Refresh the visual list again, to keep visuais as Visual type, 
-        # instead of string
-        self.__list_visuals()
+        self.layout_pbi_str = dump_json(self.__serialized_layout())
 
         return 'All modification are in report.'
 
+    def __serialized_layout(self) -> dict:
+        '''Return the layout dict as it is written in the report file
+
+        Pages and visual containers are shallow copies, with the dict 
+        attributes of visuals as JSON strings. The layout dict itself is 
+        not changed.
+
+        Returns:
+            dict: The layout dict ready to be serialized.
+        '''
+        self.__sync_report_config()
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+
+        sections = []
+        for page in self.pages_list:
+            containers = [
+                self.__serialized_container(visual_dict, visuals_by_dict)
+                for visual_dict in page.get('visualContainers', [])
+            ]
+            section = dict(page)
+            if 'visualContainers' in page:
+                section['visualContainers'] = containers
+            sections.append(section)
+
+        layout = dict(self.layout_pbi_dict)
+        if 'sections' in layout:
+            layout['sections'] = sections
+
+        return layout
+
+    @staticmethod
+    def __serialized_container(visual_dict:dict, visuals_by_dict:dict) -> dict:
+        '''Return a visual container as it is written in the report file
+
+        Args:
+            visual_dict (dict): The visual container of a page.
+            visuals_by_dict (dict): Visual objects by id of their dict.
+
+        Returns:
+            dict: A shallow copy of the container, with JSON strings.
+        '''
+        visual = visuals_by_dict.get(id(visual_dict))
+        if visual is not None:
+            return visual.serialized_visual()
+
+        # A container without object, only dicts must be serialized
+        return {
+            key: dump_json(value) 
+                if key in DICT_ATTRS and not isinstance(value, str)
+                else value
+            for key, value in visual_dict.items()
+        }
+
+    def iter_layout_json(self) -> Iterator[str]:
+        '''Yield the report layout JSON in pieces
+
+        The layout is serialized page by page and visual by visual, so the 
+        whole JSON string never exists in memory. Joined, the pieces are the
+        string that ``save_changes`` writes in ``layout_pbi_str``.
+
+        Yields:
+            str: Pieces of the layout JSON, each at most a visual container 
+                or a value of the layout or of a page.
+        '''
+        self.__sync_report_config()
+        visuals_by_dict = {id(visual._visual): visual for visual in self.visuals}
+
+        def iter_object(obj:dict, key_list:str, iter_item) -> Iterator[str]:
+            # JSON object where the list of key_list is yielded item by item
+            separator = '{'
+            for key, value in obj.items():
+                prefix = separator + dump_json(key) + ':'
+                separator = ','
+                if key == key_list and isinstance(value, list):
+                    item_separator = prefix + '['
+                    for item in value:
+                        yield from iter_item(item, item_separator)
+                        item_separator = ','
+                    if item_separator != ',': # empty list
+                        yield item_separator
+                    yield ']'
+                else:
+                    yield prefix + dump_json(value)
+            yield '{}' if separator == '{' else '}'
+
+        def iter_container(visual_dict:dict, prefix:str) -> Iterator[str]:
+            yield prefix + dump_json(
+                self.__serialized_container(visual_dict, visuals_by_dict))
+
+        def iter_page(page:Any, prefix:str) -> Iterator[str]:
+            if not isinstance(page, dict):
+                yield prefix + dump_json(page)
+                return
+            yield prefix
+            yield from iter_object(page, 'visualContainers', iter_container)
+
+        yield from iter_object(self.layout_pbi_dict, 'sections', iter_page)
+
     def save_report(self, replace_original:bool=False, suffix:str='ppr_out', 
         file_name:str|None=None, open_file=False):
         '''Consolidate the report layout_dict input in a new PBIX file
+
+        The layout is streamed into the file from ``iter_layout_json``, so
+        save doesn't build the whole layout string. Call ``save_changes`` to
+        get it in ``layout_pbi_str``.
         
         Args:
             replace_original (bool, optional): If is true, the original report
@@ -600,14 +1445,14 @@ class PBIReport(PBIXFile):
             file_name (str | None, optional): Desired report file name. 
                 Defaults to None.
             open_file (bool, optional): Not implemented. Defaults to False.
-        '''
 
-        # Guarantee that all changes are in layout dict
-        self.save_changes()
+        Returns:
+            str: Confirmation that report was saved into folder
+        '''
 
-        # Saving report
-        super().save_report(layout_dict = self.layout_pbi_str, 
+        # Saving report, with all changes streamed from objects
+        return super().save_report(layout_dict = self.iter_layout_json(), 
                                    replace_original=replace_original, 
                                    suffix=suffix,
                                    file_name=file_name,
-                                   open_file=open_file)
\ No newline at end of file
+                                   open_file=open_file)
@@ -2,13 +2,12 @@
 '''Module for class to work with visuals of Power BI
 '''
 
-import json
 import copy
 from jsonpath_ng import parse
-from typing import Literal, Any
+from typing import Literal, Any, Iterable, Iterator
 
 from ..functions.functions import (export_dict_as_file, 
-    set_attrs_name_visual, hex_code)
+    set_attrs_name_visual, hex_code, dump_json, load_json)
 from ..constants import structures
 from ..constants import charts
 
@@ -18,6 +17,12 @@ from ..visuals.preset_attrs import pre_set, pre_set_fields
 
 from ..visuals.visuals_attrs import attributes_visual_dict
 
+from ..visuals.compiled_paths import (compile_path, compile_tree, 
+    pre_set_paths, pre_set_fields_paths, attributes_visual_paths)
+
+# Keys of a visual dict that hold JSON strings
+DICT_ATTRS = ('config', 'query', 'dataTransforms', 'filters')
+
 class VisualAttributes():
     '''Class of all atributes of a Visual.
 
@@ -69,6 +74,19 @@ class Visual():
     by keys like `config`, `query` and `dataTranforms`. After serialization
     of visual dictionary, these came as strings and they should be processed 
     before extract or modify any content.
+
+    These strings are decoded only on first access, so the parts a workflow
+    never reads cost nothing. The original JSON strings are kept and a key 
+    is re-serialized only when it was modified through attributes or 
+    methods of the class, like setting ``config`` or ``update_values``, or 
+    when it was replaced in the visual dict, like through 
+    ``PBIReport.layout_pbi_dict``.
+
+    Important:
+        Reading ``visual``, ``config``, ``query``, ``dataTransforms`` or 
+        ``filters`` doesn't mark anything as modified. If you change the
+        content of these dicts in place, call ``mark_modified``, or the 
+        original JSON strings are saved and the change is lost.
     
     Note:
         As a disclaimer, all the work done here is just a reverse engineering 
@@ -81,10 +99,20 @@ class Visual():
             It can be None, for new visuals. Defaults to ''.
         page_id (str | None, optional): The heximadecimal id page value. 
             Defaults to ''.
+        decoded_dicts (dict | None, optional): Keys of `visual_dict` already
+            decoded from their JSON strings, to not decode them again. 
+            Defaults to None.
+        keep_original (bool, optional): Keep a snapshot of the original
+            visual in `original_visual`. Set False to save memory, then
+            `original_visual` is None. Defaults to True.
+        attr_values (dict | None, optional): Values of attributes already 
+            known, by name, like from ``attr_values`` of a visual with the
+            same dict. These attributes aren't read from the visual dict, so
+            dicts aren't decoded for them. Defaults to None.
 
     Attributes:
-        original_visual (dict): The original JSON format before any 
-            tranformation of the visual.
+        original_visual (dict | None): The original JSON format before any 
+            tranformation of the visual. None if `keep_original` is False.
         visual (dict): The dictionary that represent the visual.
         page_name (str): The page name where the visual is placed.
         page_id (str): The hexadecimal page value where the visual is placed.
@@ -109,26 +137,37 @@ class Visual():
     def __init__(self, 
         visual_dict: dict, 
         page_name: str | None ='',
-        page_id: str | None = ''
+        page_id: str | None = '',
+        decoded_dicts: dict | None = None,
+        keep_original: bool = True,
+        attr_values: dict | None = None
     ) -> None:
         # If input is a dict, it must be a visual dict from report layout dict
         if not isinstance(visual_dict, dict):
             raise ValueError("It must be a dict as input")
 
-        # Deepcopy
-        self.original_visual = copy.deepcopy(visual_dict)
+        # Snapshot of the original visual. Strings are immutable, so they are
+        # shared with the visual dict, only other values are serialized.
+        self._original : dict | None = None
+        self._original_dumped : tuple = ()
+        if keep_original:
+            self._original, self._original_dumped = (
+                self._snapshot(visual_dict))
         # Get visual dict
-        self.visual = visual_dict
+        self._visual = visual_dict
             
         # Page name
         self.page_name = page_name
         self.page_id = page_id
 
-        # Convert to dict object in __setattrs__
-        self.config = self.visual.get('config', "{}")
-        self.query = self.visual.get('query', "{}")
-        self.dataTransforms = self.visual.get('dataTransforms', "{}")
-        self.filters = self.visual.get('filters', "{}")
+        # JSON strings are decoded on first access, keeping the strings
+        self._raw_dicts : dict[str, str] = {}
+        self._dicts : dict[str, Any] = {}
+        self._modified : set[str] = set()
+        self._load_dicts(decoded_dicts or {})
+        # Called with the visual when field attributes are set, like by a
+        # ``FieldUsageIndex``
+        self._field_listener : Any = None
 
         # These are preset attributes of any Visual
         self.id:str
@@ -146,12 +185,6 @@ class Visual():
         # object.__setattr__(self, 'all_attributes', 
         #     VisualAttributes(self.visual))
 
-        # List of json path context
-        contexts = parse('$..*').find(visual_dict) # find all path of JSON
-        valid_contexts = [context for context in contexts
-            if not isinstance(context.value, (dict, list)) ] # no dict or list
-        self.__contexts:list = valid_contexts 
-        
         # Set of attributes. Note:
         # There are two type of attributes, 'normal' and field attributes.
         # Fields attributes are special because great part of its update
@@ -159,17 +192,259 @@ class Visual():
         # Because of this, the two types of attributes are setted with 
         # different kind of functions.
         
-        # Preset of attributes should be collected by JSON path
-        for attr_name, attr_dict in pre_set.items():
-            full_path = attr_dict.get('full_path', [])
-            # For setting, only the `0`
-            object.__setattr__(self, attr_name, self._get_value(full_path[0])) 
-
-        # Preset of fields attributes should be collected by JSON path
-        for attr_name, attr_dict in pre_set_fields.items():
-            full_path = attr_dict.get('full_path', [])
-            object.__setattr__(self, attr_name, self._get_value(full_path[0]))
-        
+        # Attributes should be collected by JSON path, if not known
+        self._read_attrs(attr_values)
+
+    def _read_attrs(self, attr_values:dict | None = None) -> None:
+        '''Set attributes from their paths in the visual dict
+
+        Use it after changing the dicts without the attributes, like when a
+        field is renamed in the JSON.
+
+        Args:
+            attr_values (dict | None, optional): Values already known, by
+                attribute name, that aren't read again. Defaults to None.
+        '''
+        attr_values = attr_values or {}
+        for attr_name, path in self._attr_paths():
+            if attr_name in attr_values:
+                value = attr_values[attr_name]
+            else:
+                value = self._get_path(path)
+            object.__setattr__(self, attr_name, value)
+
+        return None
+
+    def _attr_paths(self) -> Iterator[tuple[str, Any]]:
+        '''Yield name and compiled path of attributes read from the dict'''
+        # Preset of attributes and preset of fields attributes. For setting,
+        # only the `0`
+        for paths in (pre_set_paths, pre_set_fields_paths):
+            for attr_name, attr_paths in paths.items():
+                yield attr_name, attr_paths.get('full_path', [])[0]
+
+    def attr_values(self) -> dict:
+        '''Return the values of attributes read from the visual dict
+
+        They can be handed to a new visual of the same dict, to not read them
+        again.
+
+        Returns:
+            dict: Values by attribute name.
+        '''
+        return {
+            attr_name: getattr(self, attr_name)
+            for attr_name, _ in self._attr_paths()
+        }
+
+    @staticmethod
+    def _snapshot(visual_dict:dict) -> tuple[dict, tuple]:
+        '''Build a compact snapshot of a visual dict
+
+        Strings and numbers are kept as they are, dicts and lists are
+        serialized to JSON strings.
+
+        Returns:
+            tuple: The snapshot and the keys that were serialized.
+        '''
+        snapshot = {}
+        dumped = []
+        for key, value in visual_dict.items():
+            if isinstance(value, (dict, list)):
+                value = dump_json(value)
+                dumped.append(key)
+            snapshot[key] = value
+
+        return snapshot, tuple(dumped)
+
+    @property
+    def original_visual(self) -> dict | None:
+        '''The original visual dict, rebuilt from the snapshot'''
+        if self._original is None:
+            return None
+        original = dict(self._original)
+        for key in self._original_dumped:
+            original[key] = load_json(original[key])
+
+        return original
+
+    def _load_dicts(self, decoded_dicts:dict) -> None:
+        '''Register the JSON strings of the visual dict, without decoding
+
+        The original strings are kept, to be written back as they were if the
+        key is not modified. Strings are decoded by ``_get_dict`` on first 
+        access.
+
+        Args:
+            decoded_dicts (dict): Keys already decoded, by name.
+        '''
+        for name in DICT_ATTRS:
+            if name not in self._visual:
+                continue
+            value = self._visual[name]
+            if isinstance(value, str):
+                self._raw_dicts[name] = value
+                if name not in decoded_dicts:
+                    continue
+                value = decoded_dicts[name]
+            self._dicts[name] = value
+            self._visual[name] = value
+
+        return None
+
+    def _get_dict(self, __name:str) -> Any:
+        '''Return a decoded dict attribute without marking it as modified
+
+        The JSON string is decoded on first access and the visual dict gets
+        the decoded value. Missing keys are not created, the visual keeps its
+        shape.
+        '''
+        if self._is_replaced(__name): # like through PBIReport.layout_pbi_dict
+            self._dicts.pop(__name, None)
+            self._modified.add(__name)
+        if __name not in self._dicts:
+            value = self._visual.get(__name, "{}")
+            if isinstance(value, str):
+                value = load_json(value)
+            self._dicts[__name] = value
+            if __name in self._visual:
+                self._visual[__name] = value
+
+        return self._dicts[__name]
+
+    def _peek_dict(self, __name:str) -> Any:
+        '''Return a decoded dict attribute without keeping it decoded
+
+        Like ``_get_dict``, but a JSON string not decoded yet is decoded for
+        the caller only. Good to read many visuals in lean mode.
+        '''
+        if __name in self._dicts and not self._is_replaced(__name):
+            return self._dicts[__name]
+        value = self._visual.get(__name, "{}")
+
+        return load_json(value) if isinstance(value, str) else value
+
+    def _decode_roots(self, roots:Iterable | None) -> None:
+        '''Decode the dict attributes where paths start
+
+        Args:
+            roots (Iterable | None): First keys of paths. None means that
+                they are unknown, so all of them are decoded.
+        '''
+        for name in DICT_ATTRS if roots is None else roots:
+            if name in DICT_ATTRS and name not in self._dicts:
+                self._get_dict(name)
+
+        return None
+
+    def _get_path(self, path:Any) -> Any | None:
+        '''Return the value of a compiled path, decoding only its root'''
+        self._decode_roots(path.keys[:1] if hasattr(path, 'keys') else None)
+
+        return path.get(self._visual)
+
+    def _mark_roots_modified(self, roots:Iterable | None) -> None:
+        '''Mark the dict attributes where paths start as modified
+
+        Args:
+            roots (Iterable | None): First keys of paths. None means that
+                they are unknown, so all of them are marked.
+        '''
+        if roots is None:
+            self._modified.update(DICT_ATTRS)
+        else:
+            self._modified.update(name for name in roots if name in DICT_ATTRS)
+
+        return None
+
+    def mark_modified(self, *names:str) -> None:
+        '''Mark dict attributes as modified, to serialize them on save
+
+        Use it after changing the content of a dict attribute in place, like
+        ``visual.config['name']`` or a dict held by 
+        ``PBIReport.layout_pbi_dict``. Reading the attributes doesn't mark
+        them.
+
+        Args:
+            *names (str): Names among `config`, `query`, `dataTransforms` and
+                `filters`. Without names, all of them are marked.
+        '''
+        self._mark_roots_modified(names if names else None)
+        # Dicts handed out for missing keys are added to the visual dict
+        for name in names if names else DICT_ATTRS:
+            if name in self._dicts:
+                self._visual.setdefault(name, self._dicts[name])
+
+        return None
+
+    def is_modified(self) -> bool:
+        '''Return if any dict attribute of the visual was modified'''
+        return any(self._is_dirty(name) for name in DICT_ATTRS)
+
+    def _is_replaced(self, __name:str) -> bool:
+        '''Return if a dict attribute was replaced in the visual dict
+
+        Like a new dict or JSON string set through 
+        ``PBIReport.layout_pbi_dict``, instead of the value held by the 
+        visual.
+        '''
+        if __name not in self._visual:
+            return False
+        held = self._dicts.get(__name, self._raw_dicts.get(__name))
+
+        return self._visual[__name] is not held
+
+    def _is_dirty(self, __name:str) -> bool:
+        '''Return if a dict attribute must be serialized again on save'''
+        return __name in self._modified or self._is_replaced(__name)
+
+    def release_dicts(self) -> None:
+        '''Drop decoded dict attributes that were not modified
+
+        The visual dict gets back their original JSON strings and they are
+        decoded again on next access. Original strings of modified attributes
+        are dropped too, since they are serialized from the dict on save. It
+        saves memory when many visuals are held, see ``PBIReport`` lean mode.
+        '''
+        for name in list(self._dicts):
+            if self._is_dirty(name):
+                self._raw_dicts.pop(name, None)
+            elif name in self._raw_dicts:
+                del self._dicts[name]
+                if name in self._visual:
+                    self._visual[name] = self._raw_dicts[name]
+
+        return None
+
+    def _dict_attr(attr_name:str): # type: ignore
+        '''Build the property of a dict attribute'''
+        def getter(self) -> Any:
+            # Changes in place are marked by the caller, see mark_modified
+            return self._get_dict(attr_name)
+
+        def setter(self, value:Any) -> None:
+            self._set_dict_attrs(attr_name, value)
+
+        return property(getter, setter)
+
+    config = _dict_attr('config')
+    query = _dict_attr('query')
+    dataTransforms = _dict_attr('dataTransforms')
+    filters = _dict_attr('filters')
+    del _dict_attr
+
+    @property
+    def visual(self) -> dict:
+        '''The dictionary that represent the visual.
+
+        Its dict attributes are decoded, missing ones are added as empty
+        dicts. Keys set to new values are saved, but changes in place need
+        ``mark_modified``.
+        '''
+        for name in DICT_ATTRS:
+            self._visual.setdefault(name, self._get_dict(name))
+
+        return self._visual
     
     def _set_dict_attrs(self, __name:str, __value:Any) -> None:
         '''Setter method for dict attributes for visual
@@ -184,13 +459,14 @@ class Visual():
 
         '''
         if isinstance(__value, str):
-            dict_value = json.loads(__value) #convert to dict
+            dict_value = load_json(__value) #convert to dict
         else:
             dict_value = __value 
         # Set attribute of the object
-        object.__setattr__(self, __name, dict_value )
+        self._dicts[__name] = dict_value
+        self._modified.add(__name)
         # Update the visual dict
-        object.__getattribute__(self,'visual').update({ __name: dict_value } )
+        self._visual.update({ __name: dict_value } )
 
         return None
 
@@ -212,8 +488,7 @@ class Visual():
         paths = attr_dict.get('full_path',[]) #list of paths
         
         # Update the paths
-        for path in paths:
-            self._update_value(path=path, new_value=__value)
+        self.update_values(dict.fromkeys(paths, __value))
         
         # Set the attribute of the object, beside for the paths
         object.__setattr__(self, __name, __value)
@@ -253,22 +528,27 @@ class Visual():
         table_paths =attr_dict.get('table',[]) #for Table
         qualified_paths =attr_dict.get('qualified',[]) # for Table.NameField
         
-        # Run for each list of paths
-        for path in paths:
-            self._update_value(path=path,new_value=__value)
-        for path in field_paths:
-            self._update_value(path=path,new_value=field_name)
-        for path in table_paths:
-            self._update_value(path=path,new_value=table_name)
-        for path in qualified_paths:
-            self._update_value(path=path,new_value=qualified_name)
+        # All lists of paths in one traversal, the last list wins
+        values = dict.fromkeys(paths, __value)
+        values.update(dict.fromkeys(field_paths, field_name))
+        values.update(dict.fromkeys(table_paths, table_name))
+        values.update(dict.fromkeys(qualified_paths, qualified_name))
+        self.update_values(values)
 
         # Set the attribute of the object, beside for the paths
         object.__setattr__(self, __name, __value)
+        self._fields_changed()
 
         return None
 
 
+    def _fields_changed(self) -> None:
+        '''Tell the field listener, if any, that fields of the visual changed'''
+        if self._field_listener is not None:
+            self._field_listener(self)
+
+        return None
+
     def __setattr__(self, __name, __value):
         '''Modified to manipulate dictionary keys updating
         '''
@@ -317,11 +597,7 @@ class Visual():
             The value of JSON path can be a int, str, bool or anything else,
                 even none.
         '''
-        for context in self.__contexts:
-            if str(context.full_path) == path:
-                return context.value
-
-        return None
+        return self._get_path(compile_path(path))
 
     
     def _update_value(self, path:str, new_value) -> None:
@@ -330,29 +606,75 @@ class Visual():
         Args:
             path (str): A JSON path to desired value into obejct
         '''
-        context = parse(f'$.{path}').find(self.visual)
-        if context: #may not exist
-            parse(f'$.{path}').update(self.visual, new_value)
+        compiled = compile_path(path)
+        roots = compiled.keys[:1] if hasattr(compiled, 'keys') else None
+        self._decode_roots(roots)
+        if compiled.set(self._visual, new_value): #may not exist
+            self._mark_roots_modified(roots)
 
         return None
+
+    def update_values(self, values:dict[str, Any]) -> int:
+        '''Method to update the values of many JSON paths at once
+
+        The paths are merged by their common keys and applied in a single 
+        traversal of the visual dictionary. Paths that don't exist in the 
+        visual are ignored, like in ``_update_value``.
+
+        Args:
+            values (dict[str, Any]): JSON paths as keys and their new values.
+
+        Returns:
+            int: Number of values updated in the visual dictionary.
+        '''
+        tree = compile_tree(tuple(values))
+        self._decode_roots(tree.roots)
+        count = tree.update(self._visual, tuple(values.values()))
+        if count:
+            self._mark_roots_modified(tree.roots)
+
+        return count
     
+    def serialized_visual(self) -> dict:
+        '''Method to return the visual dict as it is written in the layout.
+
+        The dict attributes are JSON strings there. Those not modified keep
+        their original string, byte for byte, the others are serialized. The
+        visual dict itself is not changed.
+
+        Returns:
+            dict: A shallow copy of the visual dict with JSON strings.
+        '''
+        visual_dict = dict(self._visual)
+        for name in DICT_ATTRS:
+            if name not in visual_dict:
+                continue
+            value = visual_dict[name]
+            if isinstance(value, str): #not decoded yet
+                continue
+            if self._is_dirty(name) or name not in self._raw_dicts:
+                visual_dict[name] = dump_json(value)
+            else: # not modified
+                visual_dict[name] = self._raw_dicts[name]
+
+        return visual_dict
+
     def dump_dicts(self) -> None:
         '''Method to update values in the visual dict.
 
         The Power BI visual dictionary will be converted to a JSON object.
         Within the JSON, the bellow keys should be in string format. 
-        This method is called within PBIReport.save_report() and performs this
-        action before saving a new Power BI file.
+        This method writes the strings of ``serialized_visual`` in the visual
+        dictionary. ``PBIReport.save_changes`` doesn't need it anymore, since
+        it serializes the layout without changing the visual dictionaries.
         
         '''
 
-        self.visual.update(
+        self._visual.update(
             {
-                'config': json.dumps(self.config, ensure_ascii=False),
-                'query':json.dumps(self.query, ensure_ascii=False),
-                'dataTransforms': json.dumps(self.dataTransforms, 
-                    ensure_ascii=False),
-                'filters': json.dumps(self.filters, ensure_ascii=False)
+                name: value 
+                for name, value in self.serialized_visual().items()
+                if name in DICT_ATTRS
             }
         )
 
@@ -379,7 +701,8 @@ class Visual():
             file_name = f'{self.visual_type}_{self.id}.json'
 
         # Create a dictionary to export, with original and transformed keys.
-        dict_ = {'original': self.original_visual , 'transformed': self.visual}
+        dict_ = {'original': self.original_visual , 
+            'transformed': self._visual}
 
         export_dict_as_file(dict_, file_name=file_name)
 
@@ -397,38 +720,45 @@ class BaseVisual(Visual):
             It can be None, for new visuals. Defaults to ''.
         page_id (str | None, optional): The heximadecimal id page value. 
             Defaults to ''.
+        decoded_dicts (dict | None, optional): Keys of `visual_dict` already
+            decoded from their JSON strings. Defaults to None.
+        keep_original (bool, optional): Keep a snapshot of the original
+            visual. Defaults to True.
+        attr_values (dict | None, optional): Values of attributes already
+            known, by name. Defaults to None.
 
     Attributes:
         _obj_name (str): The name of viusal type
         _attrs (dict): A dictonary with set of attributes for the visual type
         _field_attrs (dict): A dictonary with set of fields attributes for the 
             visual type
+        _attrs_paths (dict): The compiled paths of ``_attrs``
+        _field_attrs_paths (dict): The compiled paths of ``_field_attrs``
     '''
 
-    def __init__(self, visual_dict: dict, page_name, page_id) -> None:
-        '''_summary_
-
-        _extended_summary_
-
-        Args:
-           
-        '''
+    def __init__(self, visual_dict: dict, page_name='', page_id='',
+        decoded_dicts: dict | None = None, keep_original: bool = True,
+        attr_values: dict | None = None) -> None:
         
-        super().__init__(visual_dict, page_name, page_id)
-
         self._obj_name:str
         self._attrs:dict
         self._field_attrs:dict
+        self._attrs_paths:dict
+        self._field_attrs_paths:dict
+
+        # The exclusives attributes are set with the preset ones, see 
+        # `_attr_paths`
+        super().__init__(visual_dict, page_name, page_id, decoded_dicts,
+            keep_original, attr_values)
 
-        # Set the exclusives attributes
-        for attr_name, attr_dict in self._attrs.items():
-            full_path = attr_dict.get('full_path', [])
-            object.__setattr__(self, attr_name, self._get_value(full_path[0]))
+    def _attr_paths(self) -> Iterator[tuple[str, Any]]:
+        '''Yield name and compiled path of preset and exclusive attributes'''
+        yield from super()._attr_paths()
 
-        # Set the exclusives fields attributes
-        for attr_name, attr_dict in self._field_attrs.items():
-            full_path = attr_dict.get('full_path', [])
-            object.__setattr__(self, attr_name, self._get_value(full_path[0]))
+        # Exclusives attributes and exclusives fields attributes
+        for paths in (self._attrs_paths, self._field_attrs_paths):
+            for attr_name, attr_paths in paths.items():
+                yield attr_name, attr_paths.get('full_path', [])[0]
 
     def _set_attrs(self,__name:str, __value:Any) -> None:
         '''Setter method for normal attributes for the visual
@@ -447,11 +777,7 @@ class BaseVisual(Visual):
         attr_dict = self._attrs.get(__name, {}) #dictionary of that attribute
         paths = attr_dict.get('full_path',[]) #list of paths
         
-        for path in paths:
-            super()._update_value(
-                path=path,
-                new_value=__value
-            )
+        self.update_values(dict.fromkeys(paths, __value))
 
         # Set the attribute of the object, beside for the paths
         object.__setattr__(self, __name, __value)
@@ -492,18 +818,16 @@ class BaseVisual(Visual):
         table_paths =attr_dict.get('table',[]) #for Table
         qualified_paths =attr_dict.get('qualified',[]) # for Table.NameField
         
-        # Run for each list of paths
-        for path in paths:
-            self._update_value(path=path,new_value=__value)
-        for path in field_paths:
-            self._update_value(path=path,new_value=field_name)
-        for path in table_paths:
-            self._update_value(path=path,new_value=table_name)
-        for path in qualified_paths:
-            self._update_value(path=path,new_value=qualified_name)
+        # All lists of paths in one traversal, the last list wins
+        values = dict.fromkeys(paths, __value)
+        values.update(dict.fromkeys(field_paths, field_name))
+        values.update(dict.fromkeys(table_paths, table_name))
+        values.update(dict.fromkeys(qualified_paths, qualified_name))
+        self.update_values(values)
 
         # Set the attribute of the object, beside for the paths
         object.__setattr__(self, __name, __value)
+        self._fields_changed()
 
     def __setattr__(self, __name, __value):
         '''Modified to manipulate dictionary keys updating
@@ -546,8 +870,15 @@ class Card(BaseVisual):
     _field_attrs = attributes_visual_dict.get(__visual,{}).get(
         'field_attrs', {})
 
-    def __init__(self, visual_dict: dict, page_name, page_id) -> None:
-        super().__init__(visual_dict, page_name, page_id)
+    _attrs_paths = attributes_visual_paths.get(__visual,{}).get('attrs', {})
+    _field_attrs_paths = attributes_visual_paths.get(__visual,{}).get(
+        'field_attrs', {})
+
+    def __init__(self, visual_dict: dict, page_name='', page_id='',
+        decoded_dicts: dict | None = None, keep_original: bool = True,
+        attr_values: dict | None = None) -> None:
+        super().__init__(visual_dict, page_name, page_id, decoded_dicts,
+            keep_original, attr_values)
 
 class Column(BaseVisual):
     '''Representation of Power BI Column Chart visual
@@ -573,8 +904,15 @@ class Column(BaseVisual):
     _field_attrs = attributes_visual_dict.get(__visual,{}).get(
         'field_attrs', {})
 
-    def __init__(self, visual_dict: dict, page_name, page_id) -> None:
-        super().__init__(visual_dict, page_name, page_id)
+    _attrs_paths = attributes_visual_paths.get(__visual,{}).get('attrs', {})
+    _field_attrs_paths = attributes_visual_paths.get(__visual,{}).get(
+        'field_attrs', {})
+
+    def __init__(self, visual_dict: dict, page_name='', page_id='',
+        decoded_dicts: dict | None = None, keep_original: bool = True,
+        attr_values: dict | None = None) -> None:
+        super().__init__(visual_dict, page_name, page_id, decoded_dicts,
+            keep_original, attr_values)
     
 
 class Slicer(BaseVisual):
@@ -601,8 +939,15 @@ class Slicer(BaseVisual):
     _field_attrs = attributes_visual_dict.get(__visual,{}).get(
         'field_attrs', {})
 
-    def __init__(self, visual_dict: dict, page_name, page_id) -> None:
-        super().__init__(visual_dict, page_name, page_id)
+    _attrs_paths = attributes_visual_paths.get(__visual,{}).get('attrs', {})
+    _field_attrs_paths = attributes_visual_paths.get(__visual,{}).get(
+        'field_attrs', {})
+
+    def __init__(self, visual_dict: dict, page_name='', page_id='',
+        decoded_dicts: dict | None = None, keep_original: bool = True,
+        attr_values: dict | None = None) -> None:
+        super().__init__(visual_dict, page_name, page_id, decoded_dicts,
+            keep_original, attr_values)
 
 class BookmarkSlicer(BaseVisual):
     '''Representation of Power BI Bookmark Navigator visual
@@ -628,17 +973,39 @@ class BookmarkSlicer(BaseVisual):
     _field_attrs = attributes_visual_dict.get(__visual,{}).get(
         'field_attrs', {})
 
-    def __init__(self, visual_dict: dict, page_name, page_id) -> None:
-        super().__init__(visual_dict, page_name, page_id)
+    _attrs_paths = attributes_visual_paths.get(__visual,{}).get('attrs', {})
+    _field_attrs_paths = attributes_visual_paths.get(__visual,{}).get(
+        'field_attrs', {})
+
+    def __init__(self, visual_dict: dict, page_name='', page_id='',
+        decoded_dicts: dict | None = None, keep_original: bool = True,
+        attr_values: dict | None = None) -> None:
+        super().__init__(visual_dict, page_name, page_id, decoded_dicts,
+            keep_original, attr_values)
 
 class VisualInitializer():
     '''Class to initializer a Visual
 
-    Receive a and evaluate its type. For certain types, this class returns
-    a proper class of visual type.
+    Receive a visual dictionary and evaluate its type before building any
+    object. For certain types, this class returns a proper class of visual 
+    type, otherwise a generic Visual. This way each visual dictionary is 
+    parsed only once.
+
+    For compatibility, a Visual object is also accepted. In this case, the 
+    dictionary of the object is used to build the proper class.
 
     Args:
-        visual (Visual):
+        visual (dict | Visual): The dictionary that represent a Power BI 
+            visual or a Visual object.
+        page_name (str | None, optional): The page where the visual is placed. 
+            Defaults to ''.
+        page_id (str | None, optional): The heximadecimal id page value. 
+            Defaults to ''.
+        keep_original (bool, optional): Keep a snapshot of the original 
+            visual, for dictionaries. Defaults to True.
+        attr_values (dict | None, optional): Values of attributes already
+            known, for dictionaries. With `visual_type` among them, config
+            isn't decoded to find the type. Defaults to None.
 
     Returns:
         A class of visual.
@@ -652,17 +1019,52 @@ class VisualInitializer():
         'bookmarkNavigator': BookmarkSlicer
     } # type: ignore
 
-    def __new__(cls, visual:Visual) -> Visual:
-        if visual.visual_type in cls.__initializer_dict:
-            return ( 
-                cls.__initializer_dict.get(visual.visual_type)(
-                    visual_dict = visual.visual,
-                    page_name = visual.page_name,
-                    page_id = visual.page_id
-                )
-                ) # type: ignore
-        else:
+    def __new__(cls, visual:dict | Visual, page_name: str | None = '',
+        page_id: str | None = '', keep_original: bool = True,
+        attr_values: dict | None = None) -> Visual:
+        # Already a Visual object, only specific types should be rebuilt
+        if isinstance(visual, Visual):
+            if visual.visual_type in cls.__initializer_dict:
+                visual_obj = cls.__initializer_dict.get(visual.visual_type)(
+                        visual_dict = visual._visual,
+                        page_name = visual.page_name,
+                        page_id = visual.page_id,
+                        keep_original = False
+                    ) # type: ignore
+                # Keep original snapshot, strings and modifications
+                visual_obj._original = visual._original
+                visual_obj._original_dumped = visual._original_dumped
+                visual_obj._raw_dicts.update(visual._raw_dicts)
+                visual_obj._modified.clear()
+                visual_obj._modified.update(visual._modified)
+                return visual_obj
             return visual
+
+        if not isinstance(visual, dict):
+            raise ValueError("It must be a dict or a Visual as input")
+
+        # Peek the visual type from config, the only part needed to dispatch.
+        # The decoded config is handed over, so it isn't decoded again.
+        decoded_dicts = {}
+        if attr_values and 'visual_type' in attr_values:
+            visual_type = attr_values['visual_type']
+        else:
+            config = visual.get('config', '{}')
+            if isinstance(config, str):
+                config = load_json(config)
+                decoded_dicts.update({'config': config})
+            visual_type = config.get('singleVisual', {}).get('visualType')
+
+        visual_class = cls.__initializer_dict.get(visual_type, Visual)
+
+        return visual_class(
+            visual_dict = visual,
+            page_name = page_name,
+            page_id = page_id,
+            decoded_dicts = decoded_dicts,
+            keep_original = keep_original,
+            attr_values = attr_values
+        ) # type: ignore
         
 
 def create_new_visual(
@@ -700,14 +1102,14 @@ def create_new_visual(
     if custom_template:
         visual_dict = custom_template
     else:
-        visual_dict = charts.VISUAL_TEMPLATE_DICT.get(visual, {})
+        # Templates are shared, the visual must have its own dict
+        visual_dict = copy.deepcopy(
+            charts.VISUAL_TEMPLATE_DICT.get(visual, {}))
     
     visual_obj = VisualInitializer(
-        Visual(
-            visual_dict=visual_dict, 
-            page_name=page_name,
-            page_id=page_id
-        )
+        visual=visual_dict, 
+        page_name=page_name,
+        page_id=page_id
     )
 
     # Change the hexadecimal code of the visual
@@ -730,10 +1132,10 @@ def copy_visual(visual:Visual) -> Visual:
         Visual: A copied visual.
     '''
     # Deepcopy the visual dictionary.
-    visual_copy_dict = copy.deepcopy(visual.visual)
+    visual_copy_dict = copy.deepcopy(visual._visual)
     
-    # Create a copy with Visual and VisualInitializer
-    visual_copy = VisualInitializer(Visual(visual_copy_dict))
+    # Create a copy with VisualInitializer
+    visual_copy = VisualInitializer(visual_copy_dict)
     # Change the id of visual
     visual_copy.id = hex_code()
 
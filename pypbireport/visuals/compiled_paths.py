@@ -0,0 +1,275 @@
+'''This module compiles the JSON paths of visual attributes
+
+The paths in ``preset_attrs`` and ``visuals_attrs`` follow the jsonpath
+notation, like ``config.layouts.[0].position.x``. Matching them with a generic
+jsonpath engine means scanning the whole visual dict. Here each path is 
+compiled once, at import, into a tuple of keys and indexes that walks the
+visual dict directly.
+
+Paths used elsewhere are compiled on demand through ``compile_path`` and 
+``compile_tree``, both backed by a bounded LRU cache shared by the process.
+
+'''
+
+import re
+import functools
+from typing import Any, Iterable
+from jsonpath_ng import parse
+
+from .preset_attrs import pre_set, pre_set_fields
+from .visuals_attrs import attributes_visual_dict
+
+# A token is either an index, like `[0]`, or a key between dots
+_TOKEN_PATTERN = re.compile(r'\[(\d+)\]|([^.\[\]]+)')
+
+# A path with only keys and indexes, anything else goes to jsonpath_ng
+_SIMPLE_PATH_PATTERN = re.compile(r'^(?:\.?(?:\[\d+\]|[^.\[\]*$@?()|&,\'"]+))+$')
+
+# Marker for a path that doesn't exist in a dict
+_MISSING = object()
+
+# Maximum number of compiled paths and trees kept by the caches
+PATH_CACHE_SIZE = 1024
+TREE_CACHE_SIZE = 256
+
+
+def _has_key(obj:Any, key:str | int) -> bool:
+    '''Return if a key (`str`) or an index (`int`) exists in obj'''
+    if isinstance(key, int):
+        return isinstance(obj, list) and key < len(obj)
+    return isinstance(obj, dict) and key in obj
+
+
+class CompiledPath():
+    '''Class to represent a compiled JSON path of a visual dict
+
+    Args:
+        path (str): A JSON path, like ``config.layouts.[0].position.x``. 
+            Indexes can be written as ``.[0]`` or ``[0]``.
+
+    Attributes:
+        path (str): The JSON path.
+        keys (tuple): Keys (`str`) and indexes (`int`) of the path, in order.
+    '''
+
+    __slots__ = ('path', 'keys')
+
+    def __init__(self, path:str) -> None:
+        self.path = path
+        self.keys = tuple(
+            int(index) if index else key
+            for index, key in _TOKEN_PATTERN.findall(path)
+        )
+
+    def __repr__(self) -> str:
+        return f'CompiledPath({self.path!r})'
+
+    @staticmethod
+    def _walk(obj:Any, keys:tuple) -> Any:
+        '''Return the object at the end of keys or _MISSING'''
+        for key in keys:
+            if not _has_key(obj, key):
+                return _MISSING
+            obj = obj[key]
+
+        return obj
+
+    def exists(self, obj:dict) -> bool:
+        '''Return if the path exists in the dict'''
+        return self._walk(obj, self.keys) is not _MISSING
+
+    def get(self, obj:dict) -> Any | None:
+        '''Return the value of the path in the dict
+
+        Only final values are returned, like for a full scan of the dict. If 
+        the path doesn't exist or points to a `dict` or `list`, it returns 
+        None.
+        '''
+        value = self._walk(obj, self.keys)
+        if value is _MISSING or isinstance(value, (dict, list)):
+            return None
+
+        return value
+
+    def set(self, obj:dict, value:Any) -> bool:
+        '''Set the value of the path in the dict, if the path exists
+
+        Returns:
+            bool: True if the value was set.
+        '''
+        if not self.keys:
+            return False
+        parent = self._walk(obj, self.keys[:-1])
+        last = self.keys[-1]
+        if not _has_key(parent, last):
+            return False
+        parent[last] = value
+
+        return True
+
+
+class JsonPathExpression():
+    '''Class to wrap a jsonpath_ng expression with CompiledPath methods
+
+    Used for paths that aren't only keys and indexes, like filters or 
+    wildcards.
+
+    Args:
+        path (str): A JSON path, relative to the root of the dict.
+    '''
+
+    __slots__ = ('path', 'expression')
+
+    def __init__(self, path:str) -> None:
+        self.path = path
+        self.expression = parse(f'$.{path}')
+
+    def __repr__(self) -> str:
+        return f'JsonPathExpression({self.path!r})'
+
+    def exists(self, obj:dict) -> bool:
+        '''Return if the path exists in the dict'''
+        return bool(self.expression.find(obj))
+
+    def get(self, obj:dict) -> Any | None:
+        '''Return the first final value of the path in the dict, or None'''
+        for context in self.expression.find(obj):
+            if not isinstance(context.value, (dict, list)):
+                return context.value
+
+        return None
+
+    def set(self, obj:dict, value:Any) -> bool:
+        '''Set the value of the path in the dict, if the path exists'''
+        if not self.expression.find(obj): #may not exist
+            return False
+        self.expression.update(obj, value)
+
+        return True
+
+
+class PathTree():
+    '''Class to apply a group of paths in a single traversal of a dict
+
+    Paths are merged by their common keys, like a trie. Each node of the tree 
+    is visited once, whatever the number of paths that pass through it. When 
+    two paths lead to the same key, the last one wins, like applying them one
+    by one.
+
+    Args:
+        paths (Iterable[CompiledPath | JsonPathExpression]): Paths of the 
+            group. Values are given by position in ``update``.
+
+    Attributes:
+        root (tuple): The first node. A node is a tuple of a dict of children
+            nodes and a dict of positions of values to assign, both by key.
+        expressions (list): Paths that aren't only keys and indexes, applied
+            one by one after the tree.
+        roots (frozenset | None): First keys of the paths. None when some 
+            path is a jsonpath expression, whose keys aren't known.
+    '''
+
+    __slots__ = ('root', 'expressions', 'roots')
+
+    def __init__(self, paths:Iterable['CompiledPath | JsonPathExpression']):
+        self.root : tuple[dict, dict] = ({}, {})
+        self.expressions : list = []
+
+        for position, path in enumerate(paths):
+            if isinstance(path, JsonPathExpression) or not path.keys:
+                self.expressions.append((position, path))
+                continue
+            node = self.root
+            for key in path.keys[:-1]:
+                node = node[0].setdefault(key, ({}, {}))
+            node[1][path.keys[-1]] = position
+
+        self.roots : frozenset | None = None
+        if not self.expressions:
+            self.roots = frozenset(self.root[0]) | frozenset(self.root[1])
+
+    @staticmethod
+    def _update_node(node:tuple, obj:Any, values:tuple) -> int:
+        '''Assign values of a node and go down to its children'''
+        count = 0
+        children, assignments = node
+        for key, position in assignments.items():
+            if _has_key(obj, key):
+                obj[key] = values[position]
+                count += 1
+        for key, child in children.items():
+            if _has_key(obj, key):
+                count += PathTree._update_node(child, obj[key], values)
+
+        return count
+
+    def update(self, obj:dict, values:tuple) -> int:
+        '''Set the values of all existing paths in the dict
+
+        Args:
+            obj (dict): The dict to update.
+            values (tuple): A value for each path, in the same order.
+
+        Returns:
+            int: Number of values set.
+        '''
+        count = self._update_node(self.root, obj, values)
+        for position, expression in self.expressions:
+            count += expression.set(obj, values[position])
+
+        return count
+
+
+@functools.lru_cache(maxsize=PATH_CACHE_SIZE)
+def compile_path(path:str) -> CompiledPath | JsonPathExpression:
+    '''Return the compiled form of a path, cached for the process
+
+    Paths made only of keys and indexes become a CompiledPath, any other 
+    jsonpath syntax is parsed by jsonpath_ng.
+
+    Args:
+        path (str): A JSON path, relative to the root of the dict.
+    '''
+    if _SIMPLE_PATH_PATTERN.match(path):
+        return CompiledPath(path)
+
+    return JsonPathExpression(path)
+
+
+@functools.lru_cache(maxsize=TREE_CACHE_SIZE)
+def compile_tree(paths:tuple[str, ...]) -> PathTree:
+    '''Return the PathTree of a group of paths, cached for the process
+
+    Args:
+        paths (tuple[str, ...]): JSON paths, relative to the root of the dict.
+    '''
+    return PathTree(compile_path(path) for path in paths)
+
+
+def compile_attrs(attrs:dict) -> dict[str, dict[str, list[CompiledPath]]]:
+    '''Compile all lists of paths of a dict of attributes
+
+    Args:
+        attrs (dict): A dict of attributes, like ``pre_set``. Each attribute
+            has lists of paths in keys as ``full_path``, ``field``, etc.
+
+    Returns:
+        dict: The same structure, with lists of CompiledPath.
+    '''
+    return {
+        attr_name: {
+            kind: [CompiledPath(path) for path in paths]
+            for kind, paths in attr_dict.items()
+            if isinstance(paths, list)
+        }
+        for attr_name, attr_dict in attrs.items()
+    }
+
+
+pre_set_paths = compile_attrs(pre_set)
+pre_set_fields_paths = compile_attrs(pre_set_fields)
+
+attributes_visual_paths = {
+    visual: {kind: compile_attrs(attrs) for kind, attrs in visual_dict.items()}
+    for visual, visual_dict in attributes_visual_dict.items()
+}
@@ -0,0 +1,53 @@
+'''Fixtures of synthetic Power BI files
+
+Reports are built by ``benchmarks/synthetic.py``, with the visual templates
+of the package, so tests don't need real reports.
+'''
+
+import os
+import sys
+
+import pytest
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(
+    os.path.abspath(__file__))), 'benchmarks'))
+
+from synthetic import build_synthetic_pbix, synthetic_layout, write_pbix
+
+from pypbireport import PBIReport
+
+# Pages, visuals per page and bookmarks of the default synthetic report
+N_PAGES = 3
+N_VISUALS = 10
+N_BOOKMARKS = 6
+
+
+@pytest.fixture
+def pbix_path(tmp_path) -> str:
+    '''Path of a synthetic report with bookmarks'''
+    return build_synthetic_pbix(str(tmp_path / 'report.pbix'), N_PAGES,
+        N_VISUALS, N_BOOKMARKS)
+
+
+@pytest.fixture
+def layout_pbix(tmp_path):
+    '''Function to write a synthetic report from a changed layout dict
+
+    The function gets a function that changes the layout dict in place and
+    returns the path of the report.
+    '''
+    def build(change_layout, name:str='custom.pbix') -> str:
+        layout_dict = synthetic_layout(N_PAGES, N_VISUALS, N_BOOKMARKS)
+        change_layout(layout_dict)
+        return write_pbix(str(tmp_path / name), layout_dict, 1024)
+
+    return build
+
+
+def save_and_reload(report:PBIReport, **kwargs) -> PBIReport:
+    '''Save a report next to its file and open the saved report'''
+    file_name = os.path.join(os.path.dirname(report.pbix_path), 
+        f'{report.report_name} saved.pbix')
+    report.save_report(file_name=file_name)
+
+    return PBIReport(file_name, **kwargs)
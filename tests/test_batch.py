@@ -0,0 +1,78 @@
+'''Tests of the batch runner'''
+
+import os
+import shutil
+
+import pytest
+
+from pypbireport import PBIReport, run_batch
+
+from conftest import N_PAGES, N_VISUALS
+
+
+def widen_cards(report:PBIReport) -> int:
+    cards = report.visuals.get_by_type('card')
+    for card in cards:
+        card.width = 400.0
+    return len(cards)
+
+
+def test_batch_output_dir(pbix_path, tmp_path):
+    results = run_batch([pbix_path], widen_cards, 
+        output_dir=str(tmp_path / 'out'), max_workers=1)
+
+    row = results.iloc[0]
+    assert row['status'] == 'ok'
+    assert os.path.exists(row['output_path'])
+    saved = PBIReport(row['output_path'])
+    cards = saved.visuals.get_by_type('card')
+    assert len(cards) == row['result']
+    assert {card.width for card in cards} == {400.0}
+    assert len(saved.visuals) == N_PAGES * N_VISUALS
+
+
+def test_batch_replace_original_path(pbix_path, tmp_path, monkeypatch):
+    work_dir = tmp_path / 'work'
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+
+    results = run_batch([pbix_path], widen_cards, replace_original=True,
+        max_workers=1)
+
+    row = results.iloc[0]
+    assert row['status'] == 'ok'
+    assert row['output_path'] == os.path.abspath(pbix_path)
+    assert os.listdir(work_dir) == []
+    saved = PBIReport(pbix_path)
+    assert {card.width for card in saved.visuals.get_by_type('card')} == {
+        400.0}
+
+
+def test_batch_errors_are_returned(pbix_path, tmp_path):
+    results = run_batch([pbix_path, str(tmp_path / 'missing.pbix')], 
+        widen_cards, output_dir=str(tmp_path / 'out'), max_workers=1)
+
+    assert list(results['status']) == ['ok', 'load error']
+
+
+def test_batch_same_names_in_folders(pbix_path, tmp_path):
+    pbix_paths = []
+    for folder in ('a', 'b'):
+        os.makedirs(tmp_path / 'in' / folder)
+        pbix_paths.append(
+            shutil.copy(pbix_path, str(tmp_path / 'in' / folder / 'x.pbix')))
+
+    results = run_batch(pbix_paths, widen_cards,
+        output_dir=str(tmp_path / 'out'), max_workers=1)
+
+    assert list(results['output_path']) == [
+        str(tmp_path / 'out' / folder / 'x ppr_out.pbix')
+        for folder in ('a', 'b')
+    ]
+    assert all(results['status'] == 'ok')
+
+
+def test_batch_same_report_twice(pbix_path, tmp_path):
+    with pytest.raises(ValueError):
+        run_batch([pbix_path, pbix_path], widen_cards,
+            output_dir=str(tmp_path / 'out'), max_workers=1)
@@ -0,0 +1,93 @@
+'''Tests of references between bookmarks and visuals'''
+
+import json
+
+from pypbireport import PBIReport
+from pypbireport.pbi.pbiindex import bookmark_visual_ids
+
+from conftest import save_and_reload
+
+
+def referenced_ids(report:PBIReport) -> set[str]:
+    '''Ids of visuals referenced by the bookmark dicts of a saved layout'''
+    report.save_changes()
+    config = json.loads(report.layout_pbi_dict['config'])
+    return set().union(
+        *(bookmark_visual_ids(bookmark_dict)
+        for bookmark_dict in config.get('bookmarks', []))
+    )
+
+
+def test_references_both_ways(pbix_path):
+    report = PBIReport(pbix_path)
+    index = report.bookmark_references()
+
+    for bookmark in report.bookmarks:
+        visual_ids = index.visuals_of(bookmark.id)
+        assert visual_ids == {v.id for v in bookmark.target_visuals}
+        for visual_id in visual_ids:
+            assert bookmark.id in [
+                bookmark_dict['name']
+                for bookmark_dict in index.bookmarks_of(visual_id)
+            ]
+
+
+def test_remove_visual_cascade_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.bookmarks[0].target_visuals[0]
+
+    report.remove_visual(visual)
+
+    assert report.bookmark_references().bookmarks_of(visual.id) == []
+    for bookmark in report.bookmarks:
+        assert visual not in bookmark.target_visuals
+    saved = save_and_reload(report)
+    assert saved.visuals[visual.id] is None
+    assert visual.id not in referenced_ids(saved)
+    assert saved.dangling_bookmark_references() == {}
+
+
+def test_remove_visual_without_cascade(pbix_path):
+    report = PBIReport(pbix_path)
+    bookmark = report.bookmarks[0]
+    visual = bookmark.target_visuals[0]
+
+    report.remove_visual(visual, cascade=False)
+    dangling = report.dangling_bookmark_references()
+
+    assert dangling[bookmark.id] == [visual.id]
+    assert report.dangling_bookmark_references(remove=True) == dangling
+    assert report.dangling_bookmark_references() == {}
+    saved = save_and_reload(report)
+    assert visual.id not in referenced_ids(saved)
+
+
+def test_remove_page_cascade(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 1'])
+    page_ids = {
+        json.loads(visual_dict['config'])['name']
+        for visual_dict in report.get_page('Page 0')['visualContainers']
+    }
+    assert page_ids & referenced_ids(report)
+
+    report.remove_page('Page 0')
+
+    saved = save_and_reload(report)
+    assert not page_ids & referenced_ids(saved)
+    assert [page['ordinal'] for page in saved.pages_list] == [0, 1]
+    assert saved.dangling_bookmark_references() == {}
+
+
+def test_remap_visual_ids_round_trip(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+    old_ids = sorted(report.bookmark_references().visual_bookmarks)
+    id_mapping = {old_id: f'new{i:016d}' for i, old_id in enumerate(old_ids)}
+
+    count = report.remap_visual_ids(id_mapping)
+
+    assert count == len(old_ids)
+    saved = save_and_reload(report)
+    assert referenced_ids(saved) == set(id_mapping.values())
+    for new_id in id_mapping.values():
+        assert saved.visuals[new_id] is not None
+    assert saved.dangling_bookmark_references() == {}
@@ -0,0 +1,161 @@
+'''Tests of bookmarks of a report'''
+
+import json
+
+import pytest
+
+from pypbireport import Bookmark, BookmarkGroup, PBIReport, toggle_bookmarks
+from pypbireport.constants import bookmarks
+from pypbireport.constants.structures import BOOKMARK_DICT
+
+from conftest import N_BOOKMARKS, save_and_reload
+
+
+def test_synthetic_bookmarks(pbix_path):
+    report = PBIReport(pbix_path)
+
+    assert len(report.bookmarks) == N_BOOKMARKS
+    for bookmark in report.bookmarks:
+        assert len(bookmark.target_visuals) == 4
+        assert {v.page_name for v in bookmark.target_visuals} == {
+            bookmark.report_section_name}
+        assert bookmark.show_visuals and bookmark.hide_visuals
+
+
+def display_modes(bookmark_dict:dict) -> dict[str, str]:
+    exploration_state = bookmark_dict['explorationState']
+    containers = (
+        exploration_state['sections'][exploration_state['activeSection']]
+        ['visualContainers']
+    )
+    return {
+        visual_id: state['singleVisual']['display']['mode']
+        for visual_id, state in containers.items()
+    }
+
+
+def test_toggle_bookmarks(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 0'][:3]
+
+    group = toggle_bookmarks(visuals, 'Toggle')
+
+    assert len(group.children_list) == 3
+    for visual, bookmark in zip(visuals, group.children_list):
+        modes = display_modes(bookmark.bookmark_dict)
+        assert modes.pop(visual.id) == bookmarks.SHOW
+        assert set(modes.values()) == {bookmarks.HIDE}
+        assert bookmark.bookmark_dict['explorationState']['version'] == (
+            BOOKMARK_DICT['explorationState']['version'])
+
+
+def test_toggle_states_are_not_shared(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 0'][:3]
+    first, second, third = toggle_bookmarks(visuals, 'Toggle').children_list
+
+    # The third visual is hidden by the first bookmark, show it
+    state = (
+        first.bookmark_dict['explorationState']['sections'][visuals[0].page_id]
+        ['visualContainers'][visuals[2].id]
+    )
+    state['singleVisual']['display']['mode'] = bookmarks.SHOW
+
+    assert display_modes(second.bookmark_dict)[visuals[2].id] == bookmarks.HIDE
+    assert display_modes(third.bookmark_dict)[visuals[0].id] == bookmarks.HIDE
+
+
+def test_insert_toggle_bookmarks_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 1'][:4]
+
+    group, navigator = report.insert_toggle_bookmarks(visuals, 'Toggle')
+    saved = save_and_reload(report)
+
+    assert saved.visuals[navigator.id] is not None
+    saved_group = saved.bookmark_groups[group.id]
+    assert [b.id for b in saved_group.children_list] == [
+        b.id for b in group.children_list]
+    for visual, bookmark in zip(visuals, saved_group.children_list):
+        assert [v.id for v in bookmark.show_visuals] == [visual.id]
+
+
+def test_insert_bookmarks_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 2']
+    new_bookmarks = [
+        Bookmark(f'New {i}', show_visuals=visuals[:2],
+            hide_visuals=visuals[2:4])
+        for i in range(5)
+    ]
+
+    report.insert_bookmarks(new_bookmarks)
+    saved = save_and_reload(report)
+
+    assert len(saved.bookmarks) == N_BOOKMARKS + 5
+    for bookmark in new_bookmarks:
+        saved_bookmark = saved.bookmarks[bookmark.id]
+        assert [v.id for v in saved_bookmark.show_visuals] == [
+            v.id for v in visuals[:2]]
+        assert [v.id for v in saved_bookmark.hide_visuals] == [
+            v.id for v in visuals[2:4]]
+
+
+def test_insert_bookmark_tuples_and_groups(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 0']
+    single = Bookmark('Single', show_visuals=visuals[:1],
+        hide_visuals=visuals[1:2])
+    children = [
+        Bookmark(f'Child {i}', show_visuals=visuals[i:i + 1],
+            hide_visuals=visuals[2:3])
+        for i in range(2)
+    ]
+    group = BookmarkGroup('Group', children)
+
+    report.insert_bookmarks([(single.id, single.bookmark_dict), group])
+    with pytest.raises(ValueError):
+        report.insert_bookmark('not a bookmark') # type: ignore
+
+    saved = save_and_reload(report)
+    assert len(saved.bookmarks) == N_BOOKMARKS + 3
+    assert saved.bookmarks[single.id].show_visuals == [
+        saved.visuals[visuals[0].id]]
+    assert [b.id for b in saved.bookmark_groups[group.id].children_list] == [
+        child.id for child in children]
+
+
+def test_report_config_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    config_str = report.layout_pbi_dict['config']
+
+    report.save_changes()
+    assert json.loads(report.layout_pbi_str)['config'] == config_str
+
+    report.report_config['objects'] = {'outspace': []}
+    saved = save_and_reload(report)
+    assert saved.report_config['objects'] == {'outspace': []}
+    assert len(saved.bookmarks) == N_BOOKMARKS
+
+
+def test_group_children_are_listed_once(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.pages_visuals['Page 2'][:3]
+    children = [
+        Bookmark(f'Child {i}', show_visuals=visuals[i:i + 1],
+            hide_visuals=visuals[:i] + visuals[i + 1:])
+        for i in range(3)
+    ]
+    group = BookmarkGroup('Group', children)
+    report.insert_bookmarks([group])
+    saved = save_and_reload(report, pages=['Page 0'])
+
+    saved.load_pages()
+
+    assert len(saved.bookmarks) == N_BOOKMARKS + 3
+    saved_group = saved.bookmark_groups[group.id]
+    for child in saved_group.children_list:
+        assert saved.bookmarks[child.id] is child
+        assert child.target_visuals
+    assert {v.id for v in saved_group.target_visuals} == {
+        v.id for v in group.target_visuals}
@@ -0,0 +1,112 @@
+'''Tests of duplicating pages'''
+
+import json
+
+import pytest
+
+from pypbireport import PBIReport
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+COPIES = ['Copy A', 'Copy B', 'Copy C']
+
+
+def group_first_visuals(layout_dict:dict) -> None:
+    '''Put the second visual of the first page in a group, the first one'''
+    containers = layout_dict['sections'][0]['visualContainers']
+    group_id = json.loads(containers[0]['config'])['name']
+    config = json.loads(containers[1]['config'])
+    config['parentGroupName'] = group_id
+    containers[1]['config'] = json.dumps(config)
+
+
+def page_bookmark_names(report:PBIReport, page_name:str) -> list[str]:
+    return [
+        bookmark.name for bookmark in report.bookmarks
+        if bookmark.report_section_name == page_name
+    ]
+
+
+def test_duplicate_page_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    source_ids = [visual.id for visual in report.pages_visuals['Page 0']]
+    source_bookmarks = page_bookmark_names(report, 'Page 0')
+
+    new_pages = report.duplicate_page('Page 0', COPIES)
+
+    assert [page['displayName'] for page in new_pages] == COPIES
+    saved = save_and_reload(report)
+    ordered = sorted(saved.pages_list, key=lambda page: page['ordinal'])
+    assert [page['displayName'] for page in ordered] == (
+        ['Page 0'] + COPIES + [f'Page {i}' for i in range(1, N_PAGES)])
+    assert [page['ordinal'] for page in ordered] == list(
+        range(N_PAGES + len(COPIES)))
+
+    all_ids = [visual.id for visual in saved.visuals]
+    assert len(all_ids) == len(set(all_ids)) == (
+        (N_PAGES + len(COPIES)) * N_VISUALS)
+    for page_name in COPIES:
+        visuals = saved.pages_visuals[page_name]
+        assert [visual.visual_type for visual in visuals] == [
+            visual.visual_type for visual in saved.pages_visuals['Page 0']]
+        assert not {visual.id for visual in visuals} & set(source_ids)
+
+        # Bookmarks of the copy target its own visuals
+        assert page_bookmark_names(saved, page_name) == [
+            f'{name} ({page_name})' for name in source_bookmarks]
+        for bookmark in saved.bookmarks:
+            if bookmark.report_section_name == page_name:
+                assert bookmark.target_visuals
+                assert {v.page_name for v in bookmark.target_visuals} == {
+                    page_name}
+
+
+def test_duplicate_page_groups(layout_pbix):
+    report = PBIReport(layout_pbix(group_first_visuals))
+
+    new_pages = report.duplicate_page('Page 0', COPIES, copy_bookmarks=False)
+
+    for new_page in new_pages:
+        configs = [
+            json.loads(visual_dict['config'])
+            for visual_dict in new_page['visualContainers']
+        ]
+        assert configs[1]['parentGroupName'] == configs[0]['name']
+    saved = save_and_reload(report)
+    assert len(saved.bookmarks) == len(report.bookmarks)
+    for page_name in COPIES:
+        visuals = saved.pages_visuals[page_name]
+        assert visuals[1].config['parentGroupName'] == visuals[0].id
+
+
+def test_duplicate_page_not_loaded(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 1'])
+
+    report.duplicate_page('Page 0', COPIES[:1])
+    report.load_pages()
+
+    assert len(report.visuals) == (N_PAGES + 1) * N_VISUALS
+    copy_types = [v.visual_type for v in report.pages_visuals['Copy A']]
+    assert copy_types == [
+        v.visual_type for v in report.pages_visuals['Page 0']]
+    saved = save_and_reload(report)
+    assert len(saved.pages_visuals['Copy A']) == N_VISUALS
+
+
+def test_create_duplicate_page(pbix_path):
+    report = PBIReport(pbix_path)
+    n_bookmarks = len(report.bookmarks)
+
+    report.create_duplicate_page('Page 1', 'Copy')
+
+    saved = save_and_reload(report)
+    assert saved.get_page('Copy')['ordinal'] == 2
+    assert len(saved.pages_visuals['Copy']) == N_VISUALS
+    assert len(saved.bookmarks) == n_bookmarks
+
+
+def test_duplicate_missing_page(pbix_path):
+    report = PBIReport(pbix_path)
+
+    with pytest.raises(ValueError):
+        report.duplicate_page('Missing', COPIES)
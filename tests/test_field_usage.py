@@ -0,0 +1,62 @@
+'''Tests of the index of fields used by visuals'''
+
+from pypbireport import PBIReport, create_new_visual
+
+from conftest import N_PAGES, save_and_reload
+
+MEASURE = 'Métricas.Categorica'
+NEW_MEASURE = 'Métricas.Nova'
+
+
+def index_content(report:PBIReport) -> dict:
+    '''Roles by visual id, by field, to compare indexes of two reports'''
+    usage = report.field_usage()
+    return {
+        field: {visual.id: roles for visual, _, roles in usage.usages(field)}
+        for field in usage.fields()
+    }
+
+
+def test_usage_of_measure(pbix_path):
+    report = PBIReport(pbix_path)
+    usage = report.field_usage()
+
+    assert MEASURE in usage
+    assert set(usage.pages(MEASURE)) == {f'Page {i}' for i in range(N_PAGES)}
+    for visual, _, roles in usage.usages(MEASURE):
+        assert roles == ({'Values'} if visual.visual_type == 'card' else {'Y'})
+
+
+def test_index_follows_edits(pbix_path):
+    report = PBIReport(pbix_path)
+    usage = report.field_usage()
+    card, other_card = report.visuals.get_by_type('card')[:2]
+    removed = usage.visuals(MEASURE)[-1]
+    new_card = create_new_visual('card', '', '')
+
+    card.field = NEW_MEASURE
+    report.remove_visual(removed)
+    report.insert_visual_in_page('Page 0', new_card)
+
+    assert [v.id for v in usage.visuals(NEW_MEASURE)] == [card.id]
+    using = {v.id for v in usage.visuals(MEASURE)}
+    assert other_card.id in using
+    assert new_card.id in using
+    assert card.id not in using
+    assert removed.id not in using
+
+    saved = save_and_reload(report)
+    assert index_content(saved) == index_content(report)
+
+
+def test_rebuild(pbix_path):
+    report = PBIReport(pbix_path)
+    card = report.visuals.get_by_type('card')[0]
+    report.field_usage()
+
+    # Changed without telling the index
+    select = card.config['singleVisual']['prototypeQuery']['Select'][0]
+    select['Measure']['Property'] = NEW_MEASURE.split('.')[1]
+    assert card not in report.field_usage().visuals(NEW_MEASURE)
+
+    assert card in report.field_usage(rebuild=True).visuals(NEW_MEASURE)
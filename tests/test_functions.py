@@ -0,0 +1,171 @@
+'''Tests of helper functions'''
+
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+from pypbireport import PBIReport
+from pypbireport.constants.structures import CONTENT_TYPE_XML
+from pypbireport.functions import functions
+from pypbireport.functions.functions import copy_zip_member
+
+
+class Unseekable(io.RawIOBase):
+    '''A stream without tell, zipfile writes data descriptors to it'''
+
+    def __init__(self, buffer:io.BytesIO) -> None:
+        self.buffer = buffer
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, data) -> int:
+        return self.buffer.write(data)
+
+    def tell(self):
+        raise OSError('not seekable')
+
+
+def source_zip(path:str) -> dict[str, bytes]:
+    '''Write a zip with members of each kind and return their content'''
+    members = {
+        'stored': b'stored ' * 100,
+        'deflated': os.urandom(1000) + b'a' * 5000,
+        'empty': b'',
+        'folder/zip64': b'zip64 ' * 100,
+        'descriptor': b'descriptor ' * 100,
+    }
+    with zipfile.ZipFile(path, 'w') as pbix:
+        pbix.writestr('stored', members['stored'], zipfile.ZIP_STORED)
+        pbix.writestr('deflated', members['deflated'], zipfile.ZIP_DEFLATED)
+        pbix.writestr('empty', members['empty'])
+        zinfo = zipfile.ZipInfo('folder/zip64')
+        zinfo.compress_type = zipfile.ZIP_DEFLATED
+        with pbix.open(zinfo, 'w', force_zip64=True) as member:
+            member.write(members['folder/zip64'])
+
+    # Members written to a stream have a data descriptor
+    buffer = io.BytesIO()
+    with zipfile.ZipFile(Unseekable(buffer), 'w') as stream_zip:
+        stream_zip.writestr('descriptor', members['descriptor'],
+            zipfile.ZIP_DEFLATED)
+    with zipfile.ZipFile(io.BytesIO(buffer.getvalue())) as stream_zip, \
+        zipfile.ZipFile(path, 'a') as pbix:
+        zinfo = stream_zip.getinfo('descriptor')
+        assert zinfo.flag_bits & 0x08
+        pbix.writestr(zinfo, stream_zip.read(zinfo))
+
+    return members
+
+
+def copy_all(source_path:str, target_path:str) -> None:
+    with zipfile.ZipFile(source_path) as source, \
+        zipfile.ZipFile(target_path, 'w') as target:
+        for zinfo in source.infolist():
+            copy_zip_member(source, target, zinfo, chunk_size=256)
+
+
+def check_copy(target_path:str, members:dict[str, bytes]) -> None:
+    with zipfile.ZipFile(target_path) as target:
+        assert target.testzip() is None
+        assert target.namelist() == list(members)
+        for name, content in members.items():
+            assert target.read(name) == content
+
+
+def test_copy_raw_members(tmp_path):
+    members = source_zip(str(tmp_path / 'source.zip'))
+    copy_all(str(tmp_path / 'source.zip'), str(tmp_path / 'target.zip'))
+
+    check_copy(str(tmp_path / 'target.zip'), members)
+    with zipfile.ZipFile(str(tmp_path / 'source.zip')) as source, \
+        zipfile.ZipFile(str(tmp_path / 'target.zip')) as target:
+        for zinfo in source.infolist():
+            copied = target.getinfo(zinfo.filename)
+            assert copied.compress_type == zinfo.compress_type
+            assert copied.compress_size == zinfo.compress_size
+            assert copied.CRC == zinfo.CRC
+
+
+def test_copy_without_zipfile_internals(tmp_path, monkeypatch):
+    members = source_zip(str(tmp_path / 'source.zip'))
+    # Like a Python version where they changed
+    monkeypatch.setattr(functions, '_ZIP_WRITE_INTERNALS', 
+        ('_attribute_of_another_version',))
+
+    copy_all(str(tmp_path / 'source.zip'), str(tmp_path / 'target.zip'))
+
+    check_copy(str(tmp_path / 'target.zip'), members)
+
+
+def report_pbix(path:str) -> str:
+    '''Write a report with a page and no visuals'''
+    layout = {
+        'id': 0,
+        'sections': [
+            {
+                'name': 'ReportSection0',
+                'displayName': 'Page 0',
+                'ordinal': 0,
+                'visualContainers': [],
+                'config': '{}',
+                'filters': '[]',
+            }
+        ],
+        'config': json.dumps({'version': '5.43'}),
+    }
+    with zipfile.ZipFile(path, 'w', zipfile.ZIP_DEFLATED) as pbix:
+        pbix.writestr('Version', '1.28'.encode('utf-16-le'))
+        pbix.writestr('DataModel', os.urandom(100_000))
+        pbix.writestr('Report/Layout',
+            json.dumps(layout).encode('utf-16-le'))
+        pbix.writestr('SecurityBindings', b'')
+        pbix.writestr('[Content_Types].xml', CONTENT_TYPE_XML.encode())
+
+    return path
+
+
+@pytest.mark.parametrize('lean', [False, True])
+def test_saved_report_members(tmp_path, lean):
+    pbix_path = report_pbix(str(tmp_path / 'report.pbix'))
+    report = PBIReport(pbix_path, lean=lean)
+    file_name = pbix_path.replace('.pbix', ' saved.pbix')
+    report.save_report(file_name=file_name)
+
+    with zipfile.ZipFile(pbix_path) as original, \
+        zipfile.ZipFile(file_name) as saved:
+        assert saved.testzip() is None
+        assert saved.read('DataModel') == original.read('DataModel')
+        assert saved.getinfo('DataModel').compress_size == (
+            original.getinfo('DataModel').compress_size)
+        assert 'SecurityBindings' not in saved.namelist()
+
+
+def test_save_without_file_name(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    report = PBIReport(report_pbix(str(tmp_path / 'report.pbix')))
+
+    report.save_report(suffix='out')
+
+    assert os.path.exists(f'{report.report_name} out.pbix')
+    assert sorted(os.listdir(tmp_path)) == ['report out.pbix', 'report.pbix']
+
+
+def test_replace_original(tmp_path, monkeypatch):
+    work_dir = tmp_path / 'work'
+    work_dir.mkdir()
+    monkeypatch.chdir(work_dir)
+    pbix_path = report_pbix(str(tmp_path / 'report.pbix'))
+    report = PBIReport(pbix_path)
+    report.report_name = 'report' # as on Windows, without the folder
+
+    report.save_report(replace_original=True)
+
+    assert report.save_path(replace_original=True) == pbix_path
+    assert os.listdir(work_dir) == []
+    with zipfile.ZipFile(pbix_path) as saved:
+        assert saved.testzip() is None
+        assert 'SecurityBindings' not in saved.namelist()
@@ -0,0 +1,54 @@
+'''Tests of inserting and removing visuals'''
+
+import copy
+
+import pytest
+
+from pypbireport import PBIReport, create_new_visual
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+
+def test_insert_visual_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = report.visuals
+    card = create_new_visual('card', '', '')
+    column = create_new_visual('column', '', '')
+
+    report.insert_visual_in_page('Page 1', card)
+    report.insert_visual_in_page('Page 2',
+        (column.id, copy.deepcopy(column.visual)))
+
+    assert report.visuals is visuals # not built again
+    assert report.visuals[card.id] is card
+    assert card.page_id == report.pages_list[1]['name']
+    assert report.pages_visuals['Page 2'][-1].id == column.id
+    saved = save_and_reload(report)
+    assert len(saved.visuals) == N_PAGES * N_VISUALS + 2
+    assert saved.visuals[card.id].page_name == 'Page 1'
+    assert saved.visuals[column.id].visual_type == column.visual_type
+    page_columns = saved.pages_visuals['Page 2'].get_by_type(column.visual_type)
+    assert page_columns[-1].id == column.id
+
+
+def test_remove_visual_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    first, second = report.pages_visuals['Page 0'][:2]
+
+    report.remove_visual(first)
+    report.remove_visual(second.id)
+
+    assert report.visuals[first.id] is None
+    assert second not in report.pages_visuals['Page 0']
+    saved = save_and_reload(report)
+    assert len(saved.visuals) == N_PAGES * N_VISUALS - 2
+    assert len(saved.pages_visuals['Page 0']) == N_VISUALS - 2
+    assert saved.visuals[first.id] is None
+    assert saved.visuals[second.id] is None
+
+
+def test_remove_missing_visual(pbix_path):
+    report = PBIReport(pbix_path)
+
+    with pytest.raises(ValueError):
+        report.remove_visual('missing')
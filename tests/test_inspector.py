@@ -0,0 +1,43 @@
+'''Tests of the read-only inventory of reports'''
+
+import pandas as pd
+import pytest
+
+from pypbireport import PBIInspector, PBIReport
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+
+def test_inspector_matches_report(pbix_path):
+    report = PBIReport(pbix_path)
+    inspector = PBIInspector(pbix_path)
+
+    assert inspector.resume_report_pages() == report.resume_report_pages()
+    pd.testing.assert_frame_equal(inspector.resume_report_visuals(),
+        report.resume_report_visuals())
+    pd.testing.assert_frame_equal(inspector.resume_report_visuals('Page 1'),
+        report.resume_report_visuals('Page 1'))
+    assert len(inspector.resume_report_visuals()) == N_PAGES * N_VISUALS
+
+
+def test_inspector_of_edited_report(pbix_path, tmp_path):
+    report = PBIReport(pbix_path)
+    report.visuals[0].horizontal = 250.0
+    report.duplicate_page('Page 2', ['Copy'])
+    saved = save_and_reload(report)
+
+    inspector = PBIInspector(saved.pbix_path, cache_dir=str(tmp_path))
+    visuals = inspector.resume_report_visuals()
+
+    pd.testing.assert_frame_equal(visuals, saved.resume_report_visuals())
+    assert visuals['position_x'].iloc[0] == 250.0
+    # From the cache
+    pd.testing.assert_frame_equal(
+        PBIInspector(saved.pbix_path,
+            cache_dir=str(tmp_path)).resume_report_visuals('Copy'),
+        saved.resume_report_visuals('Copy'))
+
+
+def test_inspector_missing_page(pbix_path):
+    with pytest.raises(ValueError):
+        PBIInspector(pbix_path).resume_report_visuals('Missing')
@@ -0,0 +1,104 @@
+'''Tests of the on-disk cache of parsed layouts'''
+
+import os
+import pickle
+
+from pypbireport import PBIInspector, PBIReport
+from pypbireport.functions import layoutcache
+from pypbireport.functions.layoutcache import (layout_cache_path,
+    read_layout_cache, write_layout_cache)
+
+from conftest import save_and_reload
+
+
+def visual_values(report:PBIReport) -> list[dict]:
+    return [visual.attr_values() for visual in report.visuals]
+
+
+def test_cached_report_is_the_same(pbix_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first = PBIReport(pbix_path, cache_dir=cache_dir)
+    assert len(os.listdir(cache_dir)) == 1
+
+    cached = PBIReport(pbix_path, cache_dir=cache_dir)
+
+    assert visual_values(cached) == visual_values(first)
+    assert len(cached.bookmarks) == len(first.bookmarks)
+
+
+def test_cached_report_round_trip(pbix_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    PBIReport(pbix_path, cache_dir=cache_dir)
+    report = PBIReport(pbix_path, cache_dir=cache_dir)
+    report.visuals[0].width = 321.0
+
+    saved = save_and_reload(report)
+
+    assert saved.visuals[0].width == 321.0
+    assert visual_values(saved)[1:] == visual_values(report)[1:]
+
+
+def test_signature_is_in_the_key(pbix_path):
+    report = PBIReport(pbix_path)
+    zinfo = report.pbix.getinfo('Report/Layout')
+
+    assert (layout_cache_path('c', zinfo, signature=('a',))
+        != layout_cache_path('c', zinfo, signature=('b',)))
+    assert (layout_cache_path('c', zinfo, kind='inventory')
+        != layout_cache_path('c', zinfo))
+
+
+def test_interpreter_is_in_the_key(pbix_path, monkeypatch):
+    report = PBIReport(pbix_path)
+    zinfo = report.pbix.getinfo('Report/Layout')
+    cache_file = layout_cache_path('c', zinfo)
+
+    monkeypatch.setattr(layoutcache, 'INTERPRETER', ('cpython', (3, 99, 0), 9))
+
+    assert layout_cache_path('c', zinfo) != cache_file
+
+
+def test_broken_cache_is_written_again(pbix_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first = PBIReport(pbix_path, cache_dir=cache_dir)
+    cache_file = os.path.join(cache_dir, os.listdir(cache_dir)[0])
+    with open(cache_file, 'r+b') as f:
+        f.truncate(os.path.getsize(cache_file) // 2)
+    assert read_layout_cache(cache_file) is None
+
+    report = PBIReport(pbix_path, cache_dir=cache_dir)
+
+    assert visual_values(report) == visual_values(first)
+    assert read_layout_cache(cache_file) is not None
+
+
+class Payload():
+    def __reduce__(self):
+        return (os.mkdir, ('pickle_ran',))
+
+
+def test_pickle_is_not_loaded(tmp_path, monkeypatch):
+    monkeypatch.chdir(tmp_path)
+    cache_file = str(tmp_path / 'layout.cache')
+    with open(cache_file, 'wb') as f:
+        pickle.dump(Payload(), f)
+
+    assert read_layout_cache(cache_file) is None
+    assert not os.path.exists('pickle_ran')
+
+
+def test_plain_content(tmp_path):
+    cache_file = str(tmp_path / 'layout.cache')
+    content = ({'a': [1, 2.5, None, True]}, [('x', 'y')])
+    write_layout_cache(cache_file, *content)
+
+    assert read_layout_cache(cache_file) == content
+
+
+def test_inspector_cache(pbix_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    first = PBIInspector(pbix_path, cache_dir=cache_dir).resume_report_visuals()
+
+    cached = PBIInspector(pbix_path, cache_dir=cache_dir)
+
+    assert cached.resume_report_visuals().equals(first)
@@ -0,0 +1,43 @@
+'''Tests of decoding visual JSON strings on first access'''
+
+import json
+
+from pypbireport import PBIReport
+
+from conftest import save_and_reload
+
+
+def test_parts_decoded_on_access(pbix_path):
+    report = PBIReport(pbix_path)
+    card = report.visuals.get_by_type('card')[0]
+
+    # Attributes are read from `config` only
+    assert list(card._dicts) == ['config']
+    assert isinstance(card._visual['query'], str)
+
+    assert not card.is_modified()
+
+    query = card.query
+    assert query == json.loads(card._raw_dicts['query'])
+    assert card._visual['query'] is query
+    # Reading doesn't modify, the string is written back as it was
+    assert not card.is_modified()
+    assert card.serialized_visual()['query'] is card._raw_dicts['query']
+
+
+def test_field_edit_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    card = report.visuals.get_by_type('card')[0]
+    other = report.visuals.get_by_type('card')[1]
+    new_field = card.field.replace('Categorica', 'Nova')
+
+    card.field = new_field
+
+    assert {'config', 'query'} <= card._modified
+    assert not other.is_modified()
+    saved = save_and_reload(report)
+    saved_card = saved.visuals[card.id]
+    assert saved_card.field == new_field
+    query = json.dumps(saved_card.query, ensure_ascii=False)
+    assert new_field.split('.')[1] in query
+    assert saved.visuals[other.id].field == other.field
@@ -0,0 +1,46 @@
+'''Tests of the memory lean mode of reports'''
+
+import json
+
+from pypbireport import PBIReport, create_new_visual
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+
+def test_lean_report_holds_strings(pbix_path):
+    report = PBIReport(pbix_path, lean=True)
+
+    assert report.layout_pbi_str == ''
+    for visual in report.visuals:
+        assert visual.original_visual is None
+        assert visual._dicts == {}
+        assert isinstance(visual._visual['config'], str)
+    assert [v.id for v in report.visuals] == [
+        v.id for v in PBIReport(pbix_path).visuals]
+
+
+def test_lean_round_trip(pbix_path):
+    report = PBIReport(pbix_path, lean=True)
+    visual = report.pages_visuals['Page 1'][2]
+    card = create_new_visual('card', '', '')
+
+    visual.width = 444.0
+    report.insert_visual_in_page('Page 2', card)
+    report.duplicate_page('Page 0', ['Copy'])
+
+    report.save_changes()
+    assert json.loads(report.layout_pbi_str)['sections']
+    saved = save_and_reload(report, lean=True)
+    assert len(saved.visuals) == (N_PAGES + 1) * N_VISUALS + 1
+    assert saved.visuals[visual.id].width == 444.0
+    assert saved.visuals[card.id].page_name == 'Page 2'
+
+
+def test_lean_save_matches_default(pbix_path):
+    lean = PBIReport(pbix_path, lean=True)
+    default = PBIReport(pbix_path)
+    for report in (lean, default):
+        report.visuals[0].horizontal = 99.0
+        report.save_changes()
+
+    assert lean.layout_pbi_str == default.layout_pbi_str
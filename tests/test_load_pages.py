@@ -0,0 +1,62 @@
+'''Tests of loading only some pages of a report'''
+
+from pypbireport import PBIReport, create_new_visual
+
+from conftest import N_VISUALS, save_and_reload
+
+
+def distinct_dicts(report:PBIReport) -> int:
+    return len({id(visual._visual) for visual in report.visuals})
+
+
+def test_load_selected_pages(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+
+    assert len(report.visuals) == N_VISUALS
+    assert list(report.pages_visuals) == ['Page 0']
+
+    report.load_pages(['Page 2'])
+    assert len(report.visuals) == 2 * N_VISUALS
+    assert set(report.pages_visuals) == {'Page 0', 'Page 2'}
+
+
+def test_insert_in_page_not_loaded(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+    card = create_new_visual('card', '', '')
+
+    report.insert_visual_in_page('Page 1', card)
+    report.load_pages(['Page 1'])
+
+    assert len(report.visuals) == 2 * N_VISUALS + 1
+    assert distinct_dicts(report) == len(report.visuals)
+    assert len(report.pages_visuals['Page 1']) == N_VISUALS + 1
+    assert report.pages_visuals['Page 1'][-1] is card
+
+
+def test_unloaded_pages_round_trip(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+    report.visuals[0].horizontal = 555.0
+
+    saved = save_and_reload(report)
+
+    assert len(saved.visuals) == 3 * N_VISUALS
+    assert saved.pages_visuals['Page 0'][0].horizontal == 555.0
+    assert distinct_dicts(saved) == len(saved.visuals)
+
+
+def test_cached_attrs_follow_their_visuals(pbix_path, tmp_path):
+    cache_dir = str(tmp_path / 'cache')
+    PBIReport(pbix_path, cache_dir=cache_dir) # writes the cache
+    original = PBIReport(pbix_path)
+    expected = {
+        visual.id: visual.attr_values() 
+        for visual in original.pages_visuals['Page 2']
+    }
+
+    report = PBIReport(pbix_path, cache_dir=cache_dir, pages=['Page 0'])
+    report.remove_page('Page 1')
+    report.insert_visual_in_page('Page 0', create_new_visual('card', '', ''))
+    report.load_pages()
+
+    for visual in report.pages_visuals['Page 2']:
+        assert visual.attr_values() == expected[visual.id]
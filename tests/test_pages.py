@@ -0,0 +1,79 @@
+'''Tests of looking up, removing and moving pages'''
+
+import pytest
+
+from pypbireport import PBIReport
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+
+def page_order(report:PBIReport) -> list[str]:
+    return [
+        page['displayName']
+        for page in sorted(report.pages_list, key=lambda p: p['ordinal'])
+    ]
+
+
+def test_get_page(pbix_path):
+    report = PBIReport(pbix_path)
+    page_dict = report.pages_list[1]
+
+    assert report.get_page('Page 1') is page_dict
+    assert report.get_page(page_dict['name']) is page_dict
+    assert 'Page 1' in report.page_index
+    with pytest.raises(ValueError):
+        report.get_page('Missing')
+
+
+def test_renamed_page_is_found(pbix_path):
+    report = PBIReport(pbix_path)
+    page_dict = report.get_page('Page 2')
+
+    # Changed without telling the index
+    page_dict['displayName'] = 'Renamed'
+
+    assert report.get_page('Renamed') is page_dict
+    assert report.page_index.get('Page 2') is None
+
+
+def test_miss_keeps_index(pbix_path):
+    report = PBIReport(pbix_path)
+    by_section = report.page_index.by_section
+
+    assert report.page_index.get('Missing') is None
+    assert report.page_index.section('Missing') is None
+    assert report.page_index.pages('Missing') == []
+    assert report.page_index.by_section is by_section
+
+    # Added without telling the index
+    report.pages_list.append({'name': 'added', 'displayName': 'Added'})
+    assert report.get_page('Added') is report.pages_list[-1]
+    assert report.page_index.by_section is not by_section
+
+
+def test_remove_page_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    section_name = report.get_page('Page 1')['name']
+
+    report.remove_page('Page 1')
+
+    assert section_name not in report.page_index
+    assert 'Page 1' not in report.pages_visuals
+    saved = save_and_reload(report)
+    assert page_order(saved) == ['Page 0', 'Page 2']
+    assert [page['ordinal'] for page in saved.pages_list] == [0, 1]
+    assert len(saved.visuals) == (N_PAGES - 1) * N_VISUALS
+    with pytest.raises(ValueError):
+        saved.get_page(section_name)
+
+
+def test_move_page_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+
+    report.move_page('Page 2', 0)
+    report.move_page('Page 0', 99)
+
+    assert page_order(report) == ['Page 2', 'Page 1', 'Page 0']
+    saved = save_and_reload(report)
+    assert page_order(saved) == ['Page 2', 'Page 1', 'Page 0']
+    assert sorted(page['ordinal'] for page in saved.pages_list) == [0, 1, 2]
@@ -0,0 +1,112 @@
+'''Tests of indexing PPRList items by id, page and type'''
+
+import pickle
+
+import pytest
+
+from pypbireport import PBIReport, PPRList
+
+from conftest import N_VISUALS
+
+
+def test_index_follows_list_methods(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = PPRList(report.visuals)
+    first, second = visuals[0], visuals[1]
+    cards = visuals.get_by_type('card')
+
+    del visuals[0]
+    assert visuals[first.id] is None
+    visuals.insert(0, first)
+    assert visuals[first.id] is first
+    visuals.remove(second)
+    assert visuals[second.id] is None
+    assert len(visuals.get_by_page('Page 0')) == N_VISUALS - 1
+    visuals[1] = second
+    assert visuals[second.id] is second
+    assert visuals.get_by_type('card') == cards
+
+
+def test_changed_id_is_found(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.visuals[5]
+    old_id = visual.id
+
+    visual.id = 'changed'
+
+    assert report.visuals['changed'] is visual
+    assert report.visuals[old_id] is None
+
+
+
+def test_pickle(pbix_path):
+    items = PPRList(PBIReport(pbix_path).visuals[:3])
+    ids = [item.id for item in items]
+
+    loaded = pickle.loads(pickle.dumps(items))
+
+    assert [item.id for item in loaded] == ids
+    assert loaded[ids[1]] is loaded[1]
+
+
+def test_copy(pbix_path):
+    report = PBIReport(pbix_path)
+    first = report.visuals[0]
+
+    copied = report.visuals.copy()
+    copied.remove(first)
+
+    assert isinstance(copied, PPRList)
+    assert report.visuals[first.id] is first
+    assert copied[first.id] is None
+
+
+def test_page_and_type_follow_items(pbix_path):
+    report = PBIReport(pbix_path)
+    visuals = PPRList(report.visuals)
+    card = visuals.get_by_type('card')[0]
+    assert card in visuals.get_by_page('Page 0')
+
+    card.page_name = 'Other'
+    object.__setattr__(card, 'visual_type', 'other')
+
+    assert card not in visuals.get_by_page('Page 0')
+    assert visuals.get_by_page('Other') == [card]
+    assert card not in visuals.get_by_type('card')
+    assert visuals.get_by_type('other') == [card]
+
+
+def test_imul(pbix_path):
+    items = PPRList(PBIReport(pbix_path).visuals[:2])
+    first = items[0]
+
+    items *= 2
+    del items[0]
+
+    assert len(items) == 3
+    # Found by the index, not by a scan
+    assert items._index[first.id] is first
+
+
+def test_remove_visual_with_changed_page_name(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.pages_visuals['Page 0'][-1]
+
+    visual.page_name = 'Other'
+    report.remove_visual(visual)
+
+    assert visual not in report.pages_visuals['Page 0']
+    assert report.visuals[visual.id] is None
+    assert len(report.get_page('Page 0')['visualContainers']) == N_VISUALS - 1
+
+
+def test_failed_remove_visual_changes_nothing(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.pages_visuals['Page 0'][-1]
+    report.visuals.remove(visual)
+
+    with pytest.raises(ValueError):
+        report.remove_visual(visual)
+
+    assert visual in report.pages_visuals['Page 0']
+    assert len(report.get_page('Page 0')['visualContainers']) == N_VISUALS
@@ -0,0 +1,114 @@
+'''Tests of renaming a field across the report'''
+
+from pypbireport import PBIReport
+from pypbireport.functions.fields import rename_field_references
+
+from conftest import save_and_reload
+
+OLD = 'Métricas.Categorica'
+NEW = 'Métricas.Renomeada'
+
+
+def all_text(report:PBIReport) -> str:
+    report.save_changes()
+    return report.layout_pbi_str
+
+
+def aggregate_first_card(report:PBIReport) -> PBIReport:
+    '''Make the first card show `Sum` of its field, and reload it'''
+    card = report.visuals.get_by_type('card')[0]
+    config = card.config
+    single_visual = config['singleVisual']
+    single_visual['projections']['Values'][0]['queryRef'] = f'Sum({OLD})'
+    single_visual['prototypeQuery']['Select'][0]['Name'] = f'Sum({OLD})'
+    card.config = config
+
+    return save_and_reload(report)
+
+
+def test_rename_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    cards = report.visuals.get_by_type('card')
+    using = {visual.id for visual in report.field_usage().visuals(OLD)}
+
+    count = report.rename_field(OLD, NEW)
+
+    assert count > 0
+    assert {card.field for card in cards} == {NEW}
+    saved = save_and_reload(report)
+    assert OLD not in all_text(saved)
+    assert {card.field for card in saved.visuals.get_by_type('card')} == {NEW}
+    assert saved.field_usage().visuals(OLD) == []
+    assert {visual.id for visual in saved.field_usage().visuals(NEW)} == using
+
+
+def test_rename_aggregated_attribute(pbix_path):
+    report = aggregate_first_card(PBIReport(pbix_path))
+    card = report.visuals.get_by_type('card')[0]
+    assert card.field == f'Sum({OLD})'
+
+    report.rename_field(OLD, NEW)
+
+    assert card.field == f'Sum({NEW})'
+    saved = save_and_reload(report)
+    assert saved.visuals[card.id].field == f'Sum({NEW})'
+
+
+def test_rename_pages_not_loaded(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+
+    report.rename_field(OLD, NEW)
+    report.load_pages()
+
+    assert OLD not in all_text(report)
+    assert {card.field for card in report.visuals.get_by_type('card')} == {NEW}
+
+
+def amount_select(alias:str, table:str) -> dict:
+    '''Select of `Amount` of a table, with its bare names'''
+    return {
+        'Column': {
+            'Expression': {'SourceRef': {'Source': alias}},
+            'Property': 'Amount'
+        },
+        'Name': f'{table}.Amount',
+        'NativeReferenceName': 'Amount',
+    }
+
+
+def test_rename_field_of_one_table():
+    query = {
+        'From': [
+            {'Name': 's', 'Entity': 'Sales', 'Type': 0},
+            {'Name': 'b', 'Entity': 'Budget', 'Type': 0},
+        ],
+        'Select': [amount_select('s', 'Sales'), amount_select('b', 'Budget')],
+    }
+    data_transforms = {
+        'queryMetadata': {
+            'Select': [
+                {'Restatement': 'Amount', 'Name': f'{table}.Amount'}
+                for table in ('Sales', 'Budget')
+            ]
+        },
+        'selects': [
+            {'displayName': 'Amount', 'queryName': f'{table}.Amount'}
+            for table in ('Sales', 'Budget')
+        ],
+    }
+
+    count = rename_field_references([query, data_transforms],
+        ('Sales', 'Amount'), ('Sales', 'Revenue'))
+
+    sales, budget = query['Select']
+    assert sales['Column']['Property'] == 'Revenue'
+    assert (sales['Name'], sales['NativeReferenceName']) == (
+        'Sales.Revenue', 'Revenue')
+    assert budget == amount_select('b', 'Budget')
+    sales, budget = data_transforms['queryMetadata']['Select']
+    assert sales == {'Restatement': 'Revenue', 'Name': 'Sales.Revenue'}
+    assert budget == {'Restatement': 'Amount', 'Name': 'Budget.Amount'}
+    sales, budget = data_transforms['selects']
+    assert sales == {'displayName': 'Revenue', 'queryName': 'Sales.Revenue'}
+    assert budget == {'displayName': 'Amount', 'queryName': 'Budget.Amount'}
+    assert count == 7
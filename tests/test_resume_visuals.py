@@ -0,0 +1,30 @@
+'''Tests of the dataframe of report visuals'''
+
+from pypbireport import PBIReport
+
+from conftest import N_PAGES, N_VISUALS, save_and_reload
+
+
+def test_resume_follows_loaded_visuals(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 0'])
+    visual = report.visuals[2]
+
+    visual.horizontal = 512.0
+    visual.width = 64.0
+    visuals = report.resume_report_visuals()
+
+    assert len(visuals) == N_PAGES * N_VISUALS
+    row = visuals[visuals['visualid'] == visual.id].iloc[0]
+    assert (row['position_x'], row['width']) == (512.0, 64.0)
+    assert visuals['position_x'].dtype.kind == 'f'
+    saved = save_and_reload(report).resume_report_visuals()
+    assert saved.equals(visuals)
+
+
+def test_resume_of_page(pbix_path):
+    report = PBIReport(pbix_path)
+
+    visuals = report.resume_report_visuals('Page 1')
+
+    assert list(visuals['visualid']) == [
+        visual.id for visual in report.pages_visuals['Page 1']]
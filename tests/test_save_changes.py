@@ -0,0 +1,100 @@
+'''Tests of serializing only the modified visuals'''
+
+import copy
+import json
+import zipfile
+
+from pypbireport import PBIReport
+
+from conftest import save_and_reload
+
+
+def file_containers(pbix_path:str) -> list[dict]:
+    '''Visual containers of all pages, as written in the file'''
+    with zipfile.ZipFile(pbix_path) as pbix:
+        layout = json.loads(pbix.read('Report/Layout').decode('utf-16-le'))
+    return [
+        visual_dict
+        for section in layout['sections']
+        for visual_dict in section['visualContainers']
+    ]
+
+
+def test_unmodified_visuals_keep_their_strings(pbix_path):
+    report = PBIReport(pbix_path)
+    changed = report.visuals[3]
+
+    changed.horizontal = 321.0
+
+    assert changed.is_modified()
+    assert not any(v.is_modified() for v in report.visuals if v is not changed)
+    saved = save_and_reload(report)
+    for original, written in zip(file_containers(pbix_path),
+        file_containers(saved.pbix_path)):
+        if json.loads(original['config'])['name'] != changed.id:
+            assert written == original
+            continue
+        position = json.loads(written['config'])['layouts'][0]['position']
+        assert position['x'] == 321.0
+        assert written['query'] == original['query']
+
+
+def test_save_changes_keeps_objects(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.visuals[0]
+    visual.vertical = 12.0
+    config = visual._get_dict('config')
+
+    report.save_changes()
+
+    # Visual dicts stay decoded, the layout string has the change
+    assert visual._visual['config'] is config
+    written = json.loads(report.layout_pbi_str)
+    config_str = written['sections'][0]['visualContainers'][0]['config']
+    assert json.loads(config_str)['layouts'][0]['position']['y'] == 12.0
+    assert save_and_reload(report).visuals[visual.id].vertical == 12.0
+
+
+def test_mark_modified(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.visuals[-1]
+
+    # Changed through the layout dict, not through the object
+    visual._get_dict('config')['name'] = 'changed'
+    visual.mark_modified('config')
+
+    saved = save_and_reload(report)
+    assert saved.visuals['changed'] is not None
+
+
+def test_reading_dicts_keeps_strings(pbix_path):
+    report = PBIReport(pbix_path)
+
+    for visual in report.visuals:
+        visual.config, visual.query, visual.dataTransforms, visual.filters
+
+    assert not any(visual.is_modified() for visual in report.visuals)
+    saved = save_and_reload(report)
+    assert file_containers(saved.pbix_path) == file_containers(pbix_path)
+
+
+def test_replaced_in_layout_dict(pbix_path):
+    report = PBIReport(pbix_path)
+    container = next(
+        visual_dict
+        for visual_dict in report.get_page('Page 0')['visualContainers']
+        if 'query' in visual_dict
+    )
+    visual = report.visuals[container['config']['name']]
+    config = copy.deepcopy(container['config'])
+    config['name'] = 'replaced'
+    query = json.loads(container['query'])
+    query['replaced'] = True
+
+    container['config'] = json.dumps(config)
+    container['query'] = query
+
+    assert visual.is_modified()
+    assert visual.query is query
+    saved = save_and_reload(report)
+    assert saved.visuals['replaced'].query['replaced'] is True
@@ -0,0 +1,64 @@
+'''Tests of the JSON backends'''
+
+import json
+
+import pytest
+
+from pypbireport import PBIReport
+from pypbireport.functions import serializer
+
+from conftest import save_and_reload
+
+CONTENT = {
+    'big': 123456789012345678901234567890,
+    'negative': -98765432109876543210987,
+    'u64': 18446744073709551615,
+    'below_i64': -9999999999999999999,
+    'text': 'Vendas – ação',
+    'float': 0.1,
+    'nested': [{'a': None, 'b': True}]
+}
+
+
+@pytest.fixture(params=serializer.available_json_backends())
+def backend(request):
+    default_backend = serializer.get_json_backend()
+    serializer.set_json_backend(request.param)
+    yield request.param
+    serializer.set_json_backend(default_backend)
+
+
+def test_round_trip(backend):
+    encoded = serializer.dumps(CONTENT)
+
+    assert serializer.loads(encoded) == CONTENT
+    assert json.loads(encoded) == CONTENT
+
+
+def test_big_integers_stay_exact(backend):
+    decoded = serializer.loads(json.dumps(CONTENT))
+
+    assert decoded['big'] == CONTENT['big']
+    assert isinstance(decoded['big'], int)
+    assert isinstance(decoded['negative'], int)
+    # Alone, not decoded by the standard json for the other values
+    assert serializer.loads('[-9999999999999999999]') == [-9999999999999999999]
+
+
+def test_compact_and_not_ascii(backend):
+    assert serializer.dumps({'a': 'ç', 'b': [1, 2]}) == '{"a":"ç","b":[1,2]}'
+
+
+def test_report_round_trip(backend, pbix_path):
+    report = PBIReport(pbix_path)
+    report.visuals[0].width = 12.5
+
+    saved = save_and_reload(report)
+
+    assert saved.visuals[0].width == 12.5
+    assert [v.id for v in saved.visuals] == [v.id for v in report.visuals]
+
+
+def test_unknown_backend():
+    with pytest.raises(ValueError):
+        serializer.set_json_backend('simplejson')
@@ -0,0 +1,54 @@
+'''Tests of streaming the layout into the report file'''
+
+import zipfile
+
+from pypbireport import PBIReport, create_new_visual
+
+from conftest import save_and_reload
+
+
+def file_layout(pbix_path:str) -> str:
+    with zipfile.ZipFile(pbix_path) as pbix:
+        return pbix.read('Report/Layout').decode('utf-16-le')
+
+
+def edit(report:PBIReport) -> None:
+    report.visuals[1].horizontal = 77.0
+    report.insert_visual_in_page('Page 0', create_new_visual('card', '', ''))
+    report.remove_page('Page 2')
+    report.report_config['stream'] = 'ção'
+
+
+def test_stream_matches_save_changes(pbix_path):
+    report = PBIReport(pbix_path)
+    edit(report)
+
+    streamed = ''.join(report.iter_layout_json())
+    report.save_changes()
+
+    assert streamed == report.layout_pbi_str
+
+
+def test_stream_round_trip(pbix_path):
+    report = PBIReport(pbix_path, pages=['Page 1'])
+    edit(report)
+
+    saved = save_and_reload(report)
+
+    report.save_changes()
+    assert file_layout(saved.pbix_path) == report.layout_pbi_str
+    assert saved.report_config['stream'] == 'ção'
+    assert saved.visuals[report.visuals[1].id].horizontal == 77.0
+
+
+def test_stream_empty_report(layout_pbix):
+    def empty_pages(layout_dict:dict) -> None:
+        for section in layout_dict['sections']:
+            section['visualContainers'] = []
+        layout_dict['config'] = '{}'
+    report = PBIReport(layout_pbix(empty_pages))
+
+    streamed = ''.join(report.iter_layout_json())
+    report.save_changes()
+
+    assert streamed == report.layout_pbi_str
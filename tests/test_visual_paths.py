@@ -0,0 +1,42 @@
+'''Tests of reading and writing visual attributes by JSON path'''
+
+from pypbireport import PBIReport
+
+from conftest import save_and_reload
+
+
+def test_attribute_sets_all_paths(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.visuals[4]
+
+    visual.horizontal = 640.0
+    visual.height = 90.0
+
+    position = visual.config['layouts'][0]['position']
+    assert (position['x'], visual.visual['x']) == (640.0, 640.0)
+    assert (position['height'], visual.visual['height']) == (90.0, 90.0)
+    saved = save_and_reload(report).visuals[visual.id]
+    assert (saved.horizontal, saved.height) == (640.0, 90.0)
+    assert saved.visual['x'] == 640.0
+
+
+def test_update_values_round_trip(pbix_path):
+    report = PBIReport(pbix_path)
+    visual = report.visuals[0]
+
+    count = visual.update_values(
+        {
+            'config.layouts.[0].position.x': 10.0,
+            'config.layouts.[0].position.y': 20.0,
+            'config.layouts.[0].position.z': 3000,
+            'tabOrder': 7,
+            'config.missing.path': 'ignored',
+        }
+    )
+
+    assert count == 4
+    assert 'missing' not in visual.config
+    saved = save_and_reload(report).visuals[visual.id]
+    assert (saved.horizontal, saved.vertical) == (10.0, 20.0)
+    assert saved.tab_order == 7
+    assert saved.config['layouts'][0]['position']['z'] == 3000
@@ -0,0 +1,39 @@
+'''Tests of building the proper class for each visual type'''
+
+import copy
+
+from pypbireport import PBIReport, VisualInitializer
+from pypbireport.pbi.pbivisual import BookmarkSlicer, Card, Slicer, Visual
+
+from conftest import save_and_reload
+
+CLASSES = {
+    'card': Card,
+    'slicer': Slicer,
+    'bookmarkNavigator': BookmarkSlicer,
+    'clusteredColumnChart': Visual, # not `columnChart`
+}
+
+
+def test_classes_by_type(pbix_path):
+    report = PBIReport(pbix_path)
+
+    for visual in report.visuals:
+        assert type(visual) is CLASSES[visual.visual_type]
+
+
+def test_visual_object_is_rebuilt(pbix_path):
+    report = PBIReport(pbix_path)
+    card = next(v for v in report.visuals if v.visual_type == 'card')
+    generic = Visual(copy.deepcopy(card.visual))
+    generic.id = 'rebuilt'
+    generic.horizontal = 5.0
+
+    rebuilt = VisualInitializer(generic)
+
+    assert type(rebuilt) is Card
+    assert rebuilt.horizontal == 5.0
+    report.insert_visual_in_page('Page 1', rebuilt)
+    saved = save_and_reload(report)
+    assert type(saved.visuals['rebuilt']) is Card
+    assert saved.visuals['rebuilt'].page_name == 'Page 1'